@@ -14,6 +14,7 @@
 
 from holidays.constants import *
 from holidays.deprecations.v1_incompatibility import *
+from holidays.frozen_holidays import *
 from holidays.holiday_base import *
 from holidays.registry import EntityLoader
 from holidays.utils import *
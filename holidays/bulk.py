@@ -0,0 +1,219 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+__all__ = ("HolidayRecord", "PackedHolidays", "generate")
+
+from array import array
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from itertools import chain
+from typing import Any, NamedTuple, Optional, Union
+
+from holidays.constants import HOLIDAY_NAME_DELIMITER
+from holidays.helpers import _normalize_arguments
+from holidays.holiday_base import CategoryArg, HolidayBase, YearArg, _pack_holidays
+from holidays.registry import COUNTRIES, FINANCIAL, EntityLoader
+
+# The number of years generated by a single task.
+YEARS_CHUNK_SIZE = 25
+
+
+class HolidayRecord(NamedTuple):
+    """A single date holidays record."""
+
+    entity: str
+    """The country or market code."""
+    subdiv: Optional[str]
+    """The subdivision code, None for the entity-wide holidays."""
+    date: date
+    """The holidays date."""
+    names: tuple[str, ...]
+    """The holiday names."""
+
+
+class PackedHolidays(NamedTuple):
+    """Holidays of an entity (subdivision) for a range of years packed into
+    arrays."""
+
+    entity: str
+    """The country or market code."""
+    subdiv: Optional[str]
+    """The subdivision code, None for the entity-wide holidays."""
+    ordinals: array
+    """The sorted holiday date ordinals (see :meth:`datetime.date.toordinal`)."""
+    name_ids: array
+    """The holiday name indices in the :attr:`names` table."""
+    names: tuple[str, ...]
+    """The holiday names table."""
+
+    def records(self) -> Iterator[HolidayRecord]:
+        """Return the holidays records."""
+        names = tuple(
+            tuple(name for name in names.split(HOLIDAY_NAME_DELIMITER) if name)
+            for names in self.names
+        )
+        for ordinal, name_id in zip(self.ordinals, self.name_ids):
+            yield HolidayRecord(
+                self.entity, self.subdiv, date.fromordinal(ordinal), names[name_id]
+            )
+
+
+_Task = tuple[str, Union[str, tuple[Optional[str], ...], None], tuple[int, ...], dict[str, Any]]
+
+
+def _get_entity_path(entity: str) -> str:
+    """Return the entity class path (w/o importing it)."""
+    for prefix, registry in (("countries", COUNTRIES), ("financial", FINANCIAL)):
+        for module, entities in registry.items():
+            if entity in entities[1:]:
+                return f"holidays.{prefix}.{module}.{entities[0]}"
+
+    raise NotImplementedError(f"Entity {entity} not available")
+
+
+def _generate_holidays(task: _Task) -> list[PackedHolidays]:
+    """Generate an entity holidays for a chunk of years (a worker task)."""
+    path, subdivs, years, kwargs = task
+    entity_cls = EntityLoader(path).get_entity()
+    if kwargs.get("categories") == "all":
+        kwargs = {**kwargs, "categories": entity_cls.supported_categories}  # type: ignore[union-attr]
+
+    if subdivs == "all":
+        subdivs = (None, *entity_cls.subdivisions)  # type: ignore[union-attr]
+    elif subdivs is None:
+        subdivs = (None,)
+
+    entity_holidays: dict[Optional[str], HolidayBase] = {}
+    if None in subdivs:
+        entity_holidays[None] = entity_cls(years=years, **kwargs)  # type: ignore[misc,operator]
+    if subdivisions := [subdiv for subdiv in subdivs if subdiv is not None]:
+        entity_holidays.update(
+            entity_cls.get_subdivisions_holidays(  # type: ignore[union-attr]
+                subdivs=subdivisions, years=years, **kwargs
+            )
+        )
+
+    return [
+        PackedHolidays(holidays._entity_code, subdiv, *_pack_holidays(sorted(holidays.items())))
+        for subdiv, holidays in entity_holidays.items()
+    ]
+
+
+def generate(
+    entities: Optional[Union[str, Iterable[str]]] = None,
+    subdivs: Optional[Union[str, Iterable[Optional[str]]]] = "all",
+    years: Optional[YearArg] = None,
+    categories: Optional[CategoryArg] = None,
+    language: Optional[str] = None,
+    observed: bool = True,
+    packed: bool = False,
+    max_workers: Optional[int] = None,
+) -> Iterator[Union[HolidayRecord, PackedHolidays]]:
+    """
+    Generate holidays for multiple entities, their subdivisions and years in
+    parallel.
+
+    The work is split into per entity and :data:`YEARS_CHUNK_SIZE` years
+    tasks executed by a process pool, the tasks refer to the entity classes
+    by their registry paths. The results are streamed in the entities, years
+    chunks and subdivisions order.
+
+    :param entities:
+        The country (ISO 3166-1 alpha-2) and/or market (ISO 10383 MIC) codes.
+        All supported countries and markets are used by default.
+
+    :param subdivs:
+        The subdivisions to generate holidays for: ``'all'`` for the
+        entity-wide holidays and all the entity subdivisions, None for the
+        entity-wide holidays only, or an iterable of subdivision codes (None
+        item stands for the entity-wide holidays).
+
+    :param years:
+        The year(s) to generate holidays for.
+
+    :param categories:
+        Requested holiday categories, ``'all'`` for all categories supported
+        by the entity.
+
+    :param language:
+        The language which the holiday names will be translated into.
+
+    :param observed:
+        Whether to include the dates of when public holiday are observed.
+
+    :param packed:
+        Whether to return :class:`PackedHolidays` per entity, subdivision
+        and years chunk instead of :class:`HolidayRecord` per date.
+
+    :param max_workers:
+        The maximum number of worker processes (the number of processors by
+        default). If 1, the tasks are executed in the current process.
+
+    :return:
+        An iterator of holidays records or packed holidays.
+
+    Example usage:
+
+    >>> from datetime import date
+    >>> from holidays.bulk import generate
+    >>> for record in generate('US', subdivs=('CA',), years=2024, max_workers=1):
+    ...     if record.date == date(2024, 3, 31):
+    ...         print(record)
+    HolidayRecord(entity='US', subdiv='CA', date=datetime.date(2024, 3, 31), names=('Cesar Chavez Day',))
+    """  # noqa: E501
+    if entities is None:
+        entities = chain(
+            EntityLoader.get_country_codes(include_aliases=False),
+            EntityLoader.get_financial_codes(include_aliases=False),
+        )
+    elif isinstance(entities, str):
+        entities = (entities,)
+    if not (years_to_generate := sorted(_normalize_arguments(int, years))):
+        raise ValueError("Years must be specified for bulk generation.")
+    if isinstance(subdivs, Iterable) and not isinstance(subdivs, str):
+        subdivs = tuple(subdivs)
+
+    kwargs = {"categories": categories, "language": language, "observed": observed}
+    tasks: list[_Task] = [
+        (path, subdivs, tuple(years_to_generate[idx : idx + YEARS_CHUNK_SIZE]), kwargs)
+        for path in dict.fromkeys(map(_get_entity_path, entities))
+        for idx in range(0, len(years_to_generate), YEARS_CHUNK_SIZE)
+    ]
+
+    return _run_tasks(tasks, packed, max_workers)
+
+
+def _run_tasks(
+    tasks: list[_Task], packed: bool, max_workers: Optional[int]
+) -> Iterator[Union[HolidayRecord, PackedHolidays]]:
+    """Execute the tasks and stream their results in the requested format."""
+    if max_workers == 1:
+        yield from _get_results(map(_generate_holidays, tasks), packed)
+        return None
+
+    executor = ProcessPoolExecutor(max_workers)
+    try:
+        yield from _get_results(executor.map(_generate_holidays, tasks), packed)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _get_results(
+    results: Iterator[list[PackedHolidays]], packed: bool
+) -> Iterator[Union[HolidayRecord, PackedHolidays]]:
+    """Return the tasks results in the requested format."""
+    for packed_holidays in chain.from_iterable(results):
+        if packed:
+            yield packed_holidays
+        else:
+            yield from packed_holidays.records()
@@ -0,0 +1,413 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+"""Business days arithmetic over one or more holiday calendars.
+
+The working days of the loaded years are precomputed into a joint bitmap
+(a day is a working day if it's a working day on all the calendars), the
+cumulative working days counts and the working days list, so the counts and
+offsets take constant time regardless of the number of calendars and days.
+
+The non-business days roll conventions are supported as well: the next and
+previous business days of a day are looked up by its loaded business days
+rank, so each roll is a constant time operation too.
+
+Both scalar (:data:`holidays.holiday_base.DateLike`) and array (iterables of
+dates or NumPy ``datetime64`` arrays) inputs are supported. NumPy is not
+required unless NumPy arrays are used.
+"""
+
+__all__ = (
+    "END_OF_MONTH",
+    "FOLLOWING",
+    "MODIFIED_FOLLOWING",
+    "MODIFIED_PRECEDING",
+    "PRECEDING",
+    "BusinessCalendar",
+)
+
+import sys
+from array import array
+from calendar import monthrange
+from collections.abc import Iterable
+from datetime import MAXYEAR, MINYEAR, date
+from typing import Any, Union
+
+from holidays.holiday_base import DateLike, HolidayBase, _to_date
+
+# The business day roll conventions.
+FOLLOWING = "following"  # The first business day on or after the date.
+# The following business day unless it's in the next month, the preceding one otherwise.
+MODIFIED_FOLLOWING = "modified_following"
+PRECEDING = "preceding"  # The last business day on or before the date.
+# The preceding business day unless it's in the previous month, the following one otherwise.
+MODIFIED_PRECEDING = "modified_preceding"
+END_OF_MONTH = "end_of_month"  # The last business day of the date month.
+
+ROLL_CONVENTIONS = {END_OF_MONTH, FOLLOWING, MODIFIED_FOLLOWING, MODIFIED_PRECEDING, PRECEDING}
+
+# The `datetime64[D]` epoch (1970-01-01) ordinal.
+EPOCH_ORDINAL = 719163
+
+# The maximum number of the loaded years range extensions for an offset.
+MAX_LOAD_ATTEMPTS = 10
+
+Dates = Union[Iterable[DateLike], Any]  # Any stands for `numpy.ndarray`.
+
+
+def _is_numpy_array(value: Any) -> bool:
+    """Return True if the value is a NumPy array (w/o importing NumPy)."""
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+
+def _to_ordinals(dates: Any) -> Any:
+    """Convert a NumPy ``datetime64`` array to a day ordinals array."""
+    return dates.astype("datetime64[D]").astype("int64") + EPOCH_ORDINAL
+
+
+def _from_ordinals(ordinals: Any) -> Any:
+    """Convert a NumPy day ordinals array to a ``datetime64[D]`` array."""
+    return (ordinals - EPOCH_ORDINAL).astype("datetime64[D]")
+
+
+class BusinessCalendar:
+    """A joint business days calendar of one or more holiday calendars.
+
+    A day is a business day if it's a working day (see
+    :meth:`holidays.holiday_base.HolidayBase.is_working_day`) on all the
+    calendars, e.g., the settlement day of a cross-listed trade.
+
+    The years are loaded on demand. The calendars holidays are read on the
+    year load, the later changes of the calendars are not reflected.
+
+    Example usage:
+
+    >>> from holidays import country_holidays, financial_holidays
+    >>> from holidays.business_days import BusinessCalendar
+    >>> calendar = BusinessCalendar(
+    ...     financial_holidays('NYSE'), financial_holidays('ECB'), country_holidays('GB')
+    ... )
+    >>> calendar.get_nth_working_day('2024-12-23', 2)  # T+2.
+    datetime.date(2024, 12, 27)
+    """
+
+    def __init__(self, *holidays: HolidayBase) -> None:
+        """
+        :param holidays:
+            The holiday calendars.
+        """
+        if not holidays:
+            raise ValueError("At least one holidays calendar is required.")
+
+        self.holidays = holidays
+
+        # The first loaded day ordinal and the loaded years.
+        self._first = 0
+        self._years = range(0)
+        # The loaded days business days flags.
+        self._bitmap = b""
+        # The number of business days before each loaded day (and the total).
+        self._cumulative = array("q", (0,))
+        # The loaded business days ordinals.
+        self._working_days = array("q")
+
+    def _get_bitmap(self, year: int) -> bytes:
+        """Return a year joint business days bitmap."""
+        bitmaps = [holidays._get_working_days_bitmap(year) for holidays in self.holidays]
+        if len(bitmaps) == 1:
+            return bitmaps[0]
+
+        bitmap = int.from_bytes(bitmaps[0], "little")
+        for other in bitmaps[1:]:
+            bitmap &= int.from_bytes(other, "little")
+
+        return bitmap.to_bytes(len(bitmaps[0]), "little")
+
+    def _load_years(self, start: int, end: int) -> None:
+        """Make sure the [start, end] years are loaded."""
+        if self._years:
+            if self._years.start <= start and end < self._years.stop:
+                return None
+            start = min(start, self._years.start)
+            end = max(end, self._years.stop - 1)
+
+        # Reuse the loaded (contiguous) years bitmap.
+        loaded = self._years or range(end + 1, end + 1)
+        bitmap = bytearray()
+        for year in range(start, loaded.start):
+            bitmap.extend(self._get_bitmap(year))
+        bitmap.extend(self._bitmap)
+        for year in range(loaded.stop, end + 1):
+            bitmap.extend(self._get_bitmap(year))
+
+        first = date(start, 1, 1).toordinal()
+        cumulative = array("q", (0,))
+        working_days = array("q")
+        count = 0
+        for idx, is_working_day in enumerate(bitmap):
+            if is_working_day:
+                count += 1
+                working_days.append(first + idx)
+            cumulative.append(count)
+
+        self._bitmap = bytes(bitmap)
+        self._cumulative = cumulative
+        self._working_days = working_days
+        self._first = first
+        self._years = range(start, end + 1)
+
+    def _get_nth(self, ordinal: int, n: int) -> int:
+        """Return the n-th business day ordinal from a day ordinal (n != 0),
+        loading more years if needed."""
+        year = date.fromordinal(ordinal).year
+        # At least one business day per week is expected.
+        margin = abs(n) * 7 // 365 + 1
+        for _ in range(MAX_LOAD_ATTEMPTS):
+            self._load_years(
+                max(year - (margin if n < 0 else 0), MINYEAR),
+                min(year + (margin if n > 0 else 0), MAXYEAR),
+            )
+            idx = ordinal - self._first
+            # The business days up to the day (before the day if n is negative).
+            target = self._cumulative[idx + 1] + n - 1 if n > 0 else self._cumulative[idx] + n
+            if 0 <= target < len(self._working_days):
+                return self._working_days[target]
+            margin *= 2
+
+        raise ValueError(f"No {n} business days found from {date.fromordinal(ordinal)}.")
+
+    def _count(self, start: int, end: int) -> int:
+        """Return the number of business days in the [start, end) ordinals
+        range (negative if the end is before the start)."""
+        low, high = min(start, end), max(start, end)
+        low_year = date.fromordinal(low).year
+        self._load_years(low_year, max(low_year, date.fromordinal(high - 1).year))
+
+        return self._cumulative[end - self._first] - self._cumulative[start - self._first]
+
+    def _count_array(self, starts: Any, ends: Any) -> Any:
+        """Return the numbers of business days in the [start, end) NumPy
+        ordinals arrays ranges (negative if the end is before the start)."""
+        import numpy as np
+
+        if starts.size and ends.size:
+            low = int(min(starts.min(), ends.min()))
+            high = int(max(starts.max(), ends.max()))
+            low_year = date.fromordinal(low).year
+            self._load_years(low_year, max(low_year, date.fromordinal(high - 1).year))
+
+        cumulative = np.frombuffer(self._cumulative, dtype=np.int64)
+
+        return cumulative[ends - self._first] - cumulative[starts - self._first]
+
+    def is_working_day(self, key: DateLike) -> bool:
+        """Return True if the date is a business day on all the calendars.
+
+        :param key:
+            The date expressed in one of the :data:`DateLike` types.
+        """
+        dt = _to_date(key)
+        self._load_years(dt.year, dt.year)
+
+        return bool(self._bitmap[dt.toordinal() - self._first])
+
+    def get_nth_working_day(self, key: DateLike, n: int) -> date:
+        """Return the n-th business day from the date (if n is positive) or
+        the n-th business day before the date (if n is negative), e.g., the
+        T+n settlement date.
+
+        :param key:
+            The date expressed in one of the :data:`DateLike` types.
+
+        :param n:
+            The number of business days.
+        """
+        dt = _to_date(key)
+        if n == 0:
+            return dt
+
+        return date.fromordinal(self._get_nth(dt.toordinal(), n))
+
+    def get_nth_working_days(self, keys: Dates, n: int) -> Union[list[date], Any]:
+        """Return the n-th business days from (before if n is negative)
+        multiple dates, e.g., the T+n settlement dates of trades.
+
+        :param keys:
+            The dates: an iterable of :data:`DateLike` values or a NumPy
+            ``datetime64`` array.
+
+        :param n:
+            The number of business days.
+
+        :return:
+            The list of dates or the ``datetime64[D]`` array for NumPy
+            array input.
+        """
+        if not _is_numpy_array(keys):
+            return [self.get_nth_working_day(key, n) for key in keys]
+
+        import numpy as np
+
+        ordinals = _to_ordinals(keys)
+        if ordinals.size == 0 or n == 0:
+            return _from_ordinals(ordinals)
+
+        # Load the years range covering the extreme dates results.
+        self._get_nth(int(ordinals.min()), n)
+        self._get_nth(int(ordinals.max()), n)
+
+        cumulative = np.frombuffer(self._cumulative, dtype=np.int64)
+        working_days = np.frombuffer(self._working_days, dtype=np.int64)
+        indices = ordinals - self._first
+        targets = cumulative[indices + 1] + n - 1 if n > 0 else cumulative[indices] + n
+
+        return _from_ordinals(working_days[targets])
+
+    def roll(self, key: DateLike, convention: str = FOLLOWING) -> date:
+        """Roll a date to a business day according to the convention.
+
+        :param key:
+            The date expressed in one of the :data:`DateLike` types.
+
+        :param convention:
+            The roll convention: :data:`FOLLOWING`, :data:`MODIFIED_FOLLOWING`,
+            :data:`PRECEDING`, :data:`MODIFIED_PRECEDING` or
+            :data:`END_OF_MONTH`.
+
+        :return:
+            The business day.
+        """
+        if convention not in ROLL_CONVENTIONS:
+            raise ValueError(f"Unknown roll convention: {convention}.")
+
+        dt = _to_date(key)
+        if convention == END_OF_MONTH:
+            dt = dt.replace(day=monthrange(dt.year, dt.month)[1])
+            convention = PRECEDING
+
+        ordinal = dt.toordinal()
+        if convention in {FOLLOWING, MODIFIED_FOLLOWING}:
+            rolled = date.fromordinal(self._get_nth(ordinal - 1, +1))
+            if convention == MODIFIED_FOLLOWING and rolled.month != dt.month:
+                rolled = date.fromordinal(self._get_nth(ordinal + 1, -1))
+        else:
+            rolled = date.fromordinal(self._get_nth(ordinal + 1, -1))
+            if convention == MODIFIED_PRECEDING and rolled.month != dt.month:
+                rolled = date.fromordinal(self._get_nth(ordinal - 1, +1))
+
+        return rolled
+
+    def roll_dates(self, keys: Dates, convention: str = FOLLOWING) -> Union[list[date], Any]:
+        """Roll multiple dates to business days according to the convention,
+        e.g., a payment schedule.
+
+        :param keys:
+            The dates: an iterable of :data:`DateLike` values or a NumPy
+            ``datetime64`` array.
+
+        :param convention:
+            The roll convention, see :meth:`roll`.
+
+        :return:
+            The list of dates or the ``datetime64[D]`` array for NumPy
+            array input.
+        """
+        if not _is_numpy_array(keys):
+            return [self.roll(key, convention) for key in keys]
+
+        if convention not in ROLL_CONVENTIONS:
+            raise ValueError(f"Unknown roll convention: {convention}.")
+
+        import numpy as np
+
+        ordinals = _to_ordinals(keys)
+        if ordinals.size == 0:
+            return _from_ordinals(ordinals)
+
+        months = _from_ordinals(ordinals).astype("datetime64[M]")
+        if convention == END_OF_MONTH:
+            ordinals = _to_ordinals((months + 1).astype("datetime64[D]")) - 1
+            convention = PRECEDING
+
+        # Load the years range covering the extreme dates results.
+        self._get_nth(int(ordinals.min()) + 1, -1)
+        self._get_nth(int(ordinals.max()) - 1, +1)
+
+        cumulative = np.frombuffer(self._cumulative, dtype=np.int64)
+        working_days = np.frombuffer(self._working_days, dtype=np.int64)
+        indices = ordinals - self._first
+        following = working_days[cumulative[indices]]
+        preceding = working_days[cumulative[indices + 1] - 1]
+
+        if convention == FOLLOWING:
+            rolled = following
+        elif convention == PRECEDING:
+            rolled = preceding
+        elif convention == MODIFIED_FOLLOWING:
+            rolled = np.where(
+                _from_ordinals(following).astype("datetime64[M]") == months, following, preceding
+            )
+        else:
+            rolled = np.where(
+                _from_ordinals(preceding).astype("datetime64[M]") == months, preceding, following
+            )
+
+        return _from_ordinals(rolled)
+
+    def get_working_days_count(self, start: DateLike, end: DateLike) -> int:
+        """Return the number of business days between two dates.
+
+        The date range works in a closed interval fashion [start, end] so both
+        endpoints are included.
+
+        :param start:
+            The range start date.
+
+        :param end:
+            The range end date.
+        """
+        dt1 = _to_date(start)
+        dt2 = _to_date(end)
+        if dt1 > dt2:
+            dt1, dt2 = dt2, dt1
+
+        return self._count(dt1.toordinal(), dt2.toordinal() + 1)
+
+    def get_working_days_counts(self, starts: Dates, ends: Dates) -> Union[list[int], Any]:
+        """Return the numbers of business days between multiple pairs of dates.
+
+        The date ranges work in a closed interval fashion [start, end] so both
+        endpoints are included.
+
+        :param starts:
+            The range start dates: an iterable of :data:`DateLike` values or a
+            NumPy ``datetime64`` array.
+
+        :param ends:
+            The range end dates (of the same type and length as the start
+            dates).
+
+        :return:
+            The list of counts or the ``int64`` array for NumPy arrays input.
+        """
+        if not _is_numpy_array(starts):
+            return [self.get_working_days_count(start, end) for start, end in zip(starts, ends)]
+
+        import numpy as np
+
+        start_ordinals = _to_ordinals(starts)
+        end_ordinals = _to_ordinals(ends)
+
+        return self._count_array(
+            np.minimum(start_ordinals, end_ordinals), np.maximum(start_ordinals, end_ordinals) + 1
+        )
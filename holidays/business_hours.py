@@ -0,0 +1,261 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+"""Business hours arithmetic (e.g., support SLAs) over holiday calendars.
+
+The working hours of each business day are defined by a template (e.g., 09:00
+to 17:00). The business seconds capacities of the loaded days are precomputed
+into the cumulative capacities, so a business hours duration is a difference
+of two cumulative capacities and a deadline is a binary search over them
+regardless of how far apart the endpoints are.
+"""
+
+__all__ = ("BusinessHours",)
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Mapping
+from datetime import MAXYEAR, MINYEAR, date, datetime, time, timedelta
+from typing import Union
+
+from dateutil.parser import parse
+
+from holidays.business_days import MAX_LOAD_ATTEMPTS, BusinessCalendar
+from holidays.holiday_base import HolidayBase
+
+DatetimeLike = Union[datetime, date, str]
+TimeLike = Union[time, str]
+Interval = tuple[TimeLike, TimeLike]
+WorkingHours = Union[Interval, Iterable[Interval], Mapping[int, Iterable[Interval]]]
+
+SECONDS_PER_DAY = 86400
+
+
+def _to_datetime(value: DatetimeLike) -> datetime:
+    """Convert a :data:`DatetimeLike` value to a naive datetime (the time
+    zone aware values are used as is in their local time)."""
+    if isinstance(value, str):
+        return parse(value).replace(tzinfo=None)
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+
+    return datetime(value.year, value.month, value.day)
+
+
+def _to_seconds(value: TimeLike) -> int:
+    """Convert a time (or ``HH:MM[:SS]`` string, ``24:00`` for the day end)
+    to the number of seconds since midnight."""
+    if isinstance(value, str):
+        parts = [int(part) for part in value.split(":")]
+        if not 2 <= len(parts) <= 3:
+            raise ValueError(f"Cannot parse time from '{value}'.")
+        seconds = parts[0] * 3600 + parts[1] * 60 + (parts[2] if len(parts) == 3 else 0)
+        if not 0 <= seconds <= SECONDS_PER_DAY:
+            raise ValueError(f"Time is out of range: '{value}'.")
+        return seconds
+
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def _normalize_intervals(intervals: Iterable[Interval]) -> tuple[tuple[int, int], ...]:
+    """Return the sorted (start, end) seconds of working hours intervals."""
+    normalized = sorted((_to_seconds(start), _to_seconds(end)) for start, end in intervals)
+    previous_end = 0
+    for start, end in normalized:
+        if start >= end:
+            raise ValueError("The working hours interval end must be after its start.")
+        if start < previous_end:
+            raise ValueError("The working hours intervals must not overlap.")
+        previous_end = end
+
+    return tuple(normalized)
+
+
+class BusinessHours:
+    """A business hours calculator over a business days calendar.
+
+    The business days are the working days of the calendar (see
+    :class:`holidays.business_days.BusinessCalendar`), their working hours
+    are defined by the template. The weekend working days (e.g., China's
+    make-up working days) are business days too.
+
+    The years are loaded on demand. The calendars holidays are read on the
+    year load, the later changes of the calendars are not reflected.
+
+    Example usage:
+
+    >>> from holidays import country_holidays
+    >>> from holidays.business_hours import BusinessHours
+    >>> business_hours = BusinessHours(country_holidays('US'), ('09:00', '17:00'))
+    >>> business_hours.get_duration('2024-12-24 15:00', '2024-12-26 10:00')
+    datetime.timedelta(seconds=10800)
+    >>> business_hours.get_deadline('2024-12-24 15:00', 16)
+    datetime.datetime(2024, 12, 27, 15, 0)
+    """
+
+    def __init__(
+        self,
+        holidays: Union[HolidayBase, BusinessCalendar],
+        hours: WorkingHours = ("09:00", "17:00"),
+    ) -> None:
+        """
+        :param holidays:
+            The business days calendar (or the holidays it's made of).
+
+        :param hours:
+            The working hours template: a ``(start, end)`` interval (or an
+            iterable of them, e.g., with a lunch break) of every business
+            day, or a weekday to intervals mapping (the business days of the
+            weekdays not in the mapping have no working hours). The times are
+            :class:`datetime.time` objects or ``HH:MM[:SS]`` strings
+            (``24:00`` stands for the day end).
+        """
+        self.calendar = (
+            BusinessCalendar(holidays) if isinstance(holidays, HolidayBase) else holidays
+        )
+
+        if isinstance(hours, Mapping):
+            weekday_intervals = {
+                weekday: _normalize_intervals(hours.get(weekday, ())) for weekday in range(7)
+            }
+        else:
+            hours = tuple(hours)  # type: ignore[arg-type]
+            intervals = _normalize_intervals(
+                (hours,) if len(hours) == 2 and isinstance(hours[0], (str, time)) else hours
+            )
+            weekday_intervals = dict.fromkeys(range(7), intervals)
+        if not any(weekday_intervals.values()):
+            raise ValueError("At least one working hours interval is required.")
+
+        # The working hours (start, end) seconds intervals by weekday.
+        self.intervals = weekday_intervals
+        self._capacities = tuple(
+            sum(end - start for start, end in weekday_intervals[weekday]) for weekday in range(7)
+        )
+
+        # The loaded years and the first loaded day ordinal.
+        self._years = range(0)
+        self._first = 0
+        # The business seconds before each loaded day (and the total).
+        self._cumulative = array("q", (0,))
+
+    def _load_years(self, start: int, end: int) -> None:
+        """Make sure the [start, end] years are loaded."""
+        calendar = self.calendar
+        calendar._load_years(start, end)
+        if calendar._years == self._years:
+            return None
+
+        capacities = self._capacities
+        first = calendar._first
+        cumulative = array("q", (0,))
+        total = 0
+        for idx, is_working_day in enumerate(calendar._bitmap):
+            if is_working_day:
+                # The weekday of ordinal 1 (0001-01-01) is Monday.
+                total += capacities[(first + idx - 1) % 7]
+            cumulative.append(total)
+
+        self._cumulative = cumulative
+        self._first = first
+        self._years = calendar._years
+
+    def _get_position(self, dt: datetime) -> int:
+        """Return the number of loaded business seconds before a datetime."""
+        idx = dt.toordinal() - self._first
+        position = self._cumulative[idx]
+        if self._cumulative[idx + 1] > position:
+            seconds = dt.hour * 3600 + dt.minute * 60 + dt.second
+            for start, end in self.intervals[dt.weekday()]:
+                if seconds <= start:
+                    break
+                position += min(seconds, end) - start
+
+        return position
+
+    def _get_datetime(self, position: int, backward: bool) -> datetime:
+        """Return the datetime of a loaded business seconds position: the
+        earliest one (the latest one if backward)."""
+        cumulative = self._cumulative
+        if backward:
+            idx = bisect_right(cumulative, position) - 1
+        else:
+            idx = bisect_left(cumulative, position) - 1
+        dt = date.fromordinal(self._first + idx)
+        remaining = position - cumulative[idx]
+        for start, end in self.intervals[dt.weekday()]:
+            if remaining < end - start or (not backward and remaining == end - start):
+                break
+            remaining -= end - start
+
+        return datetime(dt.year, dt.month, dt.day) + timedelta(seconds=start + remaining)
+
+    def get_duration(self, start: DatetimeLike, end: DatetimeLike) -> timedelta:
+        """Return the business hours duration between two datetimes.
+
+        :param start:
+            The period start datetime (the dates stand for their midnight).
+
+        :param end:
+            The period end datetime.
+
+        :return:
+            The business hours duration (negative if the end is before the
+            start).
+        """
+        dt1 = _to_datetime(start)
+        dt2 = _to_datetime(end)
+        low, high = min(dt1, dt2), max(dt1, dt2)
+        self._load_years(low.year, high.year)
+
+        return timedelta(seconds=self._get_position(dt2) - self._get_position(dt1))
+
+    def get_deadline(self, start: DatetimeLike, hours: Union[float, timedelta]) -> datetime:
+        """Return the datetime the business hours after (before if negative)
+        a datetime end at, e.g., a ticket response deadline.
+
+        The deadline is the working hours interval end if it ends there (the
+        interval start for the negative business hours).
+
+        :param start:
+            The start datetime (the dates stand for their midnight).
+
+        :param hours:
+            The number of business hours (or the business hours duration).
+
+        :return:
+            The deadline datetime (with the start time zone if any).
+        """
+        dt = _to_datetime(start)
+        seconds = round(hours.total_seconds() if isinstance(hours, timedelta) else hours * 3600)
+        tzinfo = start.tzinfo if isinstance(start, datetime) else None
+        if seconds == 0:
+            return dt.replace(tzinfo=tzinfo)
+
+        # At least one working hour per week is expected.
+        margin = abs(seconds) // (3600 * 52) + 1
+        for _ in range(MAX_LOAD_ATTEMPTS):
+            self._load_years(
+                max(dt.year - (margin if seconds < 0 else 0), MINYEAR),
+                min(dt.year + (margin if seconds > 0 else 0), MAXYEAR),
+            )
+            position = self._get_position(dt) + seconds
+            # The position must be within a loaded business day.
+            if (
+                (0 < position <= self._cumulative[-1])
+                if seconds > 0
+                else (0 <= position < self._cumulative[-1])
+            ):
+                return self._get_datetime(position, backward=seconds < 0).replace(tzinfo=tzinfo)
+            margin *= 2
+
+        raise ValueError(f"No {hours} business hours found from {dt}.")
@@ -89,6 +89,34 @@ def _get_nth_weekday_of_month(n: int, weekday: int, month: int, year: int) -> da
     return dt
 
 
+def _get_nth_weekdays_of_months(n: int, weekday: int, months):
+    """
+    Return dates of n-th weekday of months, the vectorized form of
+    `_get_nth_weekday_of_month` for NumPy `datetime64[M]` months arrays
+    (the dates are returned as a `datetime64[D]` array).
+    If n is negative the countdown starts at the end of month
+    (i.e. -1 is last).
+    """
+
+    if n < 0:
+        start_dates = (months + 1).astype("datetime64[D]") - 1
+    else:
+        start_dates = months.astype("datetime64[D]")
+    # 1970-01-01 (the `datetime64` epoch) is Thursday.
+    start_weekdays = (start_dates.astype("int64") + THU) % 7
+
+    dts = start_dates + (
+        (n - 1) * 7 + (weekday - start_weekdays) % 7
+        if n > 0
+        else (n + 1) * 7 - (start_weekdays - weekday) % 7
+    )
+
+    if (dts.astype("datetime64[M]") != months).any():
+        raise ValueError(f"No {n} weekday {weekday} in some of the months")
+
+    return dts
+
+
 def _get_all_sundays(year):
     first_sunday = _get_nth_weekday_of_month(1, SUN, JAN, year)
     for n in range(0, (date(year, DEC, 31) - first_sunday).days + 1, 7):
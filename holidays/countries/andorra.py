@@ -10,6 +10,7 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
+from holidays.constants import PUBLIC
 from holidays.groups import ChristianHolidays, InternationalHolidays
 from holidays.holiday_base import HolidayBase
 
@@ -22,6 +23,7 @@ class Andorra(HolidayBase, ChristianHolidays, InternationalHolidays):
     """
 
     country = "AD"
+    subdivision_independent_categories = (PUBLIC,)
     subdivisions = (
         "02",  # Canillo.
         "03",  # Encamp.
@@ -50,6 +50,7 @@ class Australia(ObservedHolidayBase, ChristianHolidays, InternationalHolidays, S
 
     country = "AU"
     supported_categories = (BANK, HALF_DAY, PUBLIC)
+    subdivision_independent_categories = (BANK, HALF_DAY)
     default_language = "en_AU"
     # %s (observed).
     observed_label = tr("%s (observed)")
@@ -21,6 +21,7 @@ class Austria(HolidayBase, ChristianHolidays, InternationalHolidays):
     country = "AT"
     default_language = "de"
     supported_categories = (BANK, PUBLIC)
+    subdivision_independent_categories = (BANK, PUBLIC)
     supported_languages = ("de", "en_US", "uk")
     subdivisions = (
         "1",  # Burgenland.
@@ -12,6 +12,7 @@
 
 from gettext import gettext as tr
 
+from holidays.constants import PUBLIC
 from holidays.groups import ChristianHolidays, InternationalHolidays
 from holidays.observed_holiday_base import (
     ObservedHolidayBase,
@@ -40,6 +41,7 @@ class Bolivia(ObservedHolidayBase, ChristianHolidays, InternationalHolidays):
     supported_languages = ("en_US", "es", "uk")
     # %s (observed).
     observed_label = tr("%s (observado)")
+    subdivision_independent_categories = (PUBLIC,)
     subdivisions = (
         "B",  # El Beni
         "C",  # Cochabamba
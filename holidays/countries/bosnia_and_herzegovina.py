@@ -29,6 +29,7 @@ from holidays.calendars.gregorian import (
     DEC,
 )
 from holidays.calendars.julian import JULIAN_CALENDAR
+from holidays.constants import PUBLIC
 from holidays.groups import ChristianHolidays, IslamicHolidays, InternationalHolidays
 from holidays.observed_holiday_base import (
     ObservedHolidayBase,
@@ -59,6 +60,7 @@ class BosniaAndHerzegovina(
     supported_languages = ("bs", "en_US", "sr", "uk")
     # %s (observed).
     observed_label = tr("%s (preneseno)")
+    subdivision_independent_categories = (PUBLIC,)
     subdivisions = (
         "BIH",  # Federacija Bosne i Hercegovine
         "BRC",  # Brčko distrikt
@@ -58,6 +58,7 @@ class Brazil(HolidayBase, ChristianHolidays, InternationalHolidays):
         "TO",  # Tocantins
     )
     supported_categories = (OPTIONAL, PUBLIC)
+    subdivision_independent_categories = (OPTIONAL, PUBLIC)
 
     def __init__(self, *args, **kwargs) -> None:
         ChristianHolidays.__init__(self)
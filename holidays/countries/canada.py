@@ -46,6 +46,7 @@ class Canada(ObservedHolidayBase, ChristianHolidays, InternationalHolidays, Stat
     # %s (observed).
     observed_label = tr("%s (observed)")
     supported_categories = (GOVERNMENT, OPTIONAL, PUBLIC)
+    subdivision_independent_categories = (GOVERNMENT, OPTIONAL, PUBLIC)
     subdivisions = (
         "AB",
         "BC",
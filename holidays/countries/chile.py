@@ -78,6 +78,7 @@ class Chile(ObservedHolidayBase, ChristianHolidays, InternationalHolidays, Stati
         "VS",
     )
     supported_categories = (BANK, PUBLIC)
+    subdivision_independent_categories = (BANK, PUBLIC)
     supported_languages = ("en_US", "es", "uk")
 
     def __init__(self, *args, **kwargs):
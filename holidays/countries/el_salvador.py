@@ -10,6 +10,7 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
+from holidays.constants import PUBLIC
 from holidays.groups import ChristianHolidays, InternationalHolidays
 from holidays.holiday_base import HolidayBase
 
@@ -23,6 +24,7 @@ class ElSalvador(HolidayBase, ChristianHolidays, InternationalHolidays):
     """
 
     country = "SV"
+    subdivision_independent_categories = (PUBLIC,)
     subdivisions = (
         "AH",  # Ahuachapán
         "CA",  # Cabañas
@@ -56,6 +56,7 @@ class Germany(HolidayBase, ChristianHolidays, InternationalHolidays, StaticHolid
     country = "DE"
     default_language = "de"
     supported_categories = (CATHOLIC, PUBLIC)
+    subdivision_independent_categories = (CATHOLIC,)
     supported_languages = ("de", "en_US", "th", "uk")
     subdivisions = (
         # ISO 3166-2:DE
@@ -11,6 +11,7 @@
 #  License: MIT (see LICENSE file)
 
 from holidays.calendars.gregorian import MAR
+from holidays.constants import PUBLIC
 from holidays.groups import ChristianHolidays, InternationalHolidays, StaticHolidays
 from holidays.holiday_base import HolidayBase
 
@@ -23,6 +24,7 @@ class Italy(HolidayBase, ChristianHolidays, InternationalHolidays, StaticHoliday
     """
 
     country = "IT"
+    subdivision_independent_categories = (PUBLIC,)
     subdivisions = (
         # Provinces.
         "AG",  # Agrigento.
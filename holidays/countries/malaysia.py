@@ -35,6 +35,7 @@ from holidays.calendars.gregorian import (
     SAT,
     SUN,
 )
+from holidays.constants import PUBLIC
 from holidays.groups import (
     BuddhistCalendarHolidays,
     ChineseCalendarHolidays,
@@ -70,6 +71,7 @@ class Malaysia(
     observed_label = tr("Cuti %s")
     # %s (observed, estimated).
     observed_estimated_label = tr("Cuti %s (anggaran)")
+    subdivision_independent_categories = (PUBLIC,)
     subdivisions = (
         "01",
         "02",
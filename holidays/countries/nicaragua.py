@@ -12,6 +12,7 @@
 
 from gettext import gettext as tr
 
+from holidays.constants import PUBLIC
 from holidays.groups import ChristianHolidays, InternationalHolidays
 from holidays.holiday_base import HolidayBase
 
@@ -26,6 +27,7 @@ class Nicaragua(HolidayBase, ChristianHolidays, InternationalHolidays):
 
     country = "NI"
     default_language = "es"
+    subdivision_independent_categories = (PUBLIC,)
     subdivisions = (
         "AN",
         "AS",
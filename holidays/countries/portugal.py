@@ -39,6 +39,7 @@ class Portugal(HolidayBase, ChristianHolidays, InternationalHolidays):
     country = "PT"
     default_language = "pt_PT"
     supported_categories = (OPTIONAL, PUBLIC)
+    subdivision_independent_categories = (OPTIONAL, PUBLIC)
 
     # https://en.wikipedia.org/wiki/ISO_3166-2:PT
     subdivisions = (
@@ -14,6 +14,7 @@ from gettext import gettext as tr
 
 from holidays.calendars import _CustomIslamicHolidays
 from holidays.calendars.gregorian import MAR, APR, MAY, JUN, JUL, AUG, SEP, OCT, NOV
+from holidays.constants import PUBLIC
 from holidays.groups import (
     ChristianHolidays,
     IslamicHolidays,
@@ -55,6 +56,7 @@ class Spain(
     default_language = "es"
     # Monday following %s.
     observed_label = tr("Lunes siguiente a %s")
+    subdivision_independent_categories = (PUBLIC,)
     subdivisions = (
         "AN",  # Andalucía
         "AR",  # Aragón
@@ -57,6 +57,7 @@ class Switzerland(ObservedHolidayBase, ChristianHolidays, InternationalHolidays)
         "ZH",  # Zürich
     )
     supported_categories = (HALF_DAY, OPTIONAL, PUBLIC)
+    subdivision_independent_categories = (HALF_DAY, OPTIONAL, PUBLIC)
     supported_languages = ("de", "en_US", "fr", "it", "uk")
 
     def __init__(self, *args, **kwargs):
@@ -13,6 +13,7 @@
 from typing import Union
 
 from holidays.calendars.gregorian import APR, MAY, JUN, JUL, SEP, DEC
+from holidays.constants import PUBLIC
 from holidays.groups import ChristianHolidays, InternationalHolidays, StaticHolidays
 from holidays.observed_holiday_base import (
     ObservedHolidayBase,
@@ -38,6 +39,7 @@ class UnitedKingdom(ObservedHolidayBase, ChristianHolidays, InternationalHoliday
 
     country = "GB"
     observed_label = "%s (observed)"
+    subdivision_independent_categories = (PUBLIC,)
     subdivisions: Union[tuple[()], tuple[str, ...]] = (
         "ENG",  # England
         "NIR",  # Northern Ireland
@@ -61,6 +61,7 @@ class UnitedStates(ObservedHolidayBase, ChristianHolidays, InternationalHolidays
 
     country = "US"
     supported_categories = (PUBLIC, UNOFFICIAL)
+    subdivision_independent_categories = (PUBLIC,)
     observed_label = "%s (observed)"
     subdivisions: Union[tuple[()], tuple[str, ...]] = (
         "AK",  # Alaska.
@@ -0,0 +1,151 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+"""Day count conventions.
+
+The business days counts (BUS/252) are the differences of the precomputed
+cumulative business days counts (see :mod:`holidays.business_days`), so each
+count takes constant time regardless of the interval length.
+"""
+
+__all__ = ("ACT_360", "ACT_365F", "BUS_252", "DayCounter")
+
+from typing import Any, Optional, Union
+
+from holidays.business_days import BusinessCalendar, Dates, _is_numpy_array, _to_ordinals
+from holidays.holiday_base import DateLike, HolidayBase, _to_date
+
+# The day count conventions.
+ACT_360 = "ACT/360"  # The actual number of days, 360 days a year.
+ACT_365F = "ACT/365F"  # The actual number of days, 365 days a year.
+BUS_252 = "BUS/252"  # The number of business days, 252 business days a year.
+
+DAYS_IN_YEAR = {ACT_360: 360, ACT_365F: 365, BUS_252: 252}
+
+
+class DayCounter:
+    """A day count convention calculator.
+
+    The periods work in a half-open interval fashion [start, end): the start
+    date is included and the end date is not. The day counts (and the year
+    fractions) are negative if the end date is before the start date.
+
+    Example usage:
+
+    >>> from holidays import country_holidays
+    >>> from holidays.day_count import BUS_252, DayCounter
+    >>> day_counter = DayCounter(BUS_252, country_holidays('BR'))
+    >>> day_counter.day_count('2024-01-01', '2025-01-01')
+    256
+    >>> round(day_counter.year_fraction('2024-01-02', '2024-07-01'), 6)
+    0.503968
+    """
+
+    def __init__(
+        self,
+        convention: str = ACT_365F,
+        holidays: Optional[Union[HolidayBase, BusinessCalendar]] = None,
+    ) -> None:
+        """
+        :param convention:
+            The day count convention: :data:`ACT_360`, :data:`ACT_365F` or
+            :data:`BUS_252`.
+
+        :param holidays:
+            The business days calendar (or the holidays it's made of),
+            required for the :data:`BUS_252` convention.
+        """
+        if convention not in DAYS_IN_YEAR:
+            raise ValueError(f"Unknown day count convention: {convention}.")
+        if convention == BUS_252 and holidays is None:
+            raise ValueError(f"The {convention} convention requires a holidays calendar.")
+
+        self.convention = convention
+        self.calendar = (
+            BusinessCalendar(holidays) if isinstance(holidays, HolidayBase) else holidays
+        )
+        self.days_in_year = DAYS_IN_YEAR[convention]
+
+    def day_count(self, start: DateLike, end: DateLike) -> int:
+        """Return the number of days in a period.
+
+        :param start:
+            The period start date.
+
+        :param end:
+            The period end date.
+        """
+        start_ordinal = _to_date(start).toordinal()
+        end_ordinal = _to_date(end).toordinal()
+        if self.convention == BUS_252:
+            return self.calendar._count(start_ordinal, end_ordinal)  # type: ignore[union-attr]
+
+        return end_ordinal - start_ordinal
+
+    def day_counts(self, starts: Dates, ends: Dates) -> Union[list[int], Any]:
+        """Return the numbers of days in multiple periods.
+
+        :param starts:
+            The period start dates: an iterable of :data:`DateLike` values or
+            a NumPy ``datetime64`` array.
+
+        :param ends:
+            The period end dates (of the same type and length as the start
+            dates).
+
+        :return:
+            The list of day counts or the ``int64`` array for NumPy arrays
+            input.
+        """
+        if not _is_numpy_array(starts):
+            return [self.day_count(start, end) for start, end in zip(starts, ends)]
+
+        start_ordinals = _to_ordinals(starts)
+        end_ordinals = _to_ordinals(ends)
+        if self.convention == BUS_252:
+            return self.calendar._count_array(  # type: ignore[union-attr]
+                start_ordinals, end_ordinals
+            )
+
+        return end_ordinals - start_ordinals
+
+    def year_fraction(self, start: DateLike, end: DateLike) -> float:
+        """Return the year fraction of a period.
+
+        :param start:
+            The period start date.
+
+        :param end:
+            The period end date.
+        """
+        return self.day_count(start, end) / self.days_in_year
+
+    def year_fractions(self, starts: Dates, ends: Dates) -> Union[list[float], Any]:
+        """Return the year fractions of multiple periods.
+
+        :param starts:
+            The period start dates: an iterable of :data:`DateLike` values or
+            a NumPy ``datetime64`` array.
+
+        :param ends:
+            The period end dates (of the same type and length as the start
+            dates).
+
+        :return:
+            The list of year fractions or the ``float64`` array for NumPy
+            arrays input.
+        """
+        day_counts = self.day_counts(starts, ends)
+        if isinstance(day_counts, list):
+            return [day_count / self.days_in_year for day_count in day_counts]
+
+        return day_counts / self.days_in_year
@@ -0,0 +1,242 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+"""Holiday proximity features (e.g., for demand forecasting models).
+
+The features of many dates are computed at once (requires NumPy): the nearest
+holidays are looked up in the sorted holiday ordinals index with
+:func:`numpy.searchsorted` and the long weekends and bridge days are found
+by the :mod:`holidays.long_weekends` rules in the per year working days
+bitmaps (see :meth:`holidays.holiday_base.HolidayBase.get_working_days`), so
+the entity weekend and weekend working days are taken into account.
+"""
+
+__all__ = ("FEATURES", "get_holiday_features")
+
+from collections.abc import Hashable, Mapping
+from datetime import MAXYEAR, MINYEAR, date
+from typing import Any, NamedTuple, Optional, Union
+
+from holidays.business_days import Dates, _is_numpy_array, _to_ordinals
+from holidays.holiday_base import HolidayBase, _to_date
+from holidays.long_weekends import _find_bridge_days, _find_long_weekends
+
+# The feature columns.
+FEATURES = (
+    "is_holiday",  # Whether the date is a holiday.
+    "days_to_next_holiday",  # The days until the next holiday (0 on holidays, -1 if none).
+    "days_since_last_holiday",  # The days since the last holiday (0 on holidays, -1 if none).
+    "next_holiday",  # The next holiday name (on or after the date, "" if none).
+    "is_bridge_day",  # Whether the date is a bridge day.
+    "is_long_weekend",  # Whether the date is within a long weekend.
+)
+
+_FEATURE_DTYPES = dict(zip(FEATURES, ("bool", "int64", "int64", "object", "bool", "bool")))
+
+# The number of years to look beyond the dates range for the nearest holidays.
+MARGIN_YEARS = 1
+
+
+class _CalendarArrays(NamedTuple):
+    """The NumPy arrays of a holiday calendar years range."""
+
+    first: int
+    """The first day ordinal."""
+    bitmap: bytes
+    """The working days bitmap."""
+    holiday_ordinals: Any
+    """The sorted holiday ordinals."""
+    holiday_names: Any
+    """The holiday names (in the holiday ordinals order)."""
+    is_holiday: Any
+    """The per day holiday flags."""
+    is_working_day: Any
+    """The per day working day flags."""
+
+
+def _get_calendar_arrays(holidays: HolidayBase, start_year: int, end_year: int) -> _CalendarArrays:
+    """Return a holiday calendar [start_year, end_year] years arrays."""
+    import numpy as np
+
+    bitmap = b"".join(
+        holidays._get_working_days_bitmap(year) for year in range(start_year, end_year + 1)
+    )
+    is_working_day = np.frombuffer(bitmap, dtype=np.uint8).astype(bool)
+    first = date(start_year, 1, 1).toordinal()
+    entries = sorted(
+        (dt.toordinal(), name)
+        for dt, name in holidays.items()
+        if start_year <= dt.year <= end_year
+    )
+    holiday_ordinals = np.array([ordinal for ordinal, _ in entries], dtype=np.int64)
+    is_holiday = np.zeros(len(is_working_day), dtype=bool)
+    is_holiday[holiday_ordinals - first] = True
+
+    return _CalendarArrays(
+        first,
+        bitmap,
+        holiday_ordinals,
+        np.array([name for _, name in entries], dtype=object),
+        is_holiday,
+        is_working_day,
+    )
+
+
+def _get_long_weekend_days(arrays: _CalendarArrays) -> Any:
+    """Return the per day long weekend flags (see
+    :data:`holidays.long_weekends.LONG_WEEKEND_MIN_DAYS`)."""
+    import numpy as np
+
+    is_long_weekend = np.zeros(len(arrays.bitmap), dtype=bool)
+    for indices in _find_long_weekends(arrays.bitmap, arrays.is_holiday):
+        is_long_weekend[indices.start : indices.stop] = True
+
+    return is_long_weekend
+
+
+def _get_bridge_days(arrays: _CalendarArrays) -> Any:
+    """Return the per day bridge day flags: the single working days between
+    a holiday and a non-working day."""
+    import numpy as np
+
+    is_bridge_day = np.zeros(len(arrays.bitmap), dtype=bool)
+    is_bridge_day[
+        np.fromiter(_find_bridge_days(arrays.bitmap, arrays.is_holiday), dtype=np.int64)
+    ] = True
+
+    return is_bridge_day
+
+
+def _get_features(holidays: HolidayBase, ordinals: Any) -> dict[str, Any]:
+    """Return the features columns of a day ordinals array."""
+    import numpy as np
+
+    if not len(ordinals):
+        return {name: np.array([], dtype=dtype) for name, dtype in _FEATURE_DTYPES.items()}
+
+    start_year = date.fromordinal(int(ordinals.min())).year
+    end_year = date.fromordinal(int(ordinals.max())).year
+    arrays = _get_calendar_arrays(
+        holidays, max(start_year - MARGIN_YEARS, MINYEAR), min(end_year + MARGIN_YEARS, MAXYEAR)
+    )
+    holiday_ordinals = arrays.holiday_ordinals
+    indices = ordinals - arrays.first
+
+    next_idx = np.searchsorted(holiday_ordinals, ordinals, side="left")
+    has_next = next_idx < len(holiday_ordinals)
+    next_idx = np.minimum(next_idx, len(holiday_ordinals) - 1)
+    last_idx = np.searchsorted(holiday_ordinals, ordinals, side="right") - 1
+    has_last = last_idx >= 0
+
+    next_holiday = np.full(len(ordinals), "", dtype=object)
+    if len(holiday_ordinals):
+        days_to_next = np.where(has_next, holiday_ordinals[next_idx] - ordinals, -1)
+        days_since_last = np.where(has_last, ordinals - holiday_ordinals[last_idx], -1)
+        next_holiday[has_next] = arrays.holiday_names[next_idx[has_next]]
+    else:
+        days_to_next = np.full(len(ordinals), -1, dtype=np.int64)
+        days_since_last = np.full(len(ordinals), -1, dtype=np.int64)
+
+    return {
+        "is_holiday": arrays.is_holiday[indices],
+        "days_to_next_holiday": days_to_next,
+        "days_since_last_holiday": days_since_last,
+        "next_holiday": next_holiday,
+        "is_bridge_day": _get_bridge_days(arrays)[indices],
+        "is_long_weekend": _get_long_weekend_days(arrays)[indices],
+    }
+
+
+def get_holiday_features(
+    holidays: Union[HolidayBase, Mapping[Hashable, HolidayBase]],
+    dates: Dates,
+    keys: Optional[Any] = None,
+    structured: bool = False,
+) -> Union[dict[str, Any], Any]:
+    """Compute holiday proximity features of multiple dates (requires NumPy).
+
+    The features are (see :data:`FEATURES`): the holiday flag, the days until
+    the next holiday and since the last one, the next holiday name, the
+    bridge day flag (a single working day between a holiday and a non-working
+    day) and the long weekend flag (a non-working days run of at least
+    :data:`holidays.long_weekends.LONG_WEEKEND_MIN_DAYS` days including a
+    holiday). The holidays are looked up within a year around the
+    dates range.
+
+    Example usage:
+
+    >>> import numpy as np
+    >>> from holidays import country_holidays
+    >>> from holidays.features import get_holiday_features
+    >>> features = get_holiday_features(
+    ...     country_holidays('US'),
+    ...     np.array(['2024-07-03', '2024-07-05', '2024-11-29'], dtype='datetime64[D]'),
+    ... )
+    >>> features['days_to_next_holiday'].tolist()
+    [1, 59, 26]
+    >>> features['next_holiday'].tolist()
+    ['Independence Day', 'Labor Day', 'Christmas Day']
+    >>> features['is_bridge_day'].tolist()
+    [False, True, True]
+
+    :param holidays:
+        The holiday calendar or multiple calendars by key (e.g., by country
+        code) for the dates of different entities.
+
+    :param dates:
+        The dates: a NumPy ``datetime64`` array or an iterable of
+        :data:`holidays.holiday_base.DateLike` values.
+
+    :param keys:
+        The calendar key of each date (an array-like of the same length as
+        the dates), required for the multiple calendars.
+
+    :param structured:
+        Whether to return a NumPy structured array instead of the columns.
+
+    :return:
+        The feature name to the NumPy array (aligned with the dates) mapping,
+        or the structured array with the feature fields.
+    """
+    import numpy as np
+
+    if not _is_numpy_array(dates):
+        dates = np.array([_to_date(dt) for dt in dates], dtype="datetime64[D]")
+    ordinals = _to_ordinals(dates)
+
+    if isinstance(holidays, HolidayBase):
+        columns = _get_features(holidays, ordinals)
+    else:
+        if keys is None:
+            raise ValueError("The dates keys are required for multiple calendars.")
+        keys = np.asarray(keys)
+        if len(keys) != len(ordinals):
+            raise ValueError("The dates keys must be of the same length as the dates.")
+
+        columns = {
+            name: np.empty(len(ordinals), dtype=dtype) for name, dtype in _FEATURE_DTYPES.items()
+        }
+        for key in np.unique(keys):
+            if key not in holidays:
+                raise KeyError(f"No holidays calendar for key {key!r}.")
+            mask = keys == key
+            for name, values in _get_features(holidays[key], ordinals[mask]).items():
+                columns[name][mask] = values
+
+    if not structured:
+        return columns
+
+    records = np.empty(len(ordinals), dtype=list(_FEATURE_DTYPES.items()))
+    for name in FEATURES:
+        records[name] = columns[name]
+
+    return records
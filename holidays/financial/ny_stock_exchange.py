@@ -10,7 +10,7 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
-from datetime import date
+from datetime import date, time
 
 from holidays.calendars.gregorian import (
     JAN,
@@ -25,6 +25,8 @@ from holidays.calendars.gregorian import (
     OCT,
     NOV,
     DEC,
+    THU,
+    _get_nth_weekday_of_month,
     _timedelta,
 )
 from holidays.groups import ChristianHolidays, InternationalHolidays, StaticHolidays
@@ -45,6 +47,8 @@ class NewYorkStockExchange(
 
     market = "NYSE"
     observed_label = "%s (observed)"
+    early_close_time = time(13)
+    """The early close days session close time (1:00 p.m.)."""
 
     def __init__(self, *args, **kwargs):
         ChristianHolidays.__init__(self)
@@ -138,6 +142,23 @@ class NewYorkStockExchange(
             for dt in (_timedelta(begin, n) for n in range(0, (end - begin).days + 1, 7)):
                 self._add_holiday("Paper Crisis", dt)
 
+    def get_early_closes(self, year: int) -> set[date]:
+        """Return the year early close days candidates: the day before
+        Independence Day, the day after Thanksgiving Day and Christmas Eve
+        (since 1993). The non-trading days are to be skipped by the caller.
+
+        :param year:
+            The year to get the early close days for.
+        """
+        if year < 1993:
+            return set()
+
+        return {
+            date(year, JUL, 3),
+            _timedelta(_get_nth_weekday_of_month(4, THU, NOV, year), +1),
+            date(year, DEC, 24),
+        }
+
 
 class XNYS(NewYorkStockExchange):
     pass
@@ -0,0 +1,367 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+__all__ = ("FrozenHolidays",)
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import date, datetime, timedelta
+from typing import Any, Optional, Union
+
+from holidays.constants import HOLIDAY_NAME_DELIMITER
+from holidays.holiday_base import DateLike, HolidayBase, _pack_holidays, _to_date
+
+
+class FrozenHolidays(Mapping[date, str]):
+    """An immutable and hashable snapshot of holidays for a fixed set of years.
+
+    The holidays are stored as a sorted array of date ordinals and an array of
+    indices into a table of interned holiday names. Unlike
+    :class:`HolidayBase`, the snapshot is never expanded: the dates outside of
+    the frozen years are not holidays (the same as ``expand=False``).
+
+    Use :meth:`HolidayBase.freeze` or ``country_holidays(..., frozen=True)``
+    to create it:
+
+    >>> import holidays
+    >>> us_holidays = holidays.country_holidays('US', years=2024, frozen=True)
+    >>> us_holidays.get('2024-07-04')
+    'Independence Day'
+    >>> us_holidays is holidays.country_holidays('US', years=2024, frozen=True)
+    True
+    """
+
+    __slots__ = (
+        "categories",
+        "country",
+        "language",
+        "market",
+        "observed",
+        "subdiv",
+        "weekend",
+        "weekend_workdays",
+        "years",
+        "_hash",
+        "_name_ids",
+        "_names",
+        "_ordinals",
+        "_year_weekends",
+        "__weakref__",
+    )
+
+    categories: frozenset[str]
+    """Holiday categories."""
+    country: Optional[str]
+    """The country code (None for financial markets)."""
+    language: Optional[str]
+    """The language the holiday names are translated into."""
+    market: Optional[str]
+    """The market code (None for countries)."""
+    observed: bool
+    """Whether the observed holidays are included."""
+    subdiv: Optional[str]
+    """The subdivision code."""
+    weekend: frozenset[int]
+    """The weekend days (of the last populated year, the frozen years
+    weekends are used for the working days calculations)."""
+    weekend_workdays: frozenset[date]
+    """The working days falling on weekends."""
+    years: frozenset[int]
+    """The frozen years."""
+
+    _hash: Optional[int]
+    _name_ids: array
+    _names: tuple[str, ...]
+    _ordinals: array
+    _year_weekends: dict[int, frozenset[int]]
+
+    def __init__(self, holidays: HolidayBase, years: Iterable[int]) -> None:
+        """
+        :param holidays:
+            The holidays object to take a snapshot of.
+
+        :param years:
+            The years to include into the snapshot. They must be populated
+            already (see :meth:`HolidayBase.freeze`).
+        """
+        years = frozenset(years)
+        ordinals, name_ids, names = _pack_holidays(
+            (dt, name) for dt, name in sorted(holidays.items()) if dt.year in years
+        )
+
+        setattr_ = object.__setattr__
+        setattr_(self, "categories", frozenset(holidays.categories))
+        setattr_(self, "country", getattr(holidays, "country", None))
+        setattr_(self, "language", holidays.language)
+        setattr_(self, "market", getattr(holidays, "market", None))
+        setattr_(self, "observed", holidays.observed)
+        setattr_(self, "subdiv", holidays.subdiv)
+        setattr_(self, "weekend", frozenset(holidays.weekend))
+        setattr_(
+            self,
+            "weekend_workdays",
+            frozenset(dt for dt in holidays.weekend_workdays if dt.year in years),
+        )
+        setattr_(self, "years", years)
+        setattr_(self, "_hash", None)
+        setattr_(self, "_name_ids", name_ids)
+        setattr_(self, "_names", names)
+        setattr_(self, "_ordinals", ordinals)
+        setattr_(
+            self,
+            "_year_weekends",
+            {year: frozenset(holidays._get_year_weekend(year)) for year in sorted(years)},
+        )
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, (date, datetime, float, int, str)):
+            raise TypeError(f"Cannot convert type '{type(key)}' to date.")
+
+        return self._find(_to_date(key)) is not None
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} object is immutable.")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrozenHolidays):
+            return NotImplemented
+
+        return (
+            self is other
+            or self._ordinals == other._ordinals
+            and self._holiday_names == other._holiday_names
+            and self._metadata == other._metadata
+        )
+
+    def __getitem__(self, key: Union[DateLike, slice]) -> Any:
+        if isinstance(key, slice):
+            return self._get_range(key)
+
+        if (idx := self._find(_to_date(key))) is None:
+            raise KeyError(key)
+
+        return self._names[self._name_ids[idx]]
+
+    def __hash__(self) -> int:
+        if (value := self._hash) is None:
+            value = hash((self._metadata, self._ordinals.tobytes(), self._holiday_names))
+            object.__setattr__(self, "_hash", value)
+
+        return value
+
+    def __iter__(self) -> Iterator[date]:
+        return map(date.fromordinal, self._ordinals)
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _restore_frozen_holidays, tuple(getattr(self, name) for name in _state_slots)
+
+    def __repr__(self) -> str:
+        entity = f"market={self.market!r}" if self.market else f"country={self.country!r}"
+        subdiv = f", subdiv={self.subdiv!r}" if self.subdiv else ""
+
+        return f"holidays.FrozenHolidays({entity}{subdiv}, years={sorted(self.years)})"
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} object is immutable.")
+
+    @property
+    def _holiday_names(self) -> tuple[str, ...]:
+        names = self._names
+        return tuple(names[name_id] for name_id in self._name_ids)
+
+    @property
+    def _metadata(self) -> tuple[Any, ...]:
+        return (
+            self.country,
+            self.market,
+            self.subdiv,
+            self.categories,
+            self.language,
+            self.observed,
+            self.years,
+            self.weekend,
+            self.weekend_workdays,
+            tuple(self._year_weekends.items()),
+        )
+
+    def _find(self, dt: date) -> Optional[int]:
+        """Return the holiday index for a date if date is a holiday, else None."""
+        ordinal = dt.toordinal()
+        ordinals = self._ordinals
+        idx = bisect_left(ordinals, ordinal)
+
+        return idx if idx < len(ordinals) and ordinals[idx] == ordinal else None
+
+    def _count_working_days(
+        self, start_ordinal: int, end_ordinal: int, weekend: frozenset[int]
+    ) -> int:
+        """Return the number of working days in the [start, end] ordinals
+        range having the same weekend."""
+        # Count week days first, the weekday of ordinal 1 (0001-01-01) is Monday.
+        full_weeks, remainder = divmod(end_ordinal - start_ordinal + 1, 7)
+        working_weekdays = 7 - len(weekend)
+        count = full_weeks * working_weekdays + sum(
+            (start_ordinal + delta - 1) % 7 not in weekend for delta in range(remainder)
+        )
+
+        # Then exclude holidays falling on week days.
+        ordinals = self._ordinals
+        count -= sum(
+            (ordinal - 1) % 7 not in weekend
+            for ordinal in ordinals[
+                bisect_left(ordinals, start_ordinal) : bisect_right(ordinals, end_ordinal)
+            ]
+        )
+
+        # And add weekend working days.
+        return count + sum(
+            start_ordinal <= dt.toordinal() <= end_ordinal and dt.weekday() in weekend
+            for dt in self.weekend_workdays
+        )
+
+    def _get_range(self, key: slice) -> list[date]:
+        """Return the holiday dates in a date range, see
+        :meth:`HolidayBase.__getitem__` for the slice semantics."""
+        if not key.start or not key.stop:
+            raise ValueError("Both start and stop must be given.")
+
+        start = _to_date(key.start).toordinal()
+        stop = _to_date(key.stop).toordinal()
+
+        if key.step is None:
+            step = 1
+        elif isinstance(key.step, timedelta):
+            step = key.step.days
+        elif isinstance(key.step, int):
+            step = key.step
+        else:
+            raise TypeError(f"Cannot convert type '{type(key.step)}' to int.")
+
+        if step == 0:
+            raise ValueError("Step value must not be zero.")
+
+        if stop - start < 0 <= step or stop - start >= 0 > step:
+            step *= -1
+
+        ordinals = self._ordinals
+        if step > 0:
+            in_range = ordinals[bisect_left(ordinals, start) : bisect_left(ordinals, stop)]
+        else:
+            in_range = ordinals[bisect_right(ordinals, stop) : bisect_right(ordinals, start)]
+            in_range.reverse()
+
+        return [date.fromordinal(ordinal) for ordinal in in_range if (ordinal - start) % step == 0]
+
+    def _get_weekend(self, year: int) -> frozenset[int]:
+        """Return a year weekend days (the weekend for the non-frozen years)."""
+        return self._year_weekends.get(year, self.weekend)
+
+    def _is_working_day(self, ordinal: int) -> bool:
+        dt = date.fromordinal(ordinal)
+        if (ordinal - 1) % 7 in self._get_weekend(dt.year):
+            return dt in self.weekend_workdays
+
+        ordinals = self._ordinals
+        idx = bisect_left(ordinals, ordinal)
+
+        return idx == len(ordinals) or ordinals[idx] != ordinal
+
+    def get(self, key: DateLike, default: Union[str, Any] = None) -> Union[str, Any]:
+        """Return the holiday name for a date if date is a holiday, else
+        default.
+
+        :param key:
+            The date expressed in one of the :data:`DateLike` types.
+
+        :param default:
+            The default value to return if no value is found.
+        """
+        if (idx := self._find(_to_date(key))) is None:
+            return default
+
+        return self._names[self._name_ids[idx]]
+
+    def get_list(self, key: DateLike) -> list[str]:
+        """Return a list of all holiday names for a date if date is a holiday,
+        else empty list.
+
+        :param key:
+            The date expressed in one of the :data:`DateLike` types.
+        """
+        return [name for name in self.get(key, "").split(HOLIDAY_NAME_DELIMITER) if name]
+
+    def get_nth_working_day(self, key: DateLike, n: int) -> date:
+        """Return n-th working day from provided date (if n is positive)
+        or n-th working day before provided date (if n is negative).
+        """
+        direction = +1 if n > 0 else -1
+        ordinal = _to_date(key).toordinal()
+        for _ in range(abs(n)):
+            ordinal += direction
+            while not self._is_working_day(ordinal):
+                ordinal += direction
+
+        return date.fromordinal(ordinal)
+
+    def get_working_days_count(self, start: DateLike, end: DateLike) -> int:
+        """Return the number of working days between two dates.
+
+        The date range works in a closed interval fashion [start, end] so both
+        endpoints are included.
+
+        :param start:
+            The range start date.
+
+        :param end:
+            The range end date.
+        """
+        start_ordinal = _to_date(start).toordinal()
+        end_ordinal = _to_date(end).toordinal()
+        if start_ordinal > end_ordinal:
+            start_ordinal, end_ordinal = end_ordinal, start_ordinal
+
+        # Count the working days of each year part of the range.
+        count = 0
+        for year in range(
+            date.fromordinal(start_ordinal).year, date.fromordinal(end_ordinal).year + 1
+        ):
+            count += self._count_working_days(
+                max(start_ordinal, date(year, 1, 1).toordinal()),
+                min(end_ordinal, date(year, 12, 31).toordinal()),
+                self._get_weekend(year),
+            )
+
+        return count
+
+    def is_working_day(self, key: DateLike) -> bool:
+        """Return True if date is a working day (not a holiday or a weekend)."""
+        return self._is_working_day(_to_date(key).toordinal())
+
+
+# The hash is not pickled as string hashes differ between processes.
+_state_slots = tuple(
+    name for name in FrozenHolidays.__slots__ if name not in {"_hash", "__weakref__"}
+)
+
+
+def _restore_frozen_holidays(*state: Any) -> FrozenHolidays:
+    """Restore pickled :class:`FrozenHolidays` object."""
+    frozen_holidays = object.__new__(FrozenHolidays)
+    object.__setattr__(frozen_holidays, "_hash", None)
+    for name, value in zip(_state_slots, state):
+        object.__setattr__(frozen_holidays, name, value)
+
+    return frozen_holidays
@@ -10,20 +10,27 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
-__all__ = ("DateLike", "HolidayBase", "HolidaySum")
+__all__ = ("DateLike", "HolidayBase", "HolidaySum", "YearsCacheInfo")
 
 import copy
+import sys
 import warnings
-from calendar import isleap
-from collections.abc import Iterable
+from array import array
+from calendar import day_abbr, isleap
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from contextlib import nullcontext
 from datetime import date, datetime, timedelta, timezone
-from functools import cached_property
-from gettext import gettext, translation
+from functools import cached_property, partial
+from gettext import find, gettext, translation
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, cast
+from threading import Lock, RLock
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Dict, Generic, NamedTuple, Optional, TypeVar, Union, cast
 
 from dateutil.parser import parse
 
+from holidays import metrics
 from holidays.calendars.gregorian import (
     MON,
     TUE,
@@ -42,6 +49,10 @@ from holidays.calendars.gregorian import (
 from holidays.constants import HOLIDAY_NAME_DELIMITER, PUBLIC
 from holidays.helpers import _normalize_arguments, _normalize_tuple
 
+if TYPE_CHECKING:
+    from holidays.business_hours import BusinessHours, WorkingHours
+    from holidays.frozen_holidays import FrozenHolidays
+
 CategoryArg = Union[str, Iterable[str]]
 DateArg = Union[date, tuple[int, int]]
 DateLike = Union[date, datetime, str, float, int]
@@ -51,6 +62,262 @@ SubstitutedHoliday = Union[
     tuple[Union[tuple[int, int, int, int], tuple[int, int, int, int, int]], ...],
 ]
 YearArg = Union[int, Iterable[int]]
+YearData = tuple[
+    tuple[tuple[date, str], ...],  # Holidays.
+    frozenset[date],  # Weekend workdays.
+    tuple[tuple[str, Any], ...],  # Instance attributes set during population.
+]
+
+
+class YearsCacheInfo(NamedTuple):
+    """The populated years usage statistics of a bounded
+    (``max_years``) :class:`HolidayBase` instance."""
+
+    hits: int
+    """The number of lookups of already populated years."""
+    misses: int
+    """The number of years populated on demand."""
+    evictions: int
+    """The number of least recently used years evicted."""
+    maxsize: Optional[int]
+    """The maximum number of populated years."""
+    currsize: int
+    """The current number of populated years."""
+
+
+_T = TypeVar("_T")
+
+
+class _PopulationCache(Generic[_T]):
+    """A thread-safe LRU cache of the per year population results (or the
+    data derived from them, e.g., working days bitmaps).
+
+    The results are shared between all entity instances having the same
+    population parameters (see :attr:`HolidayBase._population_key`).
+    """
+
+    def __init__(self, maxsize: int = 4096, name: str = "population_cache") -> None:
+        self.maxsize = maxsize
+        self.name = name
+        self._data: OrderedDict[Hashable, _T] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def get(self, key: Hashable) -> Optional[_T]:
+        with self._lock:
+            if (value := self._data.get(key)) is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: _T) -> None:
+        with self._lock:
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                if (recorder := metrics._recorder) is not None:
+                    recorder.record_global((self.name, "evictions"))
+
+
+_population_cache: _PopulationCache[YearData] = _PopulationCache()
+# The per year working days bitmaps of the unmodified populated years.
+_working_days_cache: _PopulationCache[bytes] = _PopulationCache(name="working_days_cache")
+
+# The instance attributes recreated on the instance restoration (unpickling).
+_derived_attributes = frozenset(
+    (
+        "_expanding_years",
+        "_expansion_lock",
+        "_modified_years",
+        "_population_key",
+        "_population_plans",
+        "_sorted_categories",
+        "_touched_dates",
+        "_translation_files",
+        "_weekend_workdays_count",
+        "_working_days",
+        "_year_entries",
+        "_years_lru",
+        "_years_stats",
+        "tr",
+        "weekend_workdays",
+        "years",
+    )
+)
+
+
+class _PopulationPlan:
+    """Entity populate method names and year indexed special holidays resolved
+    for the common (or a subdivision) holidays and the requested categories.
+
+    The methods are looked up by name on each population, so the class level
+    method replacements (e.g., profiling) apply to the existing plans.
+    """
+
+    __slots__ = ("method_names", "special_holidays")
+
+    def __init__(
+        self,
+        method_names: tuple[str, ...],
+        special_holidays: dict[int, tuple[tuple[tuple, bool], ...]],
+    ) -> None:
+        self.method_names = method_names
+        self.special_holidays = special_holidays
+
+
+# Hashable representations of the (usually class level) mappings, e.g. special
+# holidays, reused by identity. The mapping is kept as well to keep the id valid.
+_hashable_mappings: dict[int, tuple[dict, Hashable]] = {}
+
+
+def _get_hashable(value: Any) -> Hashable:
+    """Return a hashable representation of an instance attribute value.
+
+    :param value:
+        The attribute value.
+
+    :return:
+        The value itself if it's hashable by value, an equivalent frozen
+        container for containers, a type and attributes pair for objects.
+
+    :raise:
+        TypeError if the value cannot be represented, e.g. for
+        :class:`HolidayBase` instances.
+    """
+    if value is None or isinstance(value, (bool, int, float, str, date, type)):
+        return value
+
+    if isinstance(value, HolidayBase):
+        raise TypeError("HolidayBase instances are not hashable.")
+
+    if isinstance(value, dict):
+        if (cached := _hashable_mappings.get(id(value))) is not None and cached[0] is value:
+            return cached[1]
+        hashable = (type(value), frozenset((k, _get_hashable(v)) for k, v in value.items()))
+        if len(_hashable_mappings) >= 1024:
+            _hashable_mappings.clear()
+        _hashable_mappings[id(value)] = (value, hashable)
+        return hashable
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_get_hashable(v) for v in value)
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_get_hashable(v) for v in value)
+
+    # Helper objects (e.g., lunisolar calendars) are compared by their state.
+    if hasattr(value, "__dict__") and not callable(value):
+        return type(value), _get_hashable(vars(value))
+
+    hash(value)
+    return value
+
+
+# Year indexed special holidays keyed by the (usually class level) mappings ids.
+# The mappings are kept as well to keep the ids valid.
+_special_holidays_indexes: dict[
+    tuple[tuple[int, bool], ...],
+    tuple[tuple[tuple[dict, bool], ...], dict[int, tuple[tuple[tuple, bool], ...]]],
+] = {}
+
+
+def _index_special_holidays(
+    mappings: tuple[tuple[dict, bool], ...],
+) -> dict[int, tuple[tuple[tuple, bool], ...]]:
+    """Index special holidays by year.
+
+    :param mappings:
+        The special holidays mapping and observed flag pairs in order of
+        population.
+
+    :return:
+        The year to special holidays data and observed flag pairs mapping.
+    """
+    key = tuple((id(mapping), observed) for mapping, observed in mappings)
+    if (cached := _special_holidays_indexes.get(key)) is not None and all(
+        mapping is cached_mapping for (mapping, _), (cached_mapping, _) in zip(mappings, cached[0])
+    ):
+        return cached[1]
+
+    special_holidays: dict[int, list[tuple[tuple, bool]]] = {}
+    for mapping, observed in mappings:
+        for year, data in mapping.items():
+            special_holidays.setdefault(year, []).extend(
+                (item, observed) for item in _normalize_tuple(data)
+            )
+    index = {year: tuple(data) for year, data in special_holidays.items()}
+
+    if len(_special_holidays_indexes) >= 1024:
+        _special_holidays_indexes.clear()
+    _special_holidays_indexes[key] = (mappings, index)
+
+    return index
+
+
+def _pack_holidays(
+    holidays: Iterable[tuple[date, str]],
+) -> tuple[array, array, tuple[str, ...]]:
+    """Pack holidays into arrays.
+
+    :param holidays:
+        The holiday date and name pairs sorted by date.
+
+    :return:
+        The date ordinals array, the holiday name indices array and the table
+        of interned holiday names.
+    """
+    ordinals = array("l")
+    name_ids = array("I")
+    names: dict[str, int] = {}
+    for dt, name in holidays:
+        ordinals.append(dt.toordinal())
+        name_ids.append(names.setdefault(sys.intern(name), len(names)))
+
+    return ordinals, name_ids, tuple(names)
+
+
+def _to_date(key: DateLike) -> date:
+    """Transform the date from one of the :data:`DateLike` types to
+    :class:`datetime.date`.
+
+    :param key:
+        The date to transform.
+
+    :return:
+        The transformed date.
+    """
+    # Try to catch `date` and `str` type keys first.
+    # Using type() here to skip date subclasses.
+    # Key is `date`.
+    if type(key) is date:
+        return key
+
+    # Key is `str` instance.
+    if isinstance(key, str):
+        try:
+            return parse(key).date()
+        except (OverflowError, ValueError):
+            raise ValueError(f"Cannot parse date from string '{key}'")
+
+    # Key is `datetime` instance.
+    if isinstance(key, datetime):
+        return key.date()
+
+    # Must go after the `isinstance(key, datetime)` check as datetime is `date` subclass.
+    if isinstance(key, date):
+        return key
+
+    # Key is `float` or `int` instance.
+    if isinstance(key, (float, int)):
+        return datetime.fromtimestamp(key, timezone.utc).date()
+
+    # Key is not supported.
+    raise TypeError(f"Cannot convert type '{type(key)}' to date.")
 
 
 class HolidayBase(dict[date, str]):
@@ -221,8 +488,12 @@ class HolidayBase(dict[date, str]):
     expand: bool
     """Whether the entire year is calculated when one date from that year
     is requested."""
+    max_years: Optional[int] = None
+    """The maximum number of populated years kept, None for unlimited."""
     observed: bool
     """Whether dates when public holiday are observed are included."""
+    thread_safe: bool = False
+    """Whether the years expansion is synchronized between threads."""
     subdiv: Optional[str] = None
     """The subdiv requested as ISO 3166-2 code or one of the aliases."""
     special_holidays: dict[int, Union[SpecialHoliday, SubstitutedHoliday]] = {}
@@ -243,6 +514,10 @@ class HolidayBase(dict[date, str]):
     """Requested holiday categories."""
     supported_categories: tuple[str, ...] = (PUBLIC,)
     """All holiday categories supported by this entity."""
+    subdivision_independent_categories: tuple[str, ...] = ()
+    """The holiday categories whose entity-wide holidays (populated by the
+    non ``_populate_subdiv_*`` methods) don't depend on the subdivision, see
+    :meth:`get_subdivisions_holidays`."""
     supported_languages: tuple[str, ...] = ()
     """All languages supported by this entity."""
 
@@ -256,6 +531,8 @@ class HolidayBase(dict[date, str]):
         state: Optional[str] = None,  # Deprecated.
         language: Optional[str] = None,
         categories: Optional[CategoryArg] = None,
+        thread_safe: bool = False,
+        max_years: Optional[int] = None,
     ) -> None:
         """
         :param years:
@@ -289,6 +566,19 @@ class HolidayBase(dict[date, str]):
         :param categories:
             Requested holiday categories.
 
+        :param thread_safe:
+            Whether the instance is going to be shared between threads. The
+            years expansion is serialized with a lock, while lookups of the
+            already populated years stay lock-free. Other instance
+            modifications are not synchronized.
+
+        :param max_years:
+            The maximum number of populated years to keep. When exceeded, the
+            least recently used year holidays are evicted and populated again
+            on demand (for ``expand=True``). Manual changes made to evicted
+            years holidays are not preserved. Use :meth:`years_cache_info` to
+            get the usage statistics.
+
         :return:
             A :class:`HolidayBase` object matching the **country**.
         """
@@ -301,6 +591,9 @@ class HolidayBase(dict[date, str]):
         if not self.default_category and not categories:
             raise ValueError("Categories cannot be empty if `default_category` is not set.")
 
+        if max_years is not None and max_years < 1:
+            raise ValueError("The maximum number of years must be positive.")
+
         categories = _normalize_arguments(str, categories) or {self.default_category}
         if unknown_categories := categories.difference(  # type: ignore[union-attr]
             self.supported_categories
@@ -356,26 +649,22 @@ class HolidayBase(dict[date, str]):
         self.has_special_holidays = getattr(self, "has_special_holidays", False)
         self.has_substituted_holidays = has_substituted_holidays
         self.language = language.lower() if language else None
+        self.max_years = max_years
         self.observed = observed
         self.subdiv = subdiv
+        self.thread_safe = thread_safe
         self.weekend_workdays = set()
 
-        supported_languages = set(self.supported_languages)
-        self.tr = (
-            translation(
-                self._entity_code,
-                fallback=language not in supported_languages,
-                languages=[language] if language in supported_languages else None,
-                localedir=str(Path(__file__).with_name("locale")),
-            ).gettext
-            if self._entity_code is not None
-            else gettext
-        )
+        self._init_translation(language)
         self.years = _normalize_arguments(int, years)
 
+        # Names of the attributes set by `_populate` itself.
+        self._population_attributes: set[str] = set()
+        self._init_caches()
+
         # Populate holidays.
-        for year in self.years:
-            self._populate(year)
+        for year in sorted(self.years):
+            self._populate_year(year)
 
     def __add__(self, other: Union[int, "HolidayBase", "HolidaySum"]) -> "HolidayBase":
         """Add another dictionary of public holidays creating a
@@ -417,6 +706,13 @@ class HolidayBase(dict[date, str]):
 
         return dict.__contains__(cast("Dict[Any, Any]", self), self.__keytransform__(key))
 
+    def __delitem__(self, key: DateLike) -> None:
+        dt = self.__keytransform__(key)
+        if self._touched_dates is None:
+            self._modify_year(dt.year)
+
+        dict.__delitem__(self, dt)
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, HolidayBase):
             return False
@@ -582,39 +878,17 @@ class HolidayBase(dict[date, str]):
 
         to :class:`datetime.date`, which is how it's stored by the class."""
 
-        # Try to catch `date` and `str` type keys first.
-        # Using type() here to skip date subclasses.
-        # Key is `date`.
-        if type(key) is date:
-            dt = key
-
-        # Key is `str` instance.
-        elif isinstance(key, str):
-            try:
-                dt = parse(key).date()
-            except (OverflowError, ValueError):
-                raise ValueError(f"Cannot parse date from string '{key}'")
-
-        # Key is `datetime` instance.
-        elif isinstance(key, datetime):
-            dt = key.date()
-
-        # Must go after the `isinstance(key, datetime)` check as datetime is `date` subclass.
-        elif isinstance(key, date):
-            dt = key
-
-        # Key is `float` or `int` instance.
-        elif isinstance(key, (float, int)):
-            dt = datetime.fromtimestamp(key, timezone.utc).date()
+        if (recorder := metrics._recorder) is not None:
+            recorder.record_lookup(self, key)
 
-        # Key is not supported.
-        else:
-            raise TypeError(f"Cannot convert type '{type(key)}' to date.")
+        # Using type() here to skip date subclasses.
+        dt = key if type(key) is date else _to_date(key)
 
         # Automatically expand for `expand=True` cases.
-        if self.expand and dt.year not in self.years:
-            self.years.add(dt.year)
-            self._populate(dt.year)
+        if self.max_years is not None:
+            self._use_year(dt.year)
+        elif self.expand and dt.year not in self.years:
+            self._add_year(dt.year)
 
         return dt
 
@@ -632,7 +906,22 @@ class HolidayBase(dict[date, str]):
         return self.__add__(other)
 
     def __reduce__(self) -> Union[str, tuple[Any, ...]]:
-        return super().__reduce__()
+        # Only the instance state and the populated years list are serialized
+        # if the holidays can be restored by population (e.g., from the year
+        # population cache), otherwise the holidays are packed into arrays.
+        state = {
+            name: value for name, value in self.__dict__.items() if name not in _derived_attributes
+        }
+        packed = (
+            None
+            if self._matches_population()
+            else (
+                *_pack_holidays(sorted(self.items())),
+                array("l", sorted(dt.toordinal() for dt in self.weekend_workdays)),
+            )
+        )
+
+        return _restore_holidays, (self.__class__, state, sorted(self.years), packed)
 
     def __repr__(self) -> str:
         if self:
@@ -655,10 +944,22 @@ class HolidayBase(dict[date, str]):
     def __setattr__(self, key: str, value: Any) -> None:
         dict.__setattr__(self, key, value)
 
+        # The instance state change outside of population process invalidates
+        # the population key and plans.
+        if self.__dict__.get("_touched_dates") is None:
+            self.__dict__.pop("_population_key", None)
+            self.__dict__.pop("_sorted_categories", None)
+            if population_plans := self.__dict__.get("_population_plans"):
+                population_plans.clear()
+            if working_days := self.__dict__.get("_working_days"):
+                working_days.clear()
+
         if self and key in {"categories", "observed"}:
-            self.clear()
-            for year in self.years:  # Re-populate holidays for each year.
-                self._populate(year)
+            with self._expansion_lock or nullcontext():
+                self.clear()
+                for year in self.years:  # Re-populate holidays for each year.
+                    self._populate_year(year)
+                self._modified_years.clear()
 
     def __setitem__(self, key: DateLike, value: str) -> None:
         if key in self:
@@ -668,7 +969,13 @@ class HolidayBase(dict[date, str]):
             holiday_names.update(value.split(HOLIDAY_NAME_DELIMITER))
             value = HOLIDAY_NAME_DELIMITER.join(sorted(holiday_names))
 
-        dict.__setitem__(self, self.__keytransform__(key), value)
+        dt = self.__keytransform__(key)
+        if self._touched_dates is not None:
+            self._touched_dates[dt] = None
+        else:
+            self._modify_year(dt.year)
+
+        dict.__setitem__(self, dt, value)
 
     def __str__(self) -> str:
         if self:
@@ -712,7 +1019,57 @@ class HolidayBase(dict[date, str]):
             .lower()
         )
 
-    @property
+    @cached_property
+    def _population_key(self) -> Optional[Hashable]:
+        """The key identifying the instance population parameters.
+
+        The key consists of the entity class, the translation files in use and
+        the instance state (e.g., subdivision, observed rules, special holidays,
+        entity specific arguments) excluding the attributes set by population
+        itself. Categories and the observed flag are added per lookup.
+
+        None is returned if the instance state cannot be represented and the
+        population results must not be shared.
+        """
+        excluded_attributes = self._population_attributes | {
+            "_expanding_years",
+            "_expansion_lock",
+            "_modified_years",
+            "_population_attributes",
+            "_population_plans",
+            "_years_lru",
+            "_years_stats",
+            "_sorted_categories",
+            "_touched_dates",
+            "_translation_files",
+            "_weekend_workdays_count",
+            "_working_days",
+            "_year",
+            "_year_entries",
+            "categories",
+            "expand",
+            "language",
+            "max_years",
+            "observed",
+            "thread_safe",
+            "tr",
+            "weekend_workdays",
+            "years",
+        }
+        try:
+            return (
+                self.__class__,
+                self._translation_files,
+                frozenset(
+                    (name, _get_hashable(value))
+                    for name, value in self.__dict__.items()
+                    if name not in excluded_attributes
+                ),
+            )
+        except TypeError:
+            return None
+
+    @cached_property
     def _sorted_categories(self):
         return (
             [self.default_category] + sorted(self.categories - {self.default_category})
@@ -729,12 +1086,230 @@ class HolidayBase(dict[date, str]):
 
         return subdivision_aliases
 
+    @classmethod
+    def get_subdivisions_holidays(
+        cls, subdivs: Optional[Iterable[str]] = None, years: Optional[YearArg] = None, **kwargs
+    ) -> dict[str, "HolidayBase"]:
+        """Get holidays for multiple entity subdivisions at once.
+
+        The entity common holidays are populated once per year and shared
+        between the subdivisions, only the subdivision specific holidays are
+        populated on top of them for each subdivision. The subdivisions are
+        populated independently unless all the requested categories are
+        declared as :attr:`subdivision_independent_categories` and the entity
+        doesn't override :meth:`_populate`.
+
+        :param subdivs:
+            The subdivisions to get holidays for. All entity subdivisions
+            are used by default.
+
+        :param years:
+            The year(s) to pre-calculate holidays for at instantiation.
+
+        :param kwargs:
+            Other entity arguments (e.g., ``categories``, ``language``,
+            ``observed``).
+
+        :return:
+            A subdivision to its holidays object mapping.
+        """
+        subdivisions_holidays = {
+            subdiv: cls(subdiv=subdiv, **kwargs)
+            for subdiv in (cls.subdivisions if subdivs is None else subdivs)
+        }
+        years_to_populate = _normalize_arguments(int, years)
+        if not subdivisions_holidays or not years_to_populate:
+            return subdivisions_holidays
+
+        common_holidays = cls(**kwargs)
+        is_shareable = (
+            cls._populate is HolidayBase._populate
+            and common_holidays.categories.issubset(cls.subdivision_independent_categories)
+        )
+        common_layers: dict[int, YearData] = {}
+
+        def get_common_layer(year: int) -> YearData:
+            if year not in common_layers:
+                common_layers[year] = common_holidays._populate_common_layer(year)
+            return common_layers[year]
+
+        for subdiv_holidays in subdivisions_holidays.values():
+            subdiv_holidays.years.update(years_to_populate)
+            is_shared = is_shareable
+            for year in years_to_populate:
+                if not is_shared:
+                    subdiv_holidays._populate_year(year)
+                    continue
+
+                attributes = subdiv_holidays._populate_year(year, partial(get_common_layer, year))[
+                    2
+                ]
+                # The instance state changed by subdivision holidays population
+                # (except for the derived and subdivision cached attributes)
+                # may affect the next years common holidays.
+                if attributes:
+                    common_attributes = dict(get_common_layer(year)[2])
+                    is_shared = all(
+                        name in _derived_attributes
+                        or name == "_normalized_subdiv"
+                        or (name in common_attributes and common_attributes[name] == value)
+                        for name, value in attributes
+                    )
+
+        return subdivisions_holidays
+
     def _is_leap_year(self) -> bool:
         """
         Returns True if the year is leap. Returns False otherwise.
         """
         return isleap(self._year)
 
+    def _init_translation(self, language: Optional[str]) -> None:
+        """Set up the holiday names translation.
+
+        :param language:
+            The requested language code.
+        """
+        supported_languages = set(self.supported_languages)
+        if self._entity_code is not None:
+            languages = [language] if language in supported_languages else None
+            localedir = str(Path(__file__).with_name("locale"))
+            self.tr: Callable[[str], str] = translation(
+                self._entity_code,
+                fallback=language not in supported_languages,
+                languages=languages,
+                localedir=localedir,
+            ).gettext
+            self._translation_files = tuple(
+                find(self._entity_code, localedir, languages, all=True)
+            )
+        else:
+            self.tr = gettext
+            self._translation_files = ()
+
+        if (recorder := metrics._recorder) is not None:
+            self.tr = recorder.wrap_translation(self, self.tr)
+
+    def _init_caches(self) -> None:
+        """Set up the per instance population caches and synchronization."""
+        self._touched_dates: Optional[dict[date, None]] = None
+        # Per year population results for instances that can't share them.
+        self._year_entries: dict[Hashable, YearData] = {}
+        # Population plans for common (None key) and subdivision holidays.
+        self._population_plans: dict[Optional[str], _PopulationPlan] = {}
+
+        # Per year working days bitmaps, the years changed outside population
+        # (can't use the shared bitmaps) and the weekend workdays count the
+        # bitmaps are valid for.
+        self._working_days: dict[int, bytes] = {}
+        self._modified_years: set[int] = set()
+        self._weekend_workdays_count = 0
+
+        # Years expansion lock and the years being populated (thread-safe mode).
+        self._expansion_lock = RLock() if self.thread_safe else None
+        self._expanding_years: set[int] = set()
+
+        # Populated years in least recently used order and their usage
+        # statistics (bounded mode).
+        self._years_lru: OrderedDict[int, None] = OrderedDict()
+        self._years_stats: Counter[str] = Counter()
+
+    def _matches_population(self) -> bool:
+        """Return True if the holidays are exactly the populated years ones,
+        i.e., there are no manual changes and the year population results are
+        still cached.
+        """
+        population_key = self._population_key
+        categories = frozenset(self.categories)
+        weekend_workdays: set[date] = set()
+        holidays_count = 0
+        for year in self.years:
+            key = (population_key, year, categories, self.observed)
+            year_data = (
+                self._year_entries.get(key)
+                if population_key is None
+                else _population_cache.get(key)
+            )
+            if year_data is None:
+                return False
+
+            entries, year_weekend_workdays, _ = year_data
+            for dt, name in entries:
+                if dict.get(self, dt) != name:
+                    return False
+            holidays_count += len(entries)
+            weekend_workdays.update(year_weekend_workdays)
+
+        return holidays_count == len(self) and weekend_workdays == self.weekend_workdays
+
+    def _add_year(self, year: int) -> None:
+        """Add a year to the populated ones and populate its holidays.
+
+        In thread-safe mode the year is published (added to :attr:`years`)
+        only after its population is complete, the lock is reentrant for the
+        holidays added during the year population.
+
+        :param year:
+            The year to populate with holidays.
+        """
+        if (recorder := metrics._recorder) is not None:
+            recorder.record(self, ("expansions", year))
+
+        if self._expansion_lock is None:
+            self.years.add(year)
+            self._populate_year(year)
+            return None
+
+        with self._expansion_lock:
+            # The year could have been populated by another thread meanwhile.
+            if year in self.years or year in self._expanding_years:
+                return None
+
+            self._expanding_years.add(year)
+            try:
+                self._populate_year(year)
+                self.years.add(year)
+            finally:
+                self._expanding_years.discard(year)
+
+    def _use_year(self, year: int) -> None:
+        """Mark a year as the most recently used one, populate it if needed
+        and update the usage statistics (bounded mode).
+
+        :param year:
+            The year being looked up.
+        """
+        with self._expansion_lock or nullcontext():
+            if year in self._years_lru:
+                self._years_lru.move_to_end(year)
+                self._years_stats["hits"] += 1
+                if (recorder := metrics._recorder) is not None:
+                    recorder.record(self, ("years_cache", "hits"))
+            elif self.expand and year not in self.years and year not in self._expanding_years:
+                self._years_stats["misses"] += 1
+                if (recorder := metrics._recorder) is not None:
+                    recorder.record(self, ("years_cache", "misses"))
+                self._add_year(year)
+
+    def _evict_year(self, year: int) -> None:
+        """Remove a populated year holidays (bounded mode).
+
+        :param year:
+            The year to evict.
+        """
+        self._check_weekend_workdays()
+        for dt in [dt for dt in self if dt.year == year]:
+            dict.__delitem__(self, dt)
+        self.weekend_workdays.difference_update(
+            [dt for dt in self.weekend_workdays if dt.year == year]
+        )
+        self.years.discard(year)
+        self._reset_working_days(year)
+        self._modified_years.discard(year)
+        self._years_stats["evictions"] += 1
+        if (recorder := metrics._recorder) is not None:
+            recorder.record(self, ("years_cache", "evictions"))
+
     def _add_holiday(self, name: str, *args) -> Optional[date]:
         """Add a holiday."""
         if not args:
@@ -749,29 +1324,30 @@ class HolidayBase(dict[date, str]):
         self[dt] = self.tr(name)
         return dt
 
-    def _add_special_holidays(self, mapping_names, observed=False):
-        """Add special holidays."""
-        for mapping_name in mapping_names:
-            for data in _normalize_tuple(getattr(self, mapping_name, {}).get(self._year, ())):
-                if len(data) == 3:  # Special holidays.
-                    month, day, name = data
-                    self._add_holiday(
-                        self.tr(self.observed_label) % self.tr(name)
-                        if observed
-                        else self.tr(name),
-                        month,
-                        day,
-                    )
-                else:  # Substituted holidays.
-                    to_month, to_day, from_month, from_day, *optional = data
-                    from_date = date(optional[0] if optional else self._year, from_month, from_day)
-                    self._add_holiday(
-                        self.tr(self.substituted_label)
-                        % from_date.strftime(self.tr(self.substituted_date_format)),
-                        to_month,
-                        to_day,
-                    )
-                    self.weekend_workdays.add(from_date)
+    def _add_special_holidays(self, special_holidays: Iterable[tuple[tuple, bool]]) -> None:
+        """Add special holidays.
+
+        :param special_holidays:
+            The special (or substituted) holidays data and observed flag pairs.
+        """
+        for data, observed in special_holidays:
+            if len(data) == 3:  # Special holidays.
+                month, day, name = data
+                self._add_holiday(
+                    self.tr(self.observed_label) % self.tr(name) if observed else self.tr(name),
+                    month,
+                    day,
+                )
+            else:  # Substituted holidays.
+                to_month, to_day, from_month, from_day, *optional = data
+                from_date = date(optional[0] if optional else self._year, from_month, from_day)
+                self._add_holiday(
+                    self.tr(self.substituted_label)
+                    % from_date.strftime(self.tr(self.substituted_date_format)),
+                    to_month,
+                    to_day,
+                )
+                self.weekend_workdays.add(from_date)
 
     def _check_weekday(self, weekday: int, *args) -> bool:
         """
@@ -812,6 +1388,122 @@ class HolidayBase(dict[date, str]):
         dt = dt if isinstance(dt, date) else date(self._year, *dt)
         return dt.weekday() in self.weekend
 
+    def _get_year_weekend(self, year: int) -> set[int]:
+        """Return a populated year weekend days.
+
+        The weekend may be changed during a year population (e.g., the
+        weekend change date is taken into account), the current
+        :attr:`weekend` is returned if the year population didn't change it
+        or its results are no longer cached.
+        """
+        population_key = self._population_key
+        key = (population_key, year, frozenset(self.categories), self.observed)
+        year_data = (
+            self._year_entries.get(key) if population_key is None else _population_cache.get(key)
+        )
+        if year_data is not None:
+            for name, value in year_data[2]:
+                if name == "weekend":
+                    return value
+
+        return self.weekend
+
+    def _check_weekend_workdays(self) -> None:
+        """Invalidate the working days bitmaps if the weekend workdays were
+        changed directly (not by population)."""
+        if len(self.weekend_workdays) != self._weekend_workdays_count:
+            self._working_days.clear()
+            self._modified_years.update(self.years)
+            dict.__setattr__(self, "_weekend_workdays_count", len(self.weekend_workdays))
+
+    def _modify_year(self, year: int) -> None:
+        """Mark a year as changed outside of population."""
+        self._modified_years.add(year)
+        self._working_days.pop(year, None)
+
+    def _reset_working_days(self, year: int) -> None:
+        """Invalidate a (re)populated or evicted year working days bitmaps.
+
+        The previous year bitmap is invalidated as well as the year
+        population may add the previous year weekend workdays.
+        """
+        self._working_days.pop(year, None)
+        self._working_days.pop(year - 1, None)
+        dict.__setattr__(self, "_weekend_workdays_count", len(self.weekend_workdays))
+
+    def _build_working_days_bitmap(self, year: int, entries: Optional[Iterable[date]]) -> bytes:
+        """Build a year working days bitmap.
+
+        :param year:
+            The year to build the bitmap for.
+
+        :param entries:
+            The year holidays if known (e.g., the year population results),
+            otherwise all the holidays are looked through.
+
+        :return:
+            The year working days bitmap.
+        """
+        weekend = self._get_year_weekend(year)
+        start = date(year, 1, 1).toordinal()
+        # The weekday of ordinal 1 (0001-01-01) is Monday.
+        bitmap = bytearray(
+            (ordinal - 1) % 7 not in weekend
+            for ordinal in range(start, start + (366 if isleap(year) else 365))
+        )
+        for dt in self if entries is None else entries:
+            if dt.year == year:
+                bitmap[dt.toordinal() - start] = 0
+        for dt in self.weekend_workdays:
+            if dt.year == year and dt.weekday() in weekend:
+                bitmap[dt.toordinal() - start] = 1
+
+        return bytes(bitmap)
+
+    def _get_working_days_bitmap(self, year: int) -> bytes:
+        """Return a year working days bitmap.
+
+        The bitmap has a byte per year day: 1 for working days and 0 for
+        weekends (w/o weekend workdays) and holidays. The year is populated
+        first if needed (the weekend workdays added by the next year
+        population are taken into account only if it's populated). The
+        bitmaps of the years not changed outside of population are shared
+        between the instances having the same population parameters.
+
+        :param year:
+            The year to get the bitmap for.
+
+        :return:
+            The year working days bitmap.
+        """
+        self._check_weekend_workdays()
+        if (bitmap := self._working_days.get(year)) is not None:
+            return bitmap
+
+        if self.max_years is not None:
+            self._use_year(year)
+        elif self.expand and year not in self.years:
+            self._add_year(year)
+
+        population_key = self._population_key
+        if population_key is None or year not in self.years or year in self._modified_years:
+            bitmap = self._build_working_days_bitmap(year, None)
+        else:
+            categories = frozenset(self.categories)
+            key = (population_key, year, categories, self.observed, year + 1 in self.years)
+            if (bitmap := _working_days_cache.get(key)) is None:
+                year_data = _population_cache.get(
+                    (population_key, year, categories, self.observed)
+                )
+                bitmap = self._build_working_days_bitmap(
+                    year, None if year_data is None else (dt for dt, _ in year_data[0])
+                )
+                _working_days_cache.set(key, bitmap)
+
+        self._working_days[year] = bitmap
+
+        return bitmap
+
     def _populate(self, year: int) -> None:
         """This is a private class that populates (generates and adds) holidays
         for a given year. To keep things fast, it assumes that no holidays for
@@ -833,44 +1525,284 @@ class HolidayBase(dict[date, str]):
         self._populate_common_holidays()
         self._populate_subdiv_holidays()
 
+    def _populate_year(
+        self, year: int, common_layer: Optional[Callable[[], YearData]] = None
+    ) -> YearData:
+        """Populate holidays for a given year.
+
+        The entries generated by :meth:`_populate` are cached per year,
+        categories and ``observed`` value. The cache is shared between the
+        instances with equal population parameters, so repeated instance
+        creation as well as ``observed`` and ``categories`` toggling reuse
+        previously generated entries instead of populating them again.
+
+        :param year:
+            The year to populate with holidays.
+
+        :param common_layer:
+            The callable returning the year common holidays layer (see
+            :meth:`_populate_common_layer`). If provided, only subdivision
+            holidays are populated on top of it.
+
+        :return:
+            The year population results.
+        """
+
+        self._check_weekend_workdays()
+
+        def populate():
+            if common_layer is None:
+                self._populate(year)
+            else:
+                self._load_year(year, common_layer())
+                self._populate_subdiv_holidays()
+
+        year_data = self._get_year_data(
+            year, (frozenset(self.categories), self.observed), populate
+        )
+        self._reset_working_days(year)
+
+        if self.max_years is not None:
+            years_lru = self._years_lru
+            years_lru[year] = None
+            years_lru.move_to_end(year)
+            while len(years_lru) > self.max_years:
+                self._evict_year(years_lru.popitem(last=False)[0])
+
+        return year_data
+
+    def _populate_common_layer(self, year: int) -> YearData:
+        """Populate entity common holidays (w/o subdivision ones) for a given year.
+
+        :param year:
+            The year to populate with common holidays.
+
+        :return:
+            The year common holidays population results.
+        """
+
+        # Prevent the year full population on its holidays addition.
+        self.years.add(year)
+
+        def populate():
+            self._year = year
+            self._populate_common_holidays()
+
+        return self._get_year_data(
+            year, (frozenset(self.categories), self.observed, "common"), populate
+        )
+
+    def _get_year_data(self, year: int, key: tuple, populate: Callable[[], None]) -> YearData:
+        """Get cached year population results or populate and cache them.
+
+        :param year:
+            The year to get population results for.
+
+        :param key:
+            The population results key (w/o population key and year parts).
+
+        :param populate:
+            The callable performing the actual population.
+
+        :return:
+            The year population results.
+        """
+        population_key = self._population_key
+        key = (population_key, year, *key)
+        if population_key is None:
+            year_data = self._year_entries.get(key)
+        else:
+            year_data = _population_cache.get(key)
+
+        recorder = metrics._recorder
+        if year_data is None:
+            attributes_before = dict(self.__dict__)
+            weekend_workdays_before = frozenset(self.weekend_workdays)
+            touched_dates: dict[date, None] = {}
+            dict.__setattr__(self, "_touched_dates", touched_dates)
+            started_at = perf_counter() if recorder is not None else 0.0
+            try:
+                populate()
+            finally:
+                dict.__setattr__(self, "_touched_dates", None)
+
+            if recorder is not None:
+                recorder.record(self, ("populate_time",), perf_counter() - started_at)
+                recorder.record(self, ("populations",))
+                recorder.record(self, ("population_cache", "misses"))
+
+            year_data = (
+                tuple(
+                    (dt, dict.__getitem__(self, dt))
+                    for dt in touched_dates
+                    if dict.__contains__(self, dt)
+                ),
+                frozenset(self.weekend_workdays) - weekend_workdays_before,
+                tuple(
+                    (name, value)
+                    for name, value in self.__dict__.items()
+                    if name != "_year" and attributes_before.get(name) is not value
+                ),
+            )
+            if population_key is None:
+                self._year_entries[key] = year_data
+            else:
+                _population_cache.set(key, year_data)
+        else:
+            self._load_year(year, year_data)
+            if recorder is not None:
+                recorder.record(self, ("population_cache", "hits"))
+
+        self._population_attributes.update(name for name, _ in year_data[2])
+
+        return year_data
+
+    def _load_year(self, year: int, year_data: YearData) -> None:
+        """Load previously generated year population results.
+
+        :param year:
+            The year the data is generated for.
+
+        :param year_data:
+            The holidays, weekend workdays and instance attributes set
+            during the year population.
+        """
+        entries, weekend_workdays, attributes = year_data
+        dict.__setattr__(self, "_year", year)
+        for name, value in attributes:
+            dict.__setattr__(self, name, value)
+        self.weekend_workdays.update(weekend_workdays)
+        touched_dates = self._touched_dates
+        for dt, name in entries:
+            if touched_dates is not None:
+                touched_dates[dt] = None
+            if dict.__contains__(self, dt):
+                self[dt] = name  # Merge with existing holiday names.
+            else:
+                dict.__setitem__(self, dt, name)
+
+    def _get_population_plan(self, subdiv: Optional[str] = None) -> _PopulationPlan:
+        """Get the entity holidays population plan.
+
+        The populate method names and special holidays mappings are resolved once
+        per subdivision and categories set, the special holidays are indexed
+        by year.
+
+        :param subdiv:
+            The normalized subdivision code, None for the common holidays.
+
+        :return:
+            The population plan.
+        """
+        if (plan := self._population_plans.get(subdiv)) is not None:
+            return plan
+
+        prefix = "_populate" if subdiv is None else f"_populate_subdiv_{subdiv}"
+        cls = self.__class__
+        method_names = tuple(
+            name
+            for category in self._sorted_categories
+            if hasattr(cls, name := f"{prefix}_{category.lower()}_holidays")
+        )
+
+        special_holidays = (
+            _index_special_holidays(
+                tuple(
+                    (mapping, observed)
+                    for mapping_name, observed in self._get_special_holidays_mapping_names(subdiv)
+                    if (mapping := getattr(self, mapping_name, None))
+                )
+            )
+            if self.has_special_holidays
+            else {}
+        )
+
+        plan = _PopulationPlan(method_names, special_holidays)
+        self._population_plans[subdiv] = plan
+
+        return plan
+
+    def _get_special_holidays_mapping_names(
+        self, subdiv: Optional[str] = None
+    ) -> Iterable[tuple[str, bool]]:
+        """Get special holidays mapping names in order of population.
+
+        :param subdiv:
+            The normalized subdivision code, None for the common holidays.
+
+        :return:
+            The special holidays mapping name and observed flag pairs.
+        """
+        if subdiv is None:
+            return (
+                (f"special_{category}_holidays", False) for category in self._sorted_categories
+            )
+
+        return (
+            (f"special_{subdiv}_{category.lower()}_holidays", False)
+            for category in self._sorted_categories
+        )
+
     def _populate_common_holidays(self):
         """Populate entity common holidays."""
-        for category in self._sorted_categories:
-            if pch_method := getattr(self, f"_populate_{category.lower()}_holidays", None):
-                pch_method()
+        plan = self._get_population_plan()
+        for name in plan.method_names:
+            getattr(self, name)()
 
-        if self.has_special_holidays:
-            self._add_special_holidays(
-                f"special_{category}_holidays" for category in self._sorted_categories
-            )
+        if special_holidays := plan.special_holidays.get(self._year):
+            self._add_special_holidays(special_holidays)
 
     def _populate_subdiv_holidays(self):
         """Populate entity subdivision holidays."""
         if self.subdiv is None:
             return None
 
-        for category in self._sorted_categories:
-            if asch_method := getattr(
-                self,
-                f"_populate_subdiv_{self._normalized_subdiv}_{category.lower()}_holidays",
-                None,
-            ):
-                asch_method()
+        plan = self._get_population_plan(self._normalized_subdiv)
+        for name in plan.method_names:
+            getattr(self, name)()
 
-        if self.has_special_holidays:
-            self._add_special_holidays(
-                f"special_{self._normalized_subdiv}_{category.lower()}_holidays"
-                for category in self._sorted_categories
-            )
+        if special_holidays := plan.special_holidays.get(self._year):
+            self._add_special_holidays(special_holidays)
 
     def append(self, *args: Union[dict[DateLike, str], list[DateLike], DateLike]) -> None:
         """Alias for :meth:`update` to mimic list type."""
         return self.update(*args)
 
+    def clear(self) -> None:
+        """Remove all holidays (the populated years are kept)."""
+        dict.clear(self)
+        self._working_days.clear()
+        self._modified_years.update(self.years)
+
     def copy(self):
         """Return a copy of the object."""
         return copy.copy(self)
 
+    def freeze(self, years: Optional[YearArg] = None) -> "FrozenHolidays":
+        """Return an immutable and hashable snapshot of the holidays.
+
+        :param years:
+            The year(s) to include into the snapshot. All populated years are
+            used by default. The years not populated yet are populated first.
+
+        :return:
+            A :class:`FrozenHolidays` object.
+        """
+        from holidays.frozen_holidays import FrozenHolidays
+
+        years_to_freeze = set(self.years if years is None else _normalize_arguments(int, years))
+        if self.max_years is not None:
+            if len(years_to_freeze) > self.max_years:
+                raise ValueError(f"Cannot freeze more than {self.max_years} years.")
+            # Prevent the years to freeze eviction.
+            for year in sorted(years_to_freeze & self._years_lru.keys()):
+                self._years_lru.move_to_end(year)
+
+        for year in sorted(years_to_freeze - self.years):
+            self._add_year(year)
+
+        return FrozenHolidays(self, years_to_freeze)
+
     def get(self, key: DateLike, default: Union[str, Any] = None) -> Union[str, Any]:
         """Return the holiday name for a date if date is a holiday, else
         default. If default is not given, it defaults to None, so that this
@@ -966,14 +1898,66 @@ class HolidayBase(dict[date, str]):
         """Return n-th working day from provided date (if n is positive)
         or n-th working day before provided date (if n is negative).
         """
-        direction = +1 if n > 0 else -1
         dt = self.__keytransform__(key)
-        for _ in range(abs(n)):
-            dt = _timedelta(dt, direction)
-            while not self.is_working_day(dt):
-                dt = _timedelta(dt, direction)
+        year = dt.year
+        idx = dt.toordinal() - date(year, 1, 1).toordinal()
+        remaining = abs(n)
+        while remaining:
+            bitmap = self._get_working_days_bitmap(year)
+            if n > 0:
+                count = bitmap.count(1, idx + 1)
+                if count < remaining:
+                    remaining -= count
+                    year += 1
+                    idx = -1
+                    continue
+                for _ in range(remaining):
+                    idx = bitmap.index(1, idx + 1)
+            else:
+                count = bitmap.count(1, 0, idx)
+                if count < remaining:
+                    remaining -= count
+                    year -= 1
+                    idx = 366 if isleap(year) else 365
+                    continue
+                for _ in range(remaining):
+                    idx = bitmap.rindex(1, 0, idx)
+            return date.fromordinal(date(year, 1, 1).toordinal() + idx)
+
         return dt
 
+    def get_working_days(self, start: DateLike, end: DateLike) -> list[date]:
+        """Return the working days between two dates.
+
+        The date range works in a closed interval fashion [start, end] so both
+        endpoints are included.
+
+        :param start:
+            The range start date.
+
+        :param end:
+            The range end date.
+
+        :return:
+            The sorted list of working days.
+        """
+        dt1 = self.__keytransform__(start)
+        dt2 = self.__keytransform__(end)
+        if dt1 > dt2:
+            dt1, dt2 = dt2, dt1
+
+        working_days: list[date] = []
+        for year in range(dt1.year, dt2.year + 1):
+            bitmap = self._get_working_days_bitmap(year)
+            year_start = date(year, 1, 1).toordinal()
+            first = dt1.toordinal() - year_start if year == dt1.year else 0
+            last = dt2.toordinal() - year_start if year == dt2.year else len(bitmap) - 1
+            working_days.extend(
+                date.fromordinal(year_start + idx) for idx in range(first, last + 1) if bitmap[idx]
+            )
+
+        return working_days
+
     def get_working_days_count(self, start: DateLike, end: DateLike) -> int:
         """Return the number of working days between two dates.
 
@@ -990,13 +1974,30 @@ class HolidayBase(dict[date, str]):
         dt2 = self.__keytransform__(end)
         if dt1 > dt2:
             dt1, dt2 = dt2, dt1
-        days = (dt2 - dt1).days + 1
-        return sum(self.is_working_day(_timedelta(dt1, n)) for n in range(days))
+
+        count = 0
+        for year in range(dt1.year, dt2.year + 1):
+            bitmap = self._get_working_days_bitmap(year)
+            year_start = date(year, 1, 1).toordinal()
+            count += bitmap.count(
+                1,
+                dt1.toordinal() - year_start if year == dt1.year else 0,
+                dt2.toordinal() - year_start + 1 if year == dt2.year else len(bitmap),
+            )
+
+        return count
 
     def is_working_day(self, key: DateLike) -> bool:
-        """Return True if date is a working day (not a holiday or a weekend)."""
+        """Return True if date is a working day (not a holiday or a weekend).
+
+        The date year weekend is used (see :meth:`_get_year_weekend`).
+        """
         dt = self.__keytransform__(key)
-        return dt in self.weekend_workdays if self._is_weekend(dt) else dt not in self
+        return (
+            dt in self.weekend_workdays
+            if dt.weekday() in self._get_year_weekend(dt.year)
+            else dt not in self
+        )
 
     def pop(self, key: DateLike, default: Union[str, Any] = None) -> Union[str, Any]:
         """If date is a holiday, remove it and return its date, else return
@@ -1021,10 +2022,16 @@ class HolidayBase(dict[date, str]):
         :raise:
             KeyError if date is not a holiday and default is not given.
         """
+        dt = self.__keytransform__(key)
+        if self._touched_dates is not None:
+            self._touched_dates[dt] = None
+        else:
+            self._modify_year(dt.year)
+
         if default is None:
-            return dict.pop(self, self.__keytransform__(key))
+            return dict.pop(self, dt)
 
-        return dict.pop(self, self.__keytransform__(key), default)
+        return dict.pop(self, dt, default)
 
     def pop_named(self, name: str) -> list[date]:
         """Remove (no longer treat at as holiday) all dates matching the
@@ -1064,6 +2071,93 @@ class HolidayBase(dict[date, str]):
 
         return popped
 
+    def to_business_hours(self, hours: "WorkingHours" = ("09:00", "17:00")) -> "BusinessHours":
+        """Return a business hours calculator of the working days.
+
+        The business hours durations and deadlines (e.g., of support SLAs)
+        take logarithmic time at most regardless of the datetimes range.
+
+        :param hours:
+            The working hours template, see
+            :class:`holidays.business_hours.BusinessHours`.
+
+        :return:
+            The :class:`holidays.business_hours.BusinessHours` object.
+        """
+        from holidays.business_hours import BusinessHours
+
+        return BusinessHours(self, hours)
+
+    def to_busdaycalendar(self, start: DateLike, end: DateLike, strict: bool = True) -> Any:
+        """Return a NumPy business days calendar of a date range.
+
+        The calendar can be used with the NumPy :func:`numpy.busday_count`,
+        :func:`numpy.busday_offset` and :func:`numpy.is_busday` functions. Its
+        weekmask is derived from the weekend and its holidays are the range
+        holidays. NumPy calendars can't represent the weekend working days
+        (:attr:`weekend_workdays`) or the weekend changes within the range.
+
+        :param start:
+            The range start date.
+
+        :param end:
+            The range end date.
+
+        :param strict:
+            Whether to raise an error if the range working days can't be
+            represented, otherwise the weekend working days are ignored (and
+            the range end weekend is used) with a warning.
+
+        :return:
+            The :class:`numpy.busdaycalendar` object.
+
+        :raise:
+            ValueError if strict and the range working days can't be
+            represented.
+        """
+        import numpy as np
+
+        dt1 = self.__keytransform__(start)
+        dt2 = self.__keytransform__(end)
+        if dt1 > dt2:
+            dt1, dt2 = dt2, dt1
+
+        years = range(dt1.year, dt2.year + 1)
+        for year in years:
+            self.__keytransform__(date(year, 1, 1))  # Populate the range years.
+
+        issues = []
+        weekends = {frozenset(self._get_year_weekend(year)) for year in years}
+        if len(weekends) > 1:
+            issues.append(
+                "the weekend changes ("
+                + ", ".join(
+                    "/".join(day_abbr[day] for day in sorted(weekend))
+                    for weekend in sorted(weekends, key=sorted)
+                )
+                + ")"
+            )
+        if weekend_workdays := sorted(dt for dt in self.weekend_workdays if dt1 <= dt <= dt2):
+            issues.append(
+                "the weekend working days (" + ", ".join(map(str, weekend_workdays)) + ")"
+            )
+        if issues:
+            message = (
+                f"NumPy business days calendar can't represent {' and '.join(issues)} "
+                f"between {dt1} and {dt2}."
+            )
+            if strict:
+                raise ValueError(message)
+            warnings.warn(message)
+
+        weekend = self._get_year_weekend(dt2.year)
+        return np.busdaycalendar(
+            weekmask=[day not in weekend for day in range(7)],
+            holidays=np.array(
+                sorted(dt for dt in self if dt1 <= dt <= dt2), dtype="datetime64[D]"
+            ),
+        )
+
     def update(  # type: ignore[override]
         self, *args: Union[dict[DateLike, str], list[DateLike], DateLike]
     ) -> None:
@@ -1094,6 +2188,17 @@ class HolidayBase(dict[date, str]):
             else:
                 self[arg] = "Holiday"
 
+    def years_cache_info(self) -> YearsCacheInfo:
+        """Return the populated years usage statistics.
+
+        The hits, misses and evictions are counted for the instances with
+        ``max_years`` set only.
+        """
+        stats = self._years_stats
+        return YearsCacheInfo(
+            stats["hits"], stats["misses"], stats["evictions"], self.max_years, len(self.years)
+        )
+
 
 class HolidaySum(HolidayBase):
     """
@@ -1197,3 +2302,54 @@ country_holidays('CA') + country_holidays('MX')
         for operand in self.holidays:
             operand._populate(year)
             self.update(cast("Dict[DateLike, str]", operand))
+
+
+def _restore_holidays(
+    cls: type[HolidayBase],
+    state: dict[str, Any],
+    years: list[int],
+    packed: Optional[tuple[array, array, tuple[str, ...], array]],
+) -> HolidayBase:
+    """Restore pickled :class:`HolidayBase` object.
+
+    :param cls:
+        The holidays class.
+
+    :param state:
+        The instance state w/o derived attributes.
+
+    :param years:
+        The populated years.
+
+    :param packed:
+        The packed holidays (date ordinals, name indices, names table) and
+        weekend workdays ordinals. If None, the years are populated again.
+
+    :return:
+        The restored object.
+    """
+    holidays = cls.__new__(cls)
+    holidays.__dict__.update(state)
+    # The language is stored in lowercase, restore the original code.
+    language = holidays.language
+    holidays._init_translation(
+        next((lang for lang in cls.supported_languages if lang.lower() == language), language)
+    )
+    holidays._init_caches()
+    holidays.__dict__.update(weekend_workdays=set(), years=set(years))
+
+    if packed is None:
+        for year in years:
+            holidays._populate_year(year)
+    else:
+        ordinals, name_ids, names, weekend_workdays = packed
+        dict.update(
+            holidays, zip(map(date.fromordinal, ordinals), map(names.__getitem__, name_ids))
+        )
+        holidays.weekend_workdays.update(map(date.fromordinal, weekend_workdays))
+        # The holidays may differ from the population results.
+        holidays._modified_years.update(years)
+        if holidays.max_years is not None:
+            holidays._years_lru.update(dict.fromkeys(years))
+
+    return holidays
@@ -0,0 +1,303 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+"""Long weekends and bridge days detection.
+
+The long weekends (non-working days runs including a holiday) and the bridge
+days (single working days between a holiday and a non-working day) are found
+by scanning the per year working days bitmaps (see
+:meth:`holidays.holiday_base.HolidayBase.get_working_days`) with byte pattern
+searches, so each entity weekend and weekend working days are honored and
+the calendars of all the entities can be scanned in bulk.
+"""
+
+__all__ = (
+    "LONG_WEEKEND_MIN_DAYS",
+    "BridgeDay",
+    "LongWeekend",
+    "detect",
+    "find_bridge_days",
+    "find_long_weekends",
+)
+
+import re
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import MAXYEAR, MINYEAR, date, timedelta
+from itertools import chain
+from typing import Any, NamedTuple, Optional, Union
+
+from holidays.bulk import _get_entity_path
+from holidays.helpers import _normalize_arguments
+from holidays.holiday_base import CategoryArg, HolidayBase, YearArg
+from holidays.registry import EntityLoader
+
+# The minimum number of consecutive non-working days of a long weekend.
+LONG_WEEKEND_MIN_DAYS = 3
+
+# The non-working days runs of a long weekend.
+LONG_WEEKEND_PATTERN = re.compile(b"\x00{%d,}" % LONG_WEEKEND_MIN_DAYS)
+# The single working days between non-working days.
+BRIDGE_DAY_PATTERN = re.compile(b"(?<=\x00)\x01(?=\x00)")
+
+
+class LongWeekend(NamedTuple):
+    """A long weekend record."""
+
+    entity: str
+    """The country or market code."""
+    subdiv: Optional[str]
+    """The subdivision code, None for the entity-wide holidays."""
+    start: date
+    """The first non-working day."""
+    end: date
+    """The last non-working day."""
+    days: int
+    """The number of non-working days."""
+    holidays: tuple[str, ...]
+    """The holiday names."""
+
+
+class BridgeDay(NamedTuple):
+    """A bridge day record."""
+
+    entity: str
+    """The country or market code."""
+    subdiv: Optional[str]
+    """The subdivision code, None for the entity-wide holidays."""
+    date: date
+    """The bridge day date."""
+    days_off: int
+    """The number of consecutive non-working days if the bridge day is taken
+    off (including the bridge day)."""
+    holidays: tuple[str, ...]
+    """The adjacent holiday names."""
+
+
+def _get_bitmap(holidays: HolidayBase, years: YearArg) -> tuple[set[int], int, bytes, bytes]:
+    """Return the (years, first day ordinal, working days bitmap, holiday
+    flags) of the years range with a year margin on both sides (for the runs
+    crossing the year boundaries)."""
+    years_to_scan = _normalize_arguments(int, years)
+    if not years_to_scan:
+        raise ValueError("Years must be specified for long weekends detection.")
+
+    start_year = max(min(years_to_scan) - 1, MINYEAR)
+    end_year = min(max(years_to_scan) + 1, MAXYEAR)
+    bitmap = b"".join(
+        holidays._get_working_days_bitmap(year) for year in range(start_year, end_year + 1)
+    )
+    first = date(start_year, 1, 1).toordinal()
+    holiday_flags = bytearray(len(bitmap))
+    for dt in holidays:
+        if start_year <= dt.year <= end_year:
+            holiday_flags[dt.toordinal() - first] = 1
+
+    return years_to_scan, first, bitmap, bytes(holiday_flags)
+
+
+def _find_long_weekends(bitmap: bytes, holiday_flags: Sequence[Any]) -> Iterator[range]:
+    """Find the long weekends day indices: the non-working days runs of at
+    least :data:`LONG_WEEKEND_MIN_DAYS` days including a holiday.
+
+    :param bitmap:
+        The working days bitmap (see
+        :meth:`holidays.holiday_base.HolidayBase.get_working_days`).
+
+    :param holiday_flags:
+        The per day holiday flags (aligned with the bitmap).
+
+    :return:
+        An iterator of the long weekends day indices ranges.
+    """
+    for match in LONG_WEEKEND_PATTERN.finditer(bitmap):
+        if any(holiday_flags[match.start() : match.end()]):
+            yield range(match.start(), match.end())
+
+
+def _find_bridge_days(bitmap: bytes, holiday_flags: Sequence[Any]) -> Iterator[int]:
+    """Find the bridge days indices: the single working days between a
+    holiday and a non-working day.
+
+    :param bitmap:
+        The working days bitmap (see
+        :meth:`holidays.holiday_base.HolidayBase.get_working_days`).
+
+    :param holiday_flags:
+        The per day holiday flags (aligned with the bitmap).
+
+    :return:
+        An iterator of the bridge days indices.
+    """
+    for match in BRIDGE_DAY_PATTERN.finditer(bitmap):
+        idx = match.start()
+        if holiday_flags[idx - 1] or holiday_flags[idx + 1]:
+            yield idx
+
+
+def _get_holiday_names(holidays: HolidayBase, dates: Iterable[date]) -> tuple[str, ...]:
+    """Return the unique holiday names of the dates."""
+    return tuple(dict.fromkeys(name for dt in dates for name in holidays.get_list(dt)))
+
+
+def _get_record_date(record: Union[LongWeekend, BridgeDay]) -> date:
+    """Return the record (start) date."""
+    return record.start if isinstance(record, LongWeekend) else record.date
+
+
+def find_long_weekends(holidays: HolidayBase, years: YearArg) -> Iterator[LongWeekend]:
+    """Find the long weekends: the non-working days runs of at least
+    :data:`LONG_WEEKEND_MIN_DAYS` days including a holiday.
+
+    :param holidays:
+        The holidays calendar.
+
+    :param years:
+        The year(s) to find the long weekends starting in.
+
+    :return:
+        An iterator of the long weekends in the date order.
+    """
+    years_to_scan, first, bitmap, holiday_flags = _get_bitmap(holidays, years)
+    for indices in _find_long_weekends(bitmap, holiday_flags):
+        start = date.fromordinal(first + indices.start)
+        if start.year not in years_to_scan:
+            continue
+        dates = [start + timedelta(days=delta) for delta in range(len(indices))]
+        yield LongWeekend(
+            holidays._entity_code,
+            holidays.subdiv,
+            start,
+            dates[-1],
+            len(indices),
+            _get_holiday_names(holidays, dates),
+        )
+
+
+def find_bridge_days(holidays: HolidayBase, years: YearArg) -> Iterator[BridgeDay]:
+    """Find the bridge days: the single working days between a holiday and a
+    non-working day.
+
+    :param holidays:
+        The holidays calendar.
+
+    :param years:
+        The year(s) to find the bridge days in.
+
+    :return:
+        An iterator of the bridge days in the date order.
+    """
+    years_to_scan, first, bitmap, holiday_flags = _get_bitmap(holidays, years)
+    for idx in _find_bridge_days(bitmap, holiday_flags):
+        dt = date.fromordinal(first + idx)
+        if dt.year not in years_to_scan:
+            continue
+        # The working days around the bridge day non-working days.
+        next_idx = bitmap.find(b"\x01", idx + 1)
+        yield BridgeDay(
+            holidays._entity_code,
+            holidays.subdiv,
+            dt,
+            (len(bitmap) if next_idx == -1 else next_idx) - bitmap.rfind(b"\x01", 0, idx) - 1,
+            _get_holiday_names(holidays, (dt - timedelta(days=1), dt + timedelta(days=1))),
+        )
+
+
+def detect(
+    entities: Optional[Union[str, Iterable[str], Iterable[HolidayBase]]] = None,
+    subdivs: Optional[Union[str, Iterable[Optional[str]]]] = None,
+    years: Optional[YearArg] = None,
+    categories: Optional[CategoryArg] = None,
+    language: Optional[str] = None,
+    observed: bool = True,
+) -> Iterator[Union[LongWeekend, BridgeDay]]:
+    """Detect the long weekends and bridge days of multiple entities, their
+    subdivisions and years.
+
+    The entities holidays are populated in the current process, the later
+    detections reuse the population results cache.
+
+    :param entities:
+        The country (ISO 3166-1 alpha-2) and/or market (ISO 10383 MIC) codes,
+        or the holidays calendars (the other arguments except for the years
+        are ignored then). All supported countries and markets are used by
+        default.
+
+    :param subdivs:
+        The subdivisions to detect for: ``'all'`` for the entity-wide
+        holidays and all the entity subdivisions, None for the entity-wide
+        holidays only, or an iterable of subdivision codes (None item stands
+        for the entity-wide holidays).
+
+    :param years:
+        The year(s) to detect for.
+
+    :param categories:
+        Requested holiday categories.
+
+    :param language:
+        The language which the holiday names will be translated into.
+
+    :param observed:
+        Whether to include the dates of when public holiday are observed.
+
+    :return:
+        An iterator of the long weekends and bridge days records, in the date
+        order for each entity (subdivision).
+
+    Example usage:
+
+    >>> from holidays.long_weekends import detect
+    >>> for record in detect('US', years=2024):
+    ...     if record[2].month == 7:
+    ...         print(record)
+    BridgeDay(entity='US', subdiv=None, date=datetime.date(2024, 7, 5), days_off=4, holidays=('Independence Day',))
+    """  # noqa: E501
+    if entities is None:
+        entities = chain(
+            EntityLoader.get_country_codes(include_aliases=False),
+            EntityLoader.get_financial_codes(include_aliases=False),
+        )
+    elif isinstance(entities, (str, HolidayBase)):
+        entities = (entities,)  # type: ignore[assignment]
+    if isinstance(subdivs, Iterable) and not isinstance(subdivs, str):
+        subdivs = tuple(subdivs)
+    years_to_detect = _normalize_arguments(int, years)
+    if not years_to_detect:
+        raise ValueError("Years must be specified for long weekends detection.")
+
+    kwargs = {"categories": categories, "language": language, "observed": observed}
+    for entity in entities:
+        for holidays in _get_calendars(entity, subdivs, kwargs):
+            records: list[Union[LongWeekend, BridgeDay]] = [
+                *find_long_weekends(holidays, years_to_detect),
+                *find_bridge_days(holidays, years_to_detect),
+            ]
+            yield from sorted(records, key=_get_record_date)
+
+
+def _get_calendars(
+    entity: Union[str, HolidayBase],
+    subdivs: Union[str, tuple[Optional[str], ...], None],
+    kwargs: dict,
+) -> Iterator[HolidayBase]:
+    """Return the entity (subdivisions) holidays calendars."""
+    if isinstance(entity, HolidayBase):
+        yield entity
+        return None
+
+    entity_cls = EntityLoader(_get_entity_path(entity)).get_entity()
+    if subdivs == "all":
+        subdivs = (None, *entity_cls.subdivisions)  # type: ignore[union-attr]
+    elif subdivs is None:
+        subdivs = (None,)
+    for subdiv in subdivs:
+        yield entity_cls(subdiv=subdiv, **kwargs)  # type: ignore[misc,operator]
@@ -0,0 +1,184 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+"""Holidays runtime metrics.
+
+The metrics are disabled by default. Once enabled, the following counters are
+collected per entity (country/market code or class name) and globally:
+
+* ``lookups``: the date lookups (:meth:`HolidayBase.__keytransform__` calls)
+  by key type name;
+* ``string_parses``: the date lookups requiring string parsing;
+* ``expansions``: the years populated on demand by year;
+* ``populations`` and ``populate_time``: the number of years populations and
+  their cumulative time (in seconds);
+* ``translation_calls``: the holiday names translation calls of the instances
+  created while the metrics are enabled;
+* ``population_cache``: the years population cache hits and misses
+  (evictions are global);
+* ``years_cache``: the bounded (``max_years``) instances populated years
+  hits, misses and evictions.
+"""
+
+__all__ = ("disable", "enable", "is_enabled", "reset", "snapshot")
+
+from threading import Lock
+from typing import Any, Callable, Optional
+
+
+class _Recorder:
+    """The metrics counters storage."""
+
+    def __init__(self) -> None:
+        self._entities: dict[str, dict[tuple, float]] = {}
+        self._global: dict[tuple, float] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def _get_entity(holidays: Any) -> str:
+        code = holidays._entity_code
+        if code is None:
+            return holidays.__class__.__name__
+
+        # Holidays sums have lists of codes.
+        return code if isinstance(code, str) else "+".join(code)
+
+    def record(self, holidays: Any, key: tuple, value: float = 1) -> None:
+        """Add a value to an entity counter."""
+        self.record_entity(self._get_entity(holidays), key, value)
+
+    def record_entity(self, entity: str, key: tuple, value: float = 1) -> None:
+        """Add a value to an entity counter."""
+        with self._lock:
+            if (counters := self._entities.get(entity)) is None:
+                counters = self._entities[entity] = {}
+            counters[key] = counters.get(key, 0) + value
+
+    def record_global(self, key: tuple, value: float = 1) -> None:
+        """Add a value to a global (not entity specific) counter."""
+        with self._lock:
+            self._global[key] = self._global.get(key, 0) + value
+
+    def record_lookup(self, holidays: Any, key: Any) -> None:
+        """Count a date lookup."""
+        self.record(holidays, ("lookups", type(key).__name__))
+        if isinstance(key, str):
+            self.record(holidays, ("string_parses",))
+
+    def wrap_translation(self, holidays: Any, tr: Callable[[str], str]) -> Callable[[str], str]:
+        """Return a translation function counting its calls while the metrics
+        are enabled."""
+        entity = self._get_entity(holidays)
+
+        def translate(message: str) -> str:
+            if (recorder := _recorder) is not None:
+                recorder.record_entity(entity, ("translation_calls",))
+
+            return tr(message)
+
+        return translate
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            entities = {entity: dict(counters) for entity, counters in self._entities.items()}
+            global_counters = dict(self._global)
+
+        for counters in entities.values():
+            for key, value in counters.items():
+                global_counters[key] = global_counters.get(key, 0) + value
+
+        return {
+            "enabled": _recorder is self,
+            "global": _get_metrics(global_counters),
+            "entities": {
+                entity: _get_metrics(counters) for entity, counters in sorted(entities.items())
+            },
+        }
+
+
+def _get_metrics(counters: dict[tuple, float]) -> dict[str, Any]:
+    """Convert ``(name, ...)`` keyed counters into a nested dict."""
+    metrics: dict[str, Any] = {
+        "lookups": {},
+        "string_parses": 0,
+        "expansions": {},
+        "populations": 0,
+        "populate_time": 0.0,
+        "translation_calls": 0,
+        "population_cache": {"hits": 0, "misses": 0},
+        "years_cache": {"hits": 0, "misses": 0, "evictions": 0},
+    }
+    for key, value in sorted(counters.items(), key=lambda item: str(item[0])):
+        if len(key) == 1:
+            metrics[key[0]] = value
+        else:
+            metrics.setdefault(key[0], {})[key[1]] = value
+
+    return metrics
+
+
+# The active recorder, None if the metrics are disabled.
+_recorder: Optional[_Recorder] = None
+# The most recently active recorder (kept for snapshots after disabling).
+_last_recorder = _Recorder()
+
+
+def enable() -> None:
+    """Start collecting the metrics (the previously collected ones are kept)."""
+    global _recorder
+
+    _recorder = _last_recorder
+
+
+def disable() -> None:
+    """Stop collecting the metrics (the collected ones are kept)."""
+    global _recorder
+
+    _recorder = None
+
+
+def is_enabled() -> bool:
+    """Return True if the metrics are being collected."""
+    return _recorder is not None
+
+
+def reset() -> None:
+    """Discard the collected metrics."""
+    global _last_recorder, _recorder
+
+    _last_recorder = _Recorder()
+    if _recorder is not None:
+        _recorder = _last_recorder
+
+
+def snapshot() -> dict[str, Any]:
+    """Return the collected metrics.
+
+    :return:
+        A dict with the ``enabled`` flag, the ``global`` metrics and the
+        per entity metrics (``entities`` mapping), see the module
+        description for the metrics list.
+
+    Example usage:
+
+    >>> from holidays import metrics
+    >>> from holidays.countries import UnitedStates
+    >>> metrics.enable()
+    >>> us_holidays = UnitedStates()
+    >>> '2024-07-04' in us_holidays
+    True
+    >>> metrics.snapshot()['entities']['US']['string_parses']
+    1
+    >>> metrics.disable()
+    >>> metrics.reset()
+    """
+    return _last_recorder.snapshot()
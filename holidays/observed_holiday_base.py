@@ -11,6 +11,7 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from functools import cached_property
 from typing import Optional
 
 from holidays.calendars.gregorian import MON, TUE, WED, THU, FRI, SAT, SUN, _timedelta
@@ -18,7 +19,13 @@ from holidays.holiday_base import DateArg, HolidayBase
 
 
 class ObservedRule(dict[int, Optional[int]]):
-    __slots__ = ()
+    __slots__ = ("shifts",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # The rule compiled into a weekday indexed shift vector:
+        # 0 - no shift, None - not observed, +7/-7 - next/previous workday.
+        self.shifts: tuple[Optional[int], ...] = tuple(self.get(wd, 0) for wd in range(7))
 
     def __add__(self, other):
         return ObservedRule({**self, **other})
@@ -109,20 +116,43 @@ class ObservedHolidayBase(HolidayBase):
         self._observed_since = observed_since
         super().__init__(*args, **kwargs)
 
+    @cached_property
+    def _observed_labels(self) -> tuple[str, str, str, str]:
+        """Observed label templates translated once per instance.
+
+        :return:
+            A tuple of observed, observed before, observed estimated labels and
+            the estimated label text (w/o placeholder and parentheses).
+        """
+        observed_label = self.tr(self.observed_label)
+        return (
+            observed_label,
+            self.tr(getattr(self, "observed_label_before", self.observed_label)),
+            self.tr(getattr(self, "observed_estimated_label", observed_label)),
+            self.tr(getattr(self, "estimated_label", "")).strip("%s ()"),
+        )
+
     def _is_observed(self, *args, **kwargs) -> bool:
         return self._observed_since is None or self._year >= self._observed_since
 
     def _get_next_workday(self, dt: date, delta: int = +1) -> date:
-        dt_work = _timedelta(dt, delta)
-        while dt_work.year == self._year:
-            if dt_work in self or self._is_weekend(dt_work):  # type: ignore[operator]
-                dt_work = _timedelta(dt_work, delta)
-            else:
+        # Walk day ordinals directly: the occupancy is checked against the raw
+        # dict and the weekend against the ordinal based weekday
+        # (0001-01-01 is Monday) avoiding the date key transformation.
+        year_start = date(self._year, 1, 1).toordinal()
+        year_end = date(self._year, 12, 31).toordinal()
+        weekend = self.weekend
+        ordinal = dt.toordinal() + delta
+        while year_start <= ordinal <= year_end:
+            if (ordinal - 1) % 7 not in weekend and not dict.__contains__(
+                self, dt_work := date.fromordinal(ordinal)
+            ):
                 return dt_work
+            ordinal += delta
         return dt
 
     def _get_observed_date(self, dt: date, rule: ObservedRule) -> Optional[date]:
-        delta = rule.get(dt.weekday(), 0)
+        delta = rule.shifts[dt.weekday()]
         if delta:
             return (
                 self._get_next_workday(dt, delta // 7)
@@ -157,27 +187,23 @@ class ObservedHolidayBase(HolidayBase):
             return False, None
 
         if show_observed_label:
-            estimated_label = self.tr(getattr(self, "estimated_label", ""))
-            observed_label = self.tr(
-                getattr(
-                    self,
-                    "observed_label_before" if dt_observed < dt else "observed_label",
-                    self.observed_label,
-                )
-            )
+            (
+                observed_label,
+                observed_label_before,
+                observed_estimated_label,
+                estimated_label_text,
+            ) = self._observed_labels
+            if dt_observed < dt:
+                observed_label = observed_label_before
 
-            estimated_label_text = estimated_label.strip("%s ()")
             # Use observed_estimated_label instead of observed_label for estimated dates.
             for name in (name,) if name else self.get_list(dt):
                 holiday_name = self.tr(name)
-                observed_estimated_label = None
                 if estimated_label_text and estimated_label_text in holiday_name:
                     holiday_name = holiday_name.replace(f"({estimated_label_text})", "").strip()
-                    observed_estimated_label = self.tr(getattr(self, "observed_estimated_label"))
-
-                super()._add_holiday(
-                    (observed_estimated_label or observed_label) % holiday_name, dt_observed
-                )
+                    super()._add_holiday(observed_estimated_label % holiday_name, dt_observed)
+                else:
+                    super()._add_holiday(observed_label % holiday_name, dt_observed)
         else:
             for name in (name,) if name else self.get_list(dt):
                 super()._add_holiday(name, dt_observed)
@@ -207,29 +233,20 @@ class ObservedHolidayBase(HolidayBase):
             else:
                 self._add_observed(dt)
 
-    def _populate_common_holidays(self):
-        """Populate entity common holidays."""
-        super()._populate_common_holidays()
-
-        if not self.observed or not self.has_special_holidays:
-            return None
-
-        self._add_special_holidays(
-            (f"special_{category}_holidays_observed" for category in self._sorted_categories),
-            observed=True,
-        )
-
-    def _populate_subdiv_holidays(self):
-        """Populate entity subdivision holidays."""
-        super()._populate_subdiv_holidays()
+    def _get_special_holidays_mapping_names(self, subdiv=None):
+        """Get special holidays mapping names (including observed ones) in order
+        of population."""
+        yield from super()._get_special_holidays_mapping_names(subdiv)
 
-        if not self.subdiv or not self.observed or not self.has_special_holidays:
+        if not self.observed:
             return None
 
-        self._add_special_holidays(
+        yield from (
             (
-                f"special_{self._normalized_subdiv}_{category}_holidays_observed"
-                for category in self._sorted_categories
-            ),
-            observed=True,
+                f"special_{category}_holidays_observed"
+                if subdiv is None
+                else f"special_{subdiv}_{category}_holidays_observed",
+                True,
+            )
+            for category in self._sorted_categories
         )
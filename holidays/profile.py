@@ -0,0 +1,404 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+"""Holidays population profiling.
+
+Run ``python -m holidays.profile <code> [<code> ...] --years 1950-2050`` to
+get the population hot spots report of the entities.
+"""
+
+__all__ = ("MethodStats", "PopulateProfiler")
+
+import argparse
+import sys
+import warnings
+from collections.abc import Iterable
+from functools import wraps
+from threading import get_ident
+from time import perf_counter
+from typing import Any, Callable, NamedTuple, Optional
+
+from holidays.bulk import _get_entity_path
+from holidays.calendars import (
+    _BuddhistLunisolar,
+    _ChineseLunisolar,
+    _HebrewLunisolar,
+    _HinduLunisolar,
+    _IslamicLunar,
+    _Persian,
+    _ThaiLunisolar,
+)
+from holidays.holiday_base import HolidayBase, _population_cache
+from holidays.observed_holiday_base import ObservedHolidayBase
+from holidays.registry import EntityLoader
+
+# The calendar classes whose date lookups are profiled.
+CALENDAR_CLASSES = (
+    _BuddhistLunisolar,
+    _ChineseLunisolar,
+    _HebrewLunisolar,
+    _HinduLunisolar,
+    _IslamicLunar,
+    _Persian,
+    _ThaiLunisolar,
+)
+
+# The entity methods profiled in addition to the `_populate_*` ones.
+ENTITY_METHODS = {"_add_holiday", "_add_observed", "_add_special_holidays", "_populate"}
+
+# The population caching machinery methods.
+SKIPPED_METHODS = {"_populate_common_layer", "_populate_year"}
+
+# The profiling results key: entity code, holiday category and method name.
+ProfileKey = tuple[Optional[str], Optional[str], str]
+
+
+class MethodStats(NamedTuple):
+    """A profiled method statistics."""
+
+    calls: int
+    """The number of calls."""
+    total_time: float
+    """The cumulative time spent in the method (in seconds)."""
+    own_time: float
+    """The cumulative time spent in the method excluding the profiled methods
+    it called (in seconds)."""
+
+
+class PopulateProfiler:
+    """A context manager recording holidays population call counts and timings.
+
+    The entity population methods (:meth:`HolidayBase._populate`,
+    ``_populate_*`` methods, :meth:`HolidayBase._add_holiday`,
+    :meth:`ObservedHolidayBase._add_observed` etc.) and the lunar, lunisolar
+    and Persian calendars date lookups are instrumented while the context is
+    active only, the methods are restored on exit. The results are recorded
+    per entity, holiday category and method.
+
+    Only the calls made by the thread that entered the context are recorded.
+    Note that the years whose population results are already cached (see
+    :meth:`HolidayBase._populate_year`) are not populated again.
+
+    Example usage:
+
+    >>> from holidays.countries import UnitedStates
+    >>> from holidays.profile import PopulateProfiler
+    >>> with PopulateProfiler() as profiler:
+    ...     us_holidays = UnitedStates(years=range(1950, 2051))
+    >>> print(profiler.report(limit=10))  # doctest: +SKIP
+    """
+
+    def __init__(
+        self,
+        entities: Optional[Iterable[type[HolidayBase]]] = None,
+        callback: Optional[Callable[[Optional[str], Optional[str], str, float], Any]] = None,
+    ) -> None:
+        """
+        :param entities:
+            The entity classes to profile. All entity classes imported so far
+            are profiled by default.
+
+        :param callback:
+            The callable receiving the entity code, holiday category, method
+            name and the call duration (in seconds) of every profiled call.
+        """
+        self.entities = tuple(entities) if entities is not None else None
+        self.callback = callback
+
+        self._active = False
+        self._categories: dict[tuple[type, str], Optional[str]] = {}
+        self._patches: list[tuple[type, str, Any]] = []
+        self._stack: list[list[Any]] = []
+        self._stats: dict[ProfileKey, list] = {}
+        self._thread_id: Optional[int] = None
+        self._totals: dict[Optional[str], float] = {}
+
+    def __enter__(self) -> "PopulateProfiler":
+        if self._active:
+            raise RuntimeError("The profiler is already active.")
+
+        entities = self.entities if self.entities is not None else _get_entity_classes()
+        patched_classes: set[type] = set()
+        for entity in (HolidayBase, ObservedHolidayBase, *entities):
+            for klass in entity.__mro__:
+                if klass in patched_classes or not klass.__module__.startswith("holidays."):
+                    continue
+                patched_classes.add(klass)
+                for name in tuple(vars(klass)):
+                    if name in ENTITY_METHODS or (
+                        name.startswith("_populate_") and name not in SKIPPED_METHODS
+                    ):
+                        self._patch(klass, name, self._wrap_entity_method)
+
+        for klass in CALENDAR_CLASSES:
+            for name in tuple(vars(klass)):
+                if name == "_get_holiday" or name[0] != "_":
+                    self._patch(klass, name, self._wrap_calendar_method)
+
+        self._thread_id = get_ident()
+        self._active = True
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._active = False
+        for klass, name, value in reversed(self._patches):
+            setattr(klass, name, value)
+        self._patches.clear()
+        self._stack.clear()
+
+    def _patch(self, klass: type, name: str, wrap: Callable) -> None:
+        value = vars(klass)[name]
+        if isinstance(value, staticmethod):
+            wrapper = staticmethod(wrap(value.__func__, f"{klass.__name__}.{name}"))
+        elif callable(value):
+            wrapper = wrap(value, f"{klass.__name__}.{name}")
+        else:
+            return None
+
+        self._patches.append((klass, name, value))
+        setattr(klass, name, wrapper)
+
+    def _get_category(self, entity: HolidayBase, name: str) -> Optional[str]:
+        """Return the holiday category an entity method populates (if any)."""
+        key = (entity.__class__, name)
+        if key not in self._categories:
+            self._categories[key] = next(
+                (
+                    category
+                    for category in entity.supported_categories
+                    if name == f"_populate_{category}_holidays"
+                    or (
+                        name.startswith("_populate_subdiv_")
+                        and name.endswith(f"_{category}_holidays")
+                    )
+                ),
+                None,
+            )
+
+        return self._categories[key]
+
+    def _wrap_entity_method(self, func: Callable, method: str) -> Callable:
+        name = func.__name__
+
+        @wraps(func)
+        def wrapper(entity, *args, **kwargs):
+            if not self._active or get_ident() != self._thread_id:
+                return func(entity, *args, **kwargs)
+
+            category = self._get_category(entity, name) or (
+                self._stack[-1][1] if self._stack else None
+            )
+            entity_code = (
+                getattr(entity, "country", None)
+                or getattr(entity, "market", None)
+                or entity.__class__.__name__
+            )
+            return self._call(entity_code, category, method, func, (entity, *args), kwargs)
+
+        return wrapper
+
+    def _wrap_calendar_method(self, func: Callable, method: str) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self._active or get_ident() != self._thread_id:
+                return func(*args, **kwargs)
+
+            entity_code, category = self._stack[-1][:2] if self._stack else (None, None)
+            return self._call(entity_code, category, method, func, args, kwargs)
+
+        return wrapper
+
+    def _call(
+        self,
+        entity: Optional[str],
+        category: Optional[str],
+        method: str,
+        func: Callable,
+        args: tuple,
+        kwargs: dict,
+    ) -> Any:
+        """Call a profiled method and record its timings."""
+        stack = self._stack
+        # The frame consists of entity, category and the nested calls time.
+        stack.append([entity, category, 0.0])
+        started_at = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - started_at
+            nested_time = stack.pop()[2]
+            if stack:
+                stack[-1][2] += elapsed
+            else:
+                self._totals[entity] = self._totals.get(entity, 0.0) + elapsed
+
+            key = (entity, category, method)
+            if (stats := self._stats.get(key)) is None:
+                stats = self._stats[key] = [0, 0.0, 0.0]
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] += elapsed - nested_time
+
+            if self.callback is not None:
+                self.callback(entity, category, method, elapsed)
+
+    @property
+    def stats(self) -> dict[ProfileKey, MethodStats]:
+        """The recorded (entity, category, method) statistics."""
+        return {key: MethodStats(*stats) for key, stats in self._stats.items()}
+
+    @property
+    def totals(self) -> dict[Optional[str], float]:
+        """The entities total profiled time (in seconds)."""
+        return dict(self._totals)
+
+    def reset(self) -> None:
+        """Discard the recorded statistics."""
+        self._stats.clear()
+        self._totals.clear()
+
+    def report(self, limit: Optional[int] = 20, sort_by: str = "own_time") -> str:
+        """Return the recorded statistics report.
+
+        :param limit:
+            The maximum number of methods to report (all by default).
+
+        :param sort_by:
+            The methods ranking field: ``'calls'``, ``'total_time'`` or
+            ``'own_time'``.
+
+        :return:
+            The entities ranked by the total time followed by the methods
+            ranked by the ``sort_by`` field.
+        """
+        if sort_by not in MethodStats._fields:
+            raise ValueError(f"Unknown sort field: {sort_by}.")
+
+        grand_total = sum(self._totals.values())
+        lines = [f"{'entity':<10} {'total ms':>10} {'share':>7}"]
+        for entity, total in sorted(self._totals.items(), key=lambda item: -item[1]):
+            share = total / grand_total if grand_total else 0.0
+            lines.append(f"{entity or '-':<10} {total * 1000:>10.2f} {share:>7.1%}")
+
+        stats = sorted(self.stats.items(), key=lambda item: getattr(item[1], sort_by))
+        stats.reverse()
+        lines.append("")
+        lines.append(
+            f"{'entity':<10} {'category':<14} {'method':<50} "
+            f"{'calls':>8} {'total ms':>10} {'own ms':>10} {'share':>7}"
+        )
+        for (entity, category, method), method_stats in stats[:limit]:
+            share = method_stats.own_time / grand_total if grand_total else 0.0
+            lines.append(
+                f"{entity or '-':<10} {category or '-':<14} {method:<50} "
+                f"{method_stats.calls:>8} {method_stats.total_time * 1000:>10.2f} "
+                f"{method_stats.own_time * 1000:>10.2f} {share:>7.1%}"
+            )
+
+        return "\n".join(lines)
+
+
+def _get_entity_classes() -> list[type[HolidayBase]]:
+    """Return the entity classes imported so far."""
+    classes = []
+    stack = [HolidayBase]
+    while stack:
+        for subclass in stack.pop().__subclasses__():
+            if subclass not in classes:
+                classes.append(subclass)
+                stack.append(subclass)
+
+    return classes
+
+
+def _parse_years(value: str) -> range:
+    start, _, end = value.partition("-")
+    return range(int(start), int(end or start) + 1)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m holidays.profile",
+        description="Profile holidays population and report the hot spots.",
+    )
+    arg_parser.add_argument(
+        "entities",
+        help="Country/market codes to profile, `all` for all supported entities",
+        nargs="+",
+    )
+    arg_parser.add_argument(
+        "-y",
+        "--years",
+        default=_parse_years("1950-2050"),
+        help="The year or years range to populate, e.g., 2024 or 1950-2050 (default)",
+        type=_parse_years,
+    )
+    arg_parser.add_argument("-s", "--subdiv", help="The subdivision code to populate")
+    arg_parser.add_argument(
+        "-c",
+        "--categories",
+        help="The holiday categories to populate, `all` for all supported categories",
+        nargs="+",
+    )
+    arg_parser.add_argument(
+        "-l",
+        "--limit",
+        default=20,
+        help="The maximum number of methods to report (20 by default)",
+        type=int,
+    )
+    arg_parser.add_argument(
+        "--sort",
+        choices=MethodStats._fields,
+        default="own_time",
+        help="The methods ranking field (own_time by default)",
+    )
+    args = arg_parser.parse_args(argv)
+    if args.subdiv and len(args.entities) > 1:
+        arg_parser.error("the subdivision can be specified for a single entity only")
+
+    codes = args.entities
+    if codes == ["all"]:
+        codes = [
+            *EntityLoader.get_country_codes(include_aliases=False),
+            *EntityLoader.get_financial_codes(include_aliases=False),
+        ]
+    entity_classes: list[type[HolidayBase]] = []
+    for code in codes:
+        # Import the entity before the profiling starts.
+        entity_classes.append(
+            EntityLoader(_get_entity_path(code)).get_entity()  # type: ignore[arg-type]
+        )
+
+    _population_cache.clear()
+    started_at = perf_counter()
+    with PopulateProfiler(entity_classes) as profiler:
+        for entity_cls in entity_classes:
+            categories = args.categories
+            if categories == ["all"]:
+                categories = entity_cls.supported_categories
+            entity_cls(years=args.years, subdiv=args.subdiv, categories=categories)
+    elapsed = perf_counter() - started_at
+
+    print(profiler.report(limit=args.limit, sort_by=args.sort))
+    print(
+        f"\nPopulated {len(entity_classes)} entities for {len(args.years)} years "
+        f"in {elapsed:.2f}s."
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    sys.exit(main())
@@ -0,0 +1,223 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+"""Recurring financial dates (e.g., derivatives expiry and roll) schedules.
+
+A schedule rule defines a monthly anchor date (the n-th weekday or day of the
+month) adjusted to a business day either by a roll convention or by a business
+days offset (see :mod:`holidays.business_days`). The whole schedules are
+generated at once: the anchor dates are computed per month and adjusted using
+the business days calendar precomputed arrays (NumPy vectorized for the array
+output).
+"""
+
+__all__ = (
+    "ALL_MONTHS",
+    "QUARTERLY_MONTHS",
+    "ScheduleRule",
+    "generate_schedule",
+    "generate_schedules",
+)
+
+from calendar import monthrange
+from collections.abc import Mapping
+from datetime import date
+from typing import Any, NamedTuple, Optional, Union
+
+from holidays.business_days import PRECEDING, BusinessCalendar
+from holidays.calendars.gregorian import (
+    DEC,
+    JAN,
+    JUN,
+    MAR,
+    SEP,
+    _get_nth_weekday_of_month,
+    _get_nth_weekdays_of_months,
+)
+from holidays.holiday_base import DateLike, HolidayBase, _to_date
+
+ALL_MONTHS = tuple(range(JAN, DEC + 1))
+QUARTERLY_MONTHS = (MAR, JUN, SEP, DEC)
+
+# The number of months to look beyond the range for the adjusted dates.
+MARGIN_MONTHS = 1
+
+
+class ScheduleRule(NamedTuple):
+    """A monthly recurring date rule.
+
+    For example:
+
+    * ``ScheduleRule(3, FRI)``: the 3rd Friday of the month, the preceding
+      business day if it's not a business day;
+    * ``ScheduleRule(-1, months=QUARTERLY_MONTHS)``: the last business day of
+      the quarter;
+    * ``ScheduleRule(3, WED, offset=-2)``: 2 business days before the 3rd
+      Wednesday of the month.
+    """
+
+    n: int
+    """The anchor date n-th weekday (or day if the weekday is not set) of the
+    month, negative values count from the month end (i.e. -1 is the last)."""
+    weekday: Optional[int] = None
+    """The anchor date weekday (e.g., :data:`holidays.calendars.gregorian.FRI`),
+    None for the month day anchors."""
+    offset: int = 0
+    """The number of business days after (before if negative) the anchor date,
+    0 to roll the anchor date to a business day instead."""
+    roll: str = PRECEDING
+    """The anchor date roll convention (see :meth:`BusinessCalendar.roll`),
+    used if the offset is 0."""
+    months: tuple[int, ...] = ALL_MONTHS
+    """The months of the schedule, e.g., :data:`QUARTERLY_MONTHS`."""
+
+
+def _get_calendar(holidays: Union[HolidayBase, BusinessCalendar]) -> BusinessCalendar:
+    return BusinessCalendar(holidays) if isinstance(holidays, HolidayBase) else holidays
+
+
+def _get_anchor(rule: ScheduleRule, year: int, month: int) -> date:
+    """Return a rule anchor date of a month."""
+    if rule.weekday is not None:
+        return _get_nth_weekday_of_month(rule.n, rule.weekday, month, year)
+
+    days_in_month = monthrange(year, month)[1]
+    day = rule.n if rule.n > 0 else days_in_month + rule.n + 1
+    if not 1 <= day <= days_in_month:
+        raise ValueError(f"No day {rule.n} in {year}-{month:02}")
+
+    return date(year, month, day)
+
+
+def _get_anchors(rule: ScheduleRule, months: Any) -> Any:
+    """Return a rule anchor dates of a NumPy ``datetime64[M]`` months array."""
+    if rule.weekday is not None:
+        return _get_nth_weekdays_of_months(rule.n, rule.weekday, months)
+
+    if rule.n > 0:
+        anchors = months.astype("datetime64[D]") + rule.n - 1
+    else:
+        anchors = (months + 1).astype("datetime64[D]") + rule.n
+    if (anchors.astype("datetime64[M]") != months).any():
+        raise ValueError(f"No day {rule.n} in some of the months")
+
+    return anchors
+
+
+def _get_months_range(start: date, end: date, rule: ScheduleRule) -> tuple[int, int]:
+    """Return the (start, end) range of the rule anchor months (counted from
+    the year 0) including the margin for the adjusted dates."""
+    margin = MARGIN_MONTHS + abs(rule.offset) // 15
+    return start.year * 12 + start.month - 1 - margin, end.year * 12 + end.month - 1 + margin
+
+
+def generate_schedule(
+    holidays: Union[HolidayBase, BusinessCalendar],
+    rule: ScheduleRule,
+    start: DateLike,
+    end: DateLike,
+) -> list[date]:
+    """Generate a recurring dates schedule.
+
+    :param holidays:
+        The business days calendar (or the holidays it's made of).
+
+    :param rule:
+        The schedule rule.
+
+    :param start:
+        The schedule start date (inclusive).
+
+    :param end:
+        The schedule end date (inclusive).
+
+    :return:
+        The sorted schedule dates between the start and end dates.
+    """
+    calendar = _get_calendar(holidays)
+    dt1 = _to_date(start)
+    dt2 = _to_date(end)
+
+    schedule = []
+    first_month, last_month = _get_months_range(dt1, dt2, rule)
+    for month_idx in range(first_month, last_month + 1):
+        year, month = divmod(month_idx, 12)
+        if month + 1 not in rule.months:
+            continue
+        anchor = _get_anchor(rule, year, month + 1)
+        dt = (
+            calendar.get_nth_working_day(anchor, rule.offset)
+            if rule.offset
+            else calendar.roll(anchor, rule.roll)
+        )
+        if dt1 <= dt <= dt2:
+            schedule.append(dt)
+
+    return schedule
+
+
+def generate_schedules(
+    holidays: Union[HolidayBase, BusinessCalendar],
+    rules: Mapping[str, ScheduleRule],
+    start: DateLike,
+    end: DateLike,
+    as_array: bool = False,
+) -> dict[str, Union[list[date], Any]]:
+    """Generate multiple recurring dates schedules (e.g., of all the traded
+    contracts) at once.
+
+    :param holidays:
+        The business days calendar (or the holidays it's made of).
+
+    :param rules:
+        The schedule rules by name (e.g., contract code).
+
+    :param start:
+        The schedules start date (inclusive).
+
+    :param end:
+        The schedules end date (inclusive).
+
+    :param as_array:
+        Whether to return the schedules as NumPy ``datetime64[D]`` arrays
+        (requires NumPy). The schedules are computed with the NumPy
+        vectorized operations then.
+
+    :return:
+        The sorted schedules dates between the start and end dates by name.
+    """
+    calendar = _get_calendar(holidays)
+    if not as_array:
+        return {
+            name: generate_schedule(calendar, rule, start, end) for name, rule in rules.items()
+        }
+
+    import numpy as np
+
+    dt1 = np.datetime64(_to_date(start), "D")
+    dt2 = np.datetime64(_to_date(end), "D")
+
+    schedules = {}
+    for name, rule in rules.items():
+        first_month, last_month = _get_months_range(_to_date(start), _to_date(end), rule)
+        # The `datetime64[M]` months are counted from 1970-01.
+        month_indices = np.arange(first_month, last_month + 1)
+        month_indices = month_indices[np.isin(month_indices % 12 + 1, rule.months)]
+        anchors = _get_anchors(rule, (month_indices - 1970 * 12).astype("datetime64[M]"))
+        dts = (
+            calendar.get_nth_working_days(anchors, rule.offset)
+            if rule.offset
+            else calendar.roll_dates(anchors, rule.roll)
+        )
+        schedules[name] = dts[(dts >= dt1) & (dts <= dt2)]
+
+    return schedules
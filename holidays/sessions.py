@@ -0,0 +1,382 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+"""Financial markets trading sessions.
+
+The sessions are the market working days (see
+:meth:`holidays.holiday_base.HolidayBase.is_working_day`) trading hours,
+including the early close days defined by the market holidays calendar
+(currently NYSE only). The sessions are precomputed per year into sorted
+boundary (open and close POSIX timestamps) arrays, so the queries are binary
+searches.
+
+The market time zones require the system time zone database or the
+``tzdata`` package (the ``holidays[sessions]`` extra, e.g., on Windows).
+"""
+
+__all__ = (
+    "EuropeanCentralBankSessions",
+    "ICEFuturesEuropeSessions",
+    "MarketSessions",
+    "NewYorkStockExchangeSessions",
+    "Session",
+    "market_sessions",
+)
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
+from typing import NamedTuple, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from holidays.holiday_base import DateLike, HolidayBase, _to_date
+from holidays.utils import financial_holidays
+
+# The maximum number of consecutive years w/o sessions to look through.
+MAX_YEARS_WITHOUT_SESSIONS = 10
+
+
+class Session(NamedTuple):
+    """A market trading session."""
+
+    date: date
+    """The session date."""
+    open: datetime
+    """The session open time (market time zone aware)."""
+    close: datetime
+    """The session close time (market time zone aware)."""
+    early_close: bool
+    """Whether the session closes early."""
+
+
+class MarketSessions:
+    """A market trading sessions calendar.
+
+    The naive datetime arguments are treated as the market local time.
+
+    The early close days and time are taken from the market holidays calendar
+    ``get_early_closes()`` method and ``early_close_time`` attribute, the
+    markets w/o them (all except for NYSE at the moment) have the regular
+    sessions only.
+
+    Example usage:
+
+    >>> from datetime import datetime
+    >>> from holidays.sessions import market_sessions
+    >>> nyse_sessions = market_sessions('NYSE')
+    >>> nyse_sessions.is_open(datetime(2024, 7, 3, 14))
+    False
+    >>> nyse_sessions.next_open(datetime(2024, 7, 3, 14))
+    datetime.datetime(2024, 7, 5, 9, 30, tzinfo=zoneinfo.ZoneInfo(key='America/New_York'))
+    >>> nyse_sessions.trading_minutes(datetime(2024, 7, 3, 12), datetime(2024, 7, 5, 10))
+    90.0
+    """
+
+    market: str
+    """The market code."""
+    timezone: str
+    """The market IANA time zone name."""
+    open_time: time
+    """The regular session open time."""
+    close_time: time
+    """The regular session close time."""
+    early_close_time: Optional[time]
+    """The early close days session close time (None if the market holidays
+    calendar has no early close days)."""
+
+    def __init__(self, holidays: Optional[HolidayBase] = None) -> None:
+        """
+        :param holidays:
+            The market holidays, the market default ones are used if not
+            provided.
+        """
+        self.holidays = holidays if holidays is not None else financial_holidays(self.market)
+        try:
+            self.tz = ZoneInfo(self.timezone)
+        except ZoneInfoNotFoundError:
+            raise ValueError(
+                f"Time zone {self.timezone} not available, the system time zone database "
+                "or the tzdata package (`pip install holidays[sessions]`) is required."
+            )
+        self.early_close_time = getattr(self.holidays, "early_close_time", None)
+
+        # Per year session dates ordinals, boundaries and early close flags.
+        self._year_sessions: dict[int, tuple[array, array, array]] = {}
+        self._years: Optional[range] = None
+        # The loaded years session date ordinals, (open, close) timestamp
+        # boundaries and the cumulative session seconds before each session.
+        self._ordinals = array("l")
+        self._boundaries = array("d")
+        self._cumulative = array("d", (0.0,))
+        self._early_closes = array("b")
+
+    def _get_early_closes(self, year: int) -> set[date]:
+        """Return the year early close days."""
+        get_early_closes = getattr(self.holidays, "get_early_closes", None)
+
+        return get_early_closes(year) if get_early_closes is not None else set()
+
+    def _get_year_sessions(self, year: int) -> tuple[array, array, array]:
+        if (year_sessions := self._year_sessions.get(year)) is not None:
+            return year_sessions
+
+        early_closes = self._get_early_closes(year) if self.early_close_time else set()
+        ordinals = array("l")
+        boundaries = array("d")
+        flags = array("b")
+        dt = date(year, 1, 1)
+        for _ in range((date(year + 1, 1, 1) - dt).days):
+            if self.holidays.is_working_day(dt):
+                early_close = dt in early_closes
+                ordinals.append(dt.toordinal())
+                boundaries.append(datetime.combine(dt, self.open_time, self.tz).timestamp())
+                boundaries.append(
+                    datetime.combine(
+                        dt,
+                        self.early_close_time  # type: ignore[arg-type]
+                        if early_close
+                        else self.close_time,
+                        self.tz,
+                    ).timestamp()
+                )
+                flags.append(early_close)
+            dt += timedelta(days=1)
+
+        self._year_sessions[year] = (ordinals, boundaries, flags)
+
+        return ordinals, boundaries, flags
+
+    def _load_years(self, start: int, end: int) -> None:
+        """Make sure the [start, end] years sessions are loaded."""
+        if self._years is not None:
+            if self._years.start <= start and end < self._years.stop:
+                return None
+            start = min(start, self._years.start)
+            end = max(end, self._years.stop - 1)
+
+        ordinals = array("l")
+        boundaries = array("d")
+        early_closes = array("b")
+        for year in range(start, end + 1):
+            year_ordinals, year_boundaries, year_early_closes = self._get_year_sessions(year)
+            ordinals.extend(year_ordinals)
+            boundaries.extend(year_boundaries)
+            early_closes.extend(year_early_closes)
+
+        cumulative = array("d", (0.0,))
+        total = 0.0
+        for idx in range(0, len(boundaries), 2):
+            total += boundaries[idx + 1] - boundaries[idx]
+            cumulative.append(total)
+
+        self._ordinals = ordinals
+        self._boundaries = boundaries
+        self._cumulative = cumulative
+        self._early_closes = early_closes
+        self._years = range(start, end + 1)
+
+    def _to_timestamp(self, dt: datetime) -> float:
+        """Convert a datetime to a POSIX timestamp loading its year sessions
+        (and the adjacent years ones)."""
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=self.tz)
+        # The adjacent years cover the time zones difference.
+        year = dt.year
+        if (years := self._years) is None or not years.start < year < years.stop - 1:
+            self._load_years(year - 1, year + 1)
+
+        return dt.timestamp()
+
+    def _get_session(self, idx: int) -> Session:
+        return Session(
+            date.fromordinal(self._ordinals[idx]),
+            datetime.fromtimestamp(self._boundaries[2 * idx], self.tz),
+            datetime.fromtimestamp(self._boundaries[2 * idx + 1], self.tz),
+            bool(self._early_closes[idx]),
+        )
+
+    def _get_next_boundary(self, dt: datetime, is_open: bool) -> datetime:
+        """Return the first open (close) boundary after a datetime."""
+        timestamp = self._to_timestamp(dt)
+        for _ in range(MAX_YEARS_WITHOUT_SESSIONS):
+            idx = bisect_right(self._boundaries, timestamp)
+            # Even indices are opens, odd ones are closes.
+            if idx % 2 == is_open:
+                idx += 1
+            if idx < len(self._boundaries):
+                return datetime.fromtimestamp(self._boundaries[idx], self.tz)
+            self._load_years(self._years.start, self._years.stop)  # type: ignore[union-attr]
+
+        raise ValueError(f"No sessions found after {dt}.")
+
+    def _get_session_seconds(self, timestamp: float) -> float:
+        """Return the total sessions time before a timestamp (loaded years)."""
+        idx = bisect_right(self._boundaries, timestamp)
+        if idx % 2:  # Within a session.
+            return self._cumulative[idx // 2] + timestamp - self._boundaries[idx - 1]
+
+        return self._cumulative[idx // 2]
+
+    def get_session(self, key: DateLike) -> Optional[Session]:
+        """Return the session of a date, None if the market is closed.
+
+        :param key:
+            The date expressed in one of the :data:`DateLike` types.
+        """
+        dt = _to_date(key)
+        self._load_years(dt.year, dt.year)
+        idx = bisect_left(self._ordinals, dt.toordinal())
+        if idx < len(self._ordinals) and self._ordinals[idx] == dt.toordinal():
+            return self._get_session(idx)
+
+        return None
+
+    def is_open(self, dt: datetime) -> bool:
+        """Return True if the market is open at the given time.
+
+        :param dt:
+            The time (naive datetimes are treated as the market local time).
+        """
+        timestamp = self._to_timestamp(dt)
+
+        return bisect_right(self._boundaries, timestamp) % 2 == 1
+
+    def next_open(self, dt: datetime) -> datetime:
+        """Return the first session open time after the given time.
+
+        :param dt:
+            The time (naive datetimes are treated as the market local time).
+        """
+        return self._get_next_boundary(dt, is_open=True)
+
+    def next_close(self, dt: datetime) -> datetime:
+        """Return the first session close time after the given time.
+
+        :param dt:
+            The time (naive datetimes are treated as the market local time).
+        """
+        return self._get_next_boundary(dt, is_open=False)
+
+    def sessions_between(self, start: DateLike, end: DateLike) -> list[Session]:
+        """Return the sessions between two dates.
+
+        The date range works in a closed interval fashion [start, end] so both
+        endpoints are included.
+
+        :param start:
+            The range start date.
+
+        :param end:
+            The range end date.
+        """
+        dt1 = _to_date(start)
+        dt2 = _to_date(end)
+        self._load_years(dt1.year, dt2.year)
+
+        return [
+            self._get_session(idx)
+            for idx in range(
+                bisect_left(self._ordinals, dt1.toordinal()),
+                bisect_right(self._ordinals, dt2.toordinal()),
+            )
+        ]
+
+    def trading_minutes(self, start: datetime, end: datetime) -> float:
+        """Return the number of trading minutes between two times.
+
+        :param start:
+            The period start time (naive datetimes are treated as the market
+            local time).
+
+        :param end:
+            The period end time (naive datetimes are treated as the market
+            local time). The result is negative if it's before the start.
+        """
+        start_timestamp = self._to_timestamp(start)
+        end_timestamp = self._to_timestamp(end)
+
+        return (
+            self._get_session_seconds(end_timestamp) - self._get_session_seconds(start_timestamp)
+        ) / 60
+
+
+class EuropeanCentralBankSessions(MarketSessions):
+    """TARGET2 (T2) real-time gross settlement system operating day.
+
+    References:
+    - https://www.ecb.europa.eu/paym/target/t2/html/index.en.html
+    """
+
+    market = "ECB"
+    timezone = "Europe/Berlin"
+    open_time = time(7)
+    close_time = time(18)
+
+
+class ICEFuturesEuropeSessions(MarketSessions):
+    """ICE Futures Europe (Brent Crude futures) trading hours.
+
+    References:
+    - https://www.ice.com/products/219/Brent-Crude-Futures
+    """
+
+    market = "IFEU"
+    timezone = "Europe/London"
+    open_time = time(1)
+    close_time = time(23)
+
+
+class NewYorkStockExchangeSessions(MarketSessions):
+    """New York Stock Exchange core trading session.
+
+    The early (1:00 p.m.) close days are defined by
+    :class:`holidays.financial.ny_stock_exchange.NewYorkStockExchange`.
+
+    References:
+    - https://www.nyse.com/markets/hours-calendars
+    """
+
+    market = "NYSE"
+    timezone = "America/New_York"
+    open_time = time(9, 30)
+    close_time = time(16)
+
+
+def _get_sessions_classes() -> dict[str, type[MarketSessions]]:
+    return {
+        code: cls
+        for cls, codes in (
+            (EuropeanCentralBankSessions, ("ECB", "TAR")),
+            (ICEFuturesEuropeSessions, ("IFEU",)),
+            (NewYorkStockExchangeSessions, ("NYSE", "XNYS")),
+        )
+        for code in codes
+    }
+
+
+def market_sessions(market: str, holidays: Optional[HolidayBase] = None) -> MarketSessions:
+    """Return a market trading sessions calendar.
+
+    :param market:
+        The market code (ISO 10383 MIC or its alias).
+
+    :param holidays:
+        The market holidays, the market default ones are used if not
+        provided.
+
+    :return:
+        The market sessions calendar.
+    """
+    try:
+        return _get_sessions_classes()[market](holidays)
+    except KeyError:
+        raise NotImplementedError(f"Market {market} sessions not available")
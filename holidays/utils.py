@@ -12,6 +12,7 @@
 
 __all__ = (
     "country_holidays",
+    "country_holidays_bundle",
     "CountryHoliday",
     "financial_holidays",
     "list_localized_countries",
@@ -21,14 +22,23 @@ __all__ = (
 )
 
 import warnings
-from collections.abc import Iterable
+from collections.abc import Hashable, Iterable
 from functools import lru_cache
-from typing import Optional, Union
+from threading import Lock
+from typing import Literal, Optional, Union, overload
+from weakref import WeakValueDictionary
 
+from holidays.frozen_holidays import FrozenHolidays
+from holidays.helpers import _normalize_arguments
 from holidays.holiday_base import CategoryArg, HolidayBase
 from holidays.registry import EntityLoader
 
+# Frozen holidays shared while they are in use (see `_get_frozen_holidays`).
+_frozen_holidays: WeakValueDictionary[Hashable, FrozenHolidays] = WeakValueDictionary()
+_frozen_holidays_lock = Lock()
 
+
+@overload
 def country_holidays(
     country: str,
     subdiv: Optional[str] = None,
@@ -39,7 +49,38 @@ def country_holidays(
     state: Optional[str] = None,
     language: Optional[str] = None,
     categories: Optional[CategoryArg] = None,
-) -> HolidayBase:
+    frozen: Literal[False] = False,
+) -> HolidayBase: ...
+
+
+@overload
+def country_holidays(
+    country: str,
+    subdiv: Optional[str] = None,
+    years: Optional[Union[int, Iterable[int]]] = None,
+    expand: bool = True,
+    observed: bool = True,
+    prov: Optional[str] = None,
+    state: Optional[str] = None,
+    language: Optional[str] = None,
+    categories: Optional[CategoryArg] = None,
+    *,
+    frozen: Literal[True],
+) -> FrozenHolidays: ...
+
+
+def country_holidays(
+    country: str,
+    subdiv: Optional[str] = None,
+    years: Optional[Union[int, Iterable[int]]] = None,
+    expand: bool = True,
+    observed: bool = True,
+    prov: Optional[str] = None,
+    state: Optional[str] = None,
+    language: Optional[str] = None,
+    categories: Optional[CategoryArg] = None,
+    frozen: bool = False,
+) -> Union[HolidayBase, FrozenHolidays]:
     """
     Returns a new dictionary-like :py:class:`HolidayBase` object for the public
     holidays of the country matching **country** and other keyword arguments.
@@ -78,8 +119,14 @@ def country_holidays(
     :param categories:
         Requested holiday categories.
 
+    :param frozen:
+        Whether to return an immutable :py:class:`FrozenHolidays` snapshot
+        of the **years** holidays instead. The snapshot is shared between
+        all callers requesting the same holidays.
+
     :return:
-        A :py:class:`HolidayBase` object matching the **country**.
+        A :py:class:`HolidayBase` (or :py:class:`FrozenHolidays` if
+        **frozen** is True) object matching the **country**.
 
     The key of the :class:`dict`-like :class:`HolidayBase` object is the
     `date` of the holiday, and the value is the name of the holiday itself.
@@ -186,8 +233,8 @@ def country_holidays(
     import holidays
 
     try:
-        return getattr(holidays, country)(
-            years=years,
+        entity_holidays = getattr(holidays, country)(
+            years=None if frozen else years,
             subdiv=subdiv,
             expand=expand,
             observed=observed,
@@ -199,7 +246,83 @@ def country_holidays(
     except AttributeError:
         raise NotImplementedError(f"Country {country} not available")
 
+    return _get_frozen_holidays(entity_holidays, years) if frozen else entity_holidays
+
 
+def country_holidays_bundle(
+    country: str,
+    subdivs: Optional[Iterable[str]] = None,
+    years: Optional[Union[int, Iterable[int]]] = None,
+    expand: bool = True,
+    observed: bool = True,
+    language: Optional[str] = None,
+    categories: Optional[CategoryArg] = None,
+) -> dict[str, HolidayBase]:
+    """
+    Returns a dictionary of :py:class:`HolidayBase` objects for the
+    subdivisions of the country matching **country** and other keyword
+    arguments.
+
+    The country common holidays are generated once per year and shared
+    between the subdivisions, so it's faster than calling
+    :py:func:`country_holidays` for each subdivision separately.
+
+    :param country:
+        An ISO 3166-1 Alpha-2 country code.
+
+    :param subdivs:
+        The subdivisions (ISO 3166-2 codes or their aliases) to return
+        holidays for. All country subdivisions are used by default.
+
+    :param years:
+        The year(s) to pre-calculate public holidays for at instantiation.
+
+    :param expand:
+        Whether the entire year is calculated when one date from that year
+        is requested.
+
+    :param observed:
+        Whether to include the dates of when public holiday are observed
+        (e.g. a holiday falling on a Sunday being observed the following
+        Monday). False may not work for all countries.
+
+    :param language:
+        The language which the returned holiday names will be translated
+        into. It must be an ISO 639-1 (2-letter) language code. If the
+        language translation is not supported the original holiday names
+        will be used.
+
+    :param categories:
+        Requested holiday categories.
+
+    :return:
+        A subdivision code to :py:class:`HolidayBase` object mapping.
+
+    Example usage:
+
+    >>> from holidays import country_holidays_bundle
+    >>> us_states_holidays = country_holidays_bundle('US', years=2024)
+    >>> us_states_holidays['CA'].get('2024-03-31')
+    'Cesar Chavez Day'
+    """
+    import holidays
+
+    try:
+        entity_cls = getattr(holidays, country)
+    except AttributeError:
+        raise NotImplementedError(f"Country {country} not available")
+
+    return entity_cls.get_subdivisions_holidays(
+        subdivs=subdivs,
+        years=years,
+        expand=expand,
+        observed=observed,
+        language=language,
+        categories=categories,
+    )
+
+
+@overload
 def financial_holidays(
     market: str,
     subdiv: Optional[str] = None,
@@ -207,7 +330,32 @@ def financial_holidays(
     expand: bool = True,
     observed: bool = True,
     language: Optional[str] = None,
-) -> HolidayBase:
+    frozen: Literal[False] = False,
+) -> HolidayBase: ...
+
+
+@overload
+def financial_holidays(
+    market: str,
+    subdiv: Optional[str] = None,
+    years: Optional[Union[int, Iterable[int]]] = None,
+    expand: bool = True,
+    observed: bool = True,
+    language: Optional[str] = None,
+    *,
+    frozen: Literal[True],
+) -> FrozenHolidays: ...
+
+
+def financial_holidays(
+    market: str,
+    subdiv: Optional[str] = None,
+    years: Optional[Union[int, Iterable[int]]] = None,
+    expand: bool = True,
+    observed: bool = True,
+    language: Optional[str] = None,
+    frozen: bool = False,
+) -> Union[HolidayBase, FrozenHolidays]:
     """
     Returns a new dictionary-like :py:class:`HolidayBase` object for the public
     holidays of the financial market matching **market** and other keyword
@@ -237,8 +385,14 @@ def financial_holidays(
         language translation is not supported the original holiday names
         will be used.
 
+    :param frozen:
+        Whether to return an immutable :py:class:`FrozenHolidays` snapshot
+        of the **years** holidays instead. The snapshot is shared between
+        all callers requesting the same holidays.
+
     :return:
-        A :py:class:`HolidayBase` object matching the **market**.
+        A :py:class:`HolidayBase` (or :py:class:`FrozenHolidays` if
+        **frozen** is True) object matching the **market**.
 
     Example usage:
 
@@ -251,8 +405,8 @@ def financial_holidays(
     import holidays
 
     try:
-        return getattr(holidays, market)(
-            years=years,
+        entity_holidays = getattr(holidays, market)(
+            years=None if frozen else years,
             subdiv=subdiv,
             expand=expand,
             observed=observed,
@@ -261,6 +415,8 @@ def financial_holidays(
     except AttributeError:
         raise NotImplementedError(f"Financial market {market} not available")
 
+    return _get_frozen_holidays(entity_holidays, years) if frozen else entity_holidays
+
 
 def CountryHoliday(  # noqa: N802
     country: str,
@@ -283,6 +439,43 @@ def CountryHoliday(  # noqa: N802
     return country_holidays(country, subdiv, years, expand, observed, prov, state)
 
 
+def _get_frozen_holidays(
+    entity_holidays: HolidayBase, years: Optional[Union[int, Iterable[int]]]
+) -> FrozenHolidays:
+    """
+    Get a frozen holidays snapshot shared between all callers requesting
+    the same entity holidays for the same years.
+
+    :param entity_holidays:
+        The entity holidays object (w/o populated years).
+
+    :param years:
+        The year(s) to freeze.
+
+    :return:
+        A :py:class:`FrozenHolidays` object.
+    """
+    if not (years_to_freeze := frozenset(_normalize_arguments(int, years))):
+        raise ValueError("Years must be specified for frozen holidays.")
+
+    if (population_key := entity_holidays._population_key) is None:
+        return entity_holidays.freeze(years_to_freeze)
+
+    key = (
+        population_key,
+        frozenset(entity_holidays.categories),
+        entity_holidays.language,
+        entity_holidays.observed,
+        years_to_freeze,
+    )
+    with _frozen_holidays_lock:
+        if (frozen_holidays := _frozen_holidays.get(key)) is None:
+            frozen_holidays = entity_holidays.freeze(years_to_freeze)
+            _frozen_holidays[key] = frozen_holidays
+
+    return frozen_holidays
+
+
 def _list_localized_entities(entity_codes: Iterable[str]) -> dict[str, list[str]]:
     """
     Get all localized entities and languages they support.
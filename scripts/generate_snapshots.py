@@ -13,21 +13,170 @@
 #  License: MIT (see LICENSE file)
 
 import argparse
+import ast
+import hashlib
 import json
 import sys
+import time
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 sys.path.append(f"{Path.cwd()}")  # Make holidays visible.
 
 import holidays  # noqa: E402
-from holidays import list_supported_countries, list_supported_financial  # noqa: E402
+from holidays import HolidayBase, list_supported_countries, list_supported_financial  # noqa: E402
+from holidays.registry import COUNTRIES, FINANCIAL  # noqa: E402
+
+SNAPSHOTS_PATH = Path("snapshots")
+MANIFEST_PATH = SNAPSHOTS_PATH / ".manifest.json"
+YEARS = range(1950, 2051)
+
+
+def save(snapshot, file_path):
+    with open(file_path, "w") as output:
+        output.write(
+            json.dumps({str(dt): name for dt, name in sorted(snapshot.items())}, indent=4)
+        )
+        output.write("\n")  # Get along with pre-commit.
+
+
+def generate_country_snapshots(country_code: str) -> tuple[list[str], float]:
+    """Generates a country snapshots (common and per subdivision ones)."""
+    started_at = time.perf_counter()
+    warnings.simplefilter("ignore")
+
+    country = getattr(holidays, country_code)
+    kwargs = {
+        "years": YEARS,
+        "categories": country.supported_categories,
+        "language": "en_US",
+    }
+
+    snapshots: dict[Optional[str], HolidayBase] = {
+        None: holidays.country_holidays(country_code, **kwargs)
+    }
+    snapshots.update(holidays.country_holidays_bundle(country_code, **kwargs))
+    file_paths = []
+    for subdiv, snapshot in snapshots.items():
+        file_path = (
+            "snapshots/countries/"
+            f"{country_code}_{(subdiv or 'COMMON').replace(' ', '_').upper()}.json"
+        )
+        save(snapshot, file_path)
+        file_paths.append(file_path)
+
+    return file_paths, time.perf_counter() - started_at
+
+
+def generate_financial_snapshots(market_code: str) -> tuple[list[str], float]:
+    """Generates a market snapshot."""
+    started_at = time.perf_counter()
+    warnings.simplefilter("ignore")
+
+    file_path = f"snapshots/financial/{market_code}.json"
+    save(holidays.country_holidays(market_code, years=YEARS, language="en_US"), file_path)
+
+    return [file_path], time.perf_counter() - started_at
+
+
+class InputsHasher:
+    """Calculates entity snapshot inputs content hashes.
+
+    The inputs are the entity module, the ``holidays`` package modules it
+    (transitively) imports, e.g., calendars and holiday groups, and the entity
+    locale files.
+    """
+
+    def __init__(self) -> None:
+        self.file_hashes: dict[Path, str] = {}
+        self.module_dependencies: dict[str, set[str]] = {}
+
+        # The generation process inputs shared by all entities.
+        self.common_hash = self.get_hash(
+            [Path(__file__), self.get_module_path("holidays.utils")], extra=f"{YEARS}"
+        )
+
+    @staticmethod
+    def get_module_path(module: str) -> Path:
+        path = Path(*module.split("."))
+        return path / "__init__.py" if path.is_dir() else path.with_suffix(".py")
+
+    def get_dependencies(self, module: str) -> set[str]:
+        """Returns a module and its transitive `holidays` package dependencies.
+
+        Parent packages' `__init__` modules are not included unless imported
+        explicitly as they don't affect the entity holidays.
+        """
+        dependencies = {module}
+        stack = [module]
+        while stack:
+            for dependency in self.get_imports(stack.pop()):
+                if dependency not in dependencies:
+                    dependencies.add(dependency)
+                    stack.append(dependency)
+
+        return dependencies
+
+    def get_imports(self, module: str) -> set[str]:
+        """Returns a module direct `holidays` package imports."""
+        if module in self.module_dependencies:
+            return self.module_dependencies[module]
+
+        path = self.get_module_path(module)
+        package = module if path.name == "__init__.py" else module.rpartition(".")[0]
+        imports: set[str] = set()
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+            if isinstance(node, ast.Import):
+                imports.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:  # Relative import.
+                    base = package.rsplit(".", node.level - 1)[0]
+                    name = f"{base}.{node.module}" if node.module else base
+                else:
+                    name = node.module or ""
+                for alias in node.names:
+                    submodule = f"{name}.{alias.name}"
+                    # `from package import module` or `from module import name`.
+                    imports.add(submodule if self.get_module_path(submodule).exists() else name)
+
+        imports = {
+            name
+            for name in imports
+            if name.split(".")[0] == "holidays" and self.get_module_path(name).exists()
+        }
+        self.module_dependencies[module] = imports
+
+        return imports
+
+    def get_file_hash(self, path: Path) -> str:
+        if path not in self.file_hashes:
+            self.file_hashes[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+
+        return self.file_hashes[path]
+
+    def get_hash(self, paths: list[Path], extra: str = "") -> str:
+        digest = hashlib.sha256(extra.encode())
+        for path in sorted(paths):
+            digest.update(f"{path}:{self.get_file_hash(path)}\n".encode())
+
+        return digest.hexdigest()
+
+    def get_entity_hash(self, module: str, entity_code: str) -> str:
+        """Returns an entity inputs hash."""
+        paths = [self.get_module_path(m) for m in self.get_dependencies(module)]
+        paths.extend(Path("holidays/locale").glob(f"*/LC_MESSAGES/{entity_code}.po"))
+
+        return self.get_hash(paths, extra=self.common_hash)
 
 
 class SnapshotGenerator:
-    """Creates a snapshot of available holidays for supported entities."""
+    """Creates a snapshot of available holidays for supported entities.
 
-    years = range(1950, 2051)
+    The entities are processed in parallel. The entities whose inputs haven't
+    changed since the previous run (see :class:`InputsHasher`) are skipped.
+    """
 
     def __init__(self) -> None:
         arg_parser = argparse.ArgumentParser()
@@ -51,66 +200,100 @@ class SnapshotGenerator:
             required=False,
             type=str,
         )
+        arg_parser.add_argument(
+            "-f",
+            "--force",
+            action="store_true",
+            help="Regenerate snapshots of the entities with unchanged inputs too",
+        )
+        arg_parser.add_argument(
+            "-j",
+            "--jobs",
+            default=None,
+            help="The number of worker processes (the number of processors by default)",
+            type=int,
+        )
         self.args = arg_parser.parse_args()
+        self.hasher = InputsHasher()
 
-    @staticmethod
-    def save(snapshot, file_path):
-        with open(file_path, "w") as output:
-            output.write(
-                json.dumps({str(dt): name for dt, name in sorted(snapshot.items())}, indent=4)
-            )
-            output.write("\n")  # Get along with pre-commit.
-
-    def generate_country_snapshots(self):
-        """Generates country snapshots."""
-        if self.args.market:
-            return None
-
-        supported_countries = list_supported_countries()
-        country_list = self.args.country or supported_countries
-        if unknown_countries := set(country_list).difference(supported_countries.keys()):
-            raise ValueError(f"Countries {', '.join(unknown_countries)} not available")
-
-        for country_code in country_list:
-            country = getattr(holidays, country_code)
-
-            for subdiv in (None,) + country.subdivisions:
-                self.save(
-                    holidays.country_holidays(
-                        country_code,
-                        subdiv=subdiv,
-                        years=self.years,
-                        categories=country.supported_categories,
-                        language="en_US",
-                    ),
-                    "snapshots/countries/"
-                    f"{country_code}_{(subdiv or 'COMMON').replace(' ', '_').upper()}.json",
-                )
+    def get_entities(self) -> list[tuple[str, str, str]]:
+        """Returns entities to generate snapshots for as (entity type, code,
+        module) tuples."""
+        entities: list[tuple[str, str]] = []
+        if not self.args.market:
+            supported_countries = list_supported_countries()
+            country_list = self.args.country or supported_countries
+            if unknown_countries := set(country_list).difference(supported_countries.keys()):
+                raise ValueError(f"Countries {', '.join(unknown_countries)} not available")
+            entities.extend(("countries", code) for code in country_list)
 
-    def generate_financial_snapshots(self):
-        """Generates financial snapshots."""
-        if self.args.country:
-            return None
-
-        supported_markets = list_supported_financial()
-        market_list = self.args.market or supported_markets
-        if unknown_markets := set(market_list).difference(supported_markets.keys()):
-            raise ValueError(f"Markets {', '.join(unknown_markets)} not available")
-
-        for market_code in market_list:
-            self.save(
-                holidays.country_holidays(
-                    market_code,
-                    years=self.years,
-                    language="en_US",
-                ),
-                f"snapshots/financial/{market_code}.json",
-            )
+        if not self.args.country:
+            supported_markets = list_supported_financial()
+            market_list = self.args.market or supported_markets
+            if unknown_markets := set(market_list).difference(supported_markets.keys()):
+                raise ValueError(f"Markets {', '.join(unknown_markets)} not available")
+            entities.extend(("financial", code) for code in market_list)
+
+        modules = {
+            code: f"holidays.{entity_type}.{module}"
+            for entity_type, registry in (("countries", COUNTRIES), ("financial", FINANCIAL))
+            for module, codes in registry.items()
+            for code in codes
+        }
+
+        return [(entity_type, code, modules[code]) for entity_type, code in entities]
+
+    @staticmethod
+    def load_manifest() -> dict:
+        try:
+            return json.loads(MANIFEST_PATH.read_text())
+        except (OSError, ValueError):
+            return {}
 
     def run(self):
         """Runs snapshot files generation process."""
-        self.generate_country_snapshots()
-        self.generate_financial_snapshots()
+        started_at = time.perf_counter()
+        manifest = self.load_manifest()
+        tasks = {}
+        skipped_count = 0
+        for entity_type, code, module in self.get_entities():
+            key = f"{entity_type}/{code}"
+            inputs_hash = self.hasher.get_entity_hash(module, code)
+            entry = manifest.get(key, {})
+            if (
+                not self.args.force
+                and entry.get("hash") == inputs_hash
+                and all(Path(file_path).exists() for file_path in entry.get("files", ()))
+            ):
+                skipped_count += 1
+                continue
+            tasks[key] = (entity_type, code, inputs_hash)
+
+        with ProcessPoolExecutor(self.args.jobs) as executor:
+            futures = {
+                key: executor.submit(
+                    generate_country_snapshots
+                    if entity_type == "countries"
+                    else generate_financial_snapshots,
+                    code,
+                )
+                for key, (entity_type, code, _) in tasks.items()
+            }
+            timings = {}
+            for key, future in futures.items():
+                file_paths, elapsed = future.result()
+                manifest[key] = {"files": file_paths, "hash": tasks[key][2], "time": elapsed}
+                timings[key] = elapsed
+
+        MANIFEST_PATH.write_text(json.dumps(manifest, indent=4, sort_keys=True) + "\n")
+
+        for key, elapsed in sorted(timings.items(), key=lambda item: -item[1]):
+            print(f"{key}: {elapsed:.2f}s")
+        print(
+            f"Generated {len(timings)} entities snapshots "
+            f"({skipped_count} up to date) "
+            f"in {time.perf_counter() - started_at:.2f}s."
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+"""Holidays memory footprint measurement.
+
+Run ``scripts/memory_footprint.py <code> [<code> ...]`` to get the entities
+memory footprint report.
+"""
+
+import argparse
+import gc
+import subprocess
+import sys
+import tracemalloc
+import warnings
+from collections.abc import Iterable
+from pathlib import Path
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Callable, NamedTuple, Optional
+
+sys.path.append(f"{Path(__file__).parents[1]}")  # Make holidays visible.
+
+from holidays.bulk import _get_entity_path  # noqa: E402
+from holidays.holiday_base import HolidayBase, _population_cache  # noqa: E402
+from holidays.registry import EntityLoader  # noqa: E402
+
+# The years of the multi-year instance.
+YEARS = range(1950, 2050)
+# The year of the single year instance.
+YEAR = 2024
+
+# The entity module import measurement code (run in a separate process).
+IMPORT_SIZE_CODE = """
+import importlib, sys, tracemalloc
+sys.path.insert(0, sys.argv[2])
+import holidays
+tracemalloc.start()
+importlib.import_module(sys.argv[1])
+print(tracemalloc.get_traced_memory()[0])
+"""
+
+
+class MemoryFootprint(NamedTuple):
+    """An entity memory footprint (in bytes)."""
+
+    entity: str
+    """The country or market code."""
+    import_size: Optional[int]
+    """The memory allocated by the entity module import, None if not
+    measured (see :func:`get_import_size`)."""
+    year_size: int
+    """The memory retained by a single year instance creation."""
+    years_size: int
+    """The memory retained by a multi-year (:data:`YEARS`) instance creation."""
+    breakdown: dict[str, int]
+    """The multi-year instance size breakdown, see :func:`get_size_breakdown`."""
+
+
+def _get_size(obj: Any, seen: set[int]) -> int:
+    """Return an object size including the objects it references (except for
+    the ones already seen, classes, modules and functions)."""
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(
+            obj, (type, ModuleType, FunctionType, BuiltinFunctionType)
+        ):
+            continue
+        seen.add(id(obj))
+
+        if isinstance(obj, HolidayBase):
+            size += dict.__sizeof__(obj)
+        else:
+            size += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif isinstance(obj, MethodType):
+            stack.append(obj.__self__)
+        elif hasattr(obj, "__dict__"):
+            stack.append(obj.__dict__)
+
+    return size
+
+
+def _is_calendar(obj: Any) -> bool:
+    return any(klass.__module__.startswith("holidays.calendars.") for klass in type(obj).__mro__)
+
+
+def get_size_breakdown(holidays: HolidayBase) -> dict[str, int]:
+    """Return a holidays object memory size breakdown (in bytes).
+
+    The objects are counted once, in the breakdown order, including the ones
+    shared with other instances (e.g., the translation catalog or calendar
+    tables):
+
+    * ``dates``: the holidays hash table and the dates;
+    * ``names``: the holiday name strings;
+    * ``tr``: the translation function and the translation catalog;
+    * ``weekend_workdays``: the weekend working days set;
+    * ``special_holidays``: the special and substituted holidays attributes
+      (see :class:`holidays.groups.StaticHolidays`);
+    * ``calendars``: the lunar, lunisolar and other calendars, including
+      their class level dates tables;
+    * ``attributes``: the rest of the instance attributes.
+
+    :param holidays:
+        The holidays object.
+
+    :return:
+        The holidays object memory size breakdown.
+    """
+    seen: set[int] = {id(holidays.__dict__)}
+    attributes = holidays.__dict__
+    calendars = [value for value in attributes.values() if _is_calendar(value)]
+    breakdown = {
+        "dates": dict.__sizeof__(holidays) + sum(_get_size(dt, seen) for dt in holidays),
+        "names": sum(_get_size(name, seen) for name in holidays.values()),
+        "tr": _get_size(attributes.get("tr"), seen),
+        "weekend_workdays": _get_size(attributes.get("weekend_workdays"), seen),
+        "special_holidays": sum(
+            _get_size(value, seen)
+            for name, value in attributes.items()
+            if name.startswith(("special_", "substituted_"))
+        ),
+        "calendars": sum(
+            _get_size(calendar, seen)
+            + sum(
+                _get_size(value, seen)
+                for klass in type(calendar).__mro__
+                for value in vars(klass).values()
+                if isinstance(value, (dict, tuple))
+            )
+            for calendar in calendars
+        ),
+    }
+    breakdown["attributes"] = sys.getsizeof(attributes) + sum(
+        _get_size(name, seen) + _get_size(value, seen) for name, value in attributes.items()
+    )
+
+    return breakdown
+
+
+def _get_retained_size(create: Callable[[], Any]) -> tuple[int, Any]:
+    """Return the memory retained by an object creation and the object."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        obj = create()
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    return size, obj
+
+
+def get_import_size(entity: str) -> int:
+    """Return the memory allocated by an entity module import (in bytes).
+
+    The import is measured in a separate Python process on top of the
+    ``holidays`` package import (which includes the calendars). Note that the
+    entity module import includes its package (:mod:`holidays.countries` or
+    :mod:`holidays.financial`) import, i.e., all the package entities.
+
+    :param entity:
+        The country or market code.
+
+    :return:
+        The entity module import size.
+    """
+    module = _get_entity_path(entity).rpartition(".")[0]
+    result = subprocess.run(
+        (sys.executable, "-c", IMPORT_SIZE_CODE, module, str(Path(__file__).parents[1])),
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    return int(result.stdout)
+
+
+def get_footprint(
+    entity: str,
+    years: Iterable[int] = YEARS,
+    year: int = YEAR,
+    measure_import: bool = True,
+    **kwargs,
+) -> MemoryFootprint:
+    """Measure an entity memory footprint.
+
+    The population cache is cleared before each instance creation, so the
+    retained sizes include the cached population results. The entity class
+    import and the translation catalog loading are not included.
+
+    :param entity:
+        The country or market code.
+
+    :param years:
+        The years of the multi-year instance.
+
+    :param year:
+        The year of the single year instance.
+
+    :param measure_import:
+        Whether to measure the entity module import (in a separate process).
+
+    :param kwargs:
+        The entity class arguments, e.g., ``subdiv`` or ``categories``.
+
+    :return:
+        The entity memory footprint.
+    """
+    entity_cls: Any = EntityLoader(_get_entity_path(entity)).get_entity()
+    entity_cls(years=(), **kwargs)  # Warm up (e.g., load the translation catalog).
+
+    _population_cache.clear()
+    year_size, _ = _get_retained_size(lambda: entity_cls(years=year, **kwargs))
+    _population_cache.clear()
+    years_size, holidays = _get_retained_size(lambda: entity_cls(years=years, **kwargs))
+    _population_cache.clear()
+
+    return MemoryFootprint(
+        entity,
+        get_import_size(entity) if measure_import else None,
+        year_size,
+        years_size,
+        get_size_breakdown(holidays),
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(
+        prog="memory_footprint.py",
+        description="Report the holidays memory footprint per entity.",
+    )
+    arg_parser.add_argument(
+        "entities",
+        help="Country/market codes to measure, `all` for all supported entities",
+        nargs="+",
+    )
+    arg_parser.add_argument(
+        "--no-import",
+        action="store_true",
+        help="Do not measure the entity modules import (faster)",
+    )
+    args = arg_parser.parse_args(argv)
+
+    codes = args.entities
+    if codes == ["all"]:
+        codes = [
+            *EntityLoader.get_country_codes(include_aliases=False),
+            *EntityLoader.get_financial_codes(include_aliases=False),
+        ]
+
+    footprints = sorted(
+        (get_footprint(code, measure_import=not args.no_import) for code in codes),
+        key=lambda footprint: -footprint.years_size,
+    )
+
+    breakdown_names = tuple(footprints[0].breakdown)
+    print(
+        f"{'entity':<8} {'import':>8} {'1 year':>8} {f'{len(YEARS)} years':>9} | "
+        + " ".join(f"{name[:9]:>9}" for name in breakdown_names)
+    )
+    for footprint in footprints:
+        import_size = (
+            f"{footprint.import_size / 1024:.1f}" if footprint.import_size is not None else "-"
+        )
+        print(
+            f"{footprint.entity:<8} {import_size:>8} {footprint.year_size / 1024:>8.1f} "
+            f"{footprint.years_size / 1024:>9.1f} | "
+            + " ".join(f"{footprint.breakdown[name] / 1024:>9.1f}" for name in breakdown_names)
+        )
+    print(f"\nSizes in KiB, breakdown of the {YEARS.start}-{YEARS.stop - 1} instances.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    sys.exit(main())
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import argparse
+import json
+import sys
+import time
+import warnings
+import zlib
+from array import array
+from datetime import date
+from itertools import chain
+from pathlib import Path
+from typing import Optional
+
+sys.path.append(f"{Path.cwd()}")  # Make holidays visible.
+
+from holidays.bulk import PackedHolidays, generate  # noqa: E402
+from holidays.registry import EntityLoader  # noqa: E402
+
+BUNDLE_PATH = Path("snapshots/snapshots.bin")
+MAGIC = b"HSNAP\x00\x00\x01"
+YEARS = range(1950, 2051)
+LANGUAGE = "en_US"
+
+# Column name to array type code.
+COLUMNS = {"entity_ids": "H", "subdiv_ids": "H", "ordinals": "i", "name_ids": "I"}
+
+Holidays = dict[int, str]  # Date ordinal to holiday name.
+
+
+class SnapshotBundle:
+    """A consolidated holidays snapshot of all entities and subdivisions.
+
+    Unlike the JSON snapshots the bundle is not stored in the repository:
+    create it for a known good revision (``make snapshot-bundle``) and verify
+    the changed code against it (``make snapshot-verify``).
+
+    The holidays are stored as (entity, subdivision, date ordinal, name)
+    columns sorted by entity, subdivision and date with entities, subdivisions
+    and names tables. The file consists of the magic bytes followed by zlib
+    compressed header length (4 bytes, little endian), JSON header and the
+    columns data.
+    """
+
+    def __init__(self, header: dict, columns: dict[str, array]) -> None:
+        self.header = header
+        self.columns = columns
+
+    @staticmethod
+    def create(packed_holidays: list[PackedHolidays], years: range) -> "SnapshotBundle":
+        entities: dict[str, int] = {}
+        subdivs: dict[str, int] = {}
+        names: dict[str, int] = {}
+        columns = {column: array(typecode) for column, typecode in COLUMNS.items()}
+
+        groups: dict[tuple[str, str], list[tuple[int, str]]] = {}
+        for chunk in packed_holidays:
+            groups.setdefault((chunk.entity, chunk.subdiv or ""), []).extend(
+                (ordinal, chunk.names[name_id])
+                for ordinal, name_id in zip(chunk.ordinals, chunk.name_ids)
+            )
+
+        for (entity, subdiv), holidays in groups.items():
+            holidays.sort()
+            entity_id = entities.setdefault(entity, len(entities))
+            subdiv_id = subdivs.setdefault(subdiv, len(subdivs))
+            columns["entity_ids"].extend([entity_id] * len(holidays))
+            columns["subdiv_ids"].extend([subdiv_id] * len(holidays))
+            columns["ordinals"].extend(ordinal for ordinal, _ in holidays)
+            columns["name_ids"].extend(names.setdefault(name, len(names)) for _, name in holidays)
+
+        header = {
+            "entities": list(entities),
+            "language": LANGUAGE,
+            "names": list(names),
+            "subdivs": list(subdivs),
+            "years": [years.start, years.stop],
+        }
+
+        return SnapshotBundle(header, columns)
+
+    @staticmethod
+    def load(path: Path) -> "SnapshotBundle":
+        data = path.read_bytes()
+        if not data.startswith(MAGIC):
+            raise ValueError(f"{path} is not a snapshot bundle")
+
+        data = zlib.decompress(data[len(MAGIC) :])
+        header_length = int.from_bytes(data[:4], "little")
+        header = json.loads(data[4 : 4 + header_length])
+
+        columns = {}
+        offset = 4 + header_length
+        for column, typecode in COLUMNS.items():
+            values = array(typecode)
+            size = header["rows"] * values.itemsize
+            values.frombytes(data[offset : offset + size])
+            if header["byteorder"] != sys.byteorder:
+                values.byteswap()
+            columns[column] = values
+            offset += size
+
+        return SnapshotBundle(header, columns)
+
+    def save(self, path: Path) -> None:
+        header = {
+            **self.header,
+            "byteorder": sys.byteorder,
+            "rows": len(self.columns["ordinals"]),
+        }
+        header_data = json.dumps(header, ensure_ascii=False).encode()
+        data = b"".join(
+            chain(
+                (len(header_data).to_bytes(4, "little"), header_data),
+                (self.columns[column].tobytes() for column in COLUMNS),
+            )
+        )
+        path.write_bytes(MAGIC + zlib.compress(data, 9))
+
+    def get_groups(self) -> dict[str, dict[str, tuple[int, int]]]:
+        """Returns entity to subdivision (empty string for the entity-wide
+        holidays) to the rows range mapping."""
+        entities = self.header["entities"]
+        subdivs = self.header["subdivs"]
+
+        groups: dict[str, dict[str, tuple[int, int]]] = {}
+        start = 0
+        keys = list(zip(self.columns["entity_ids"], self.columns["subdiv_ids"]))
+        for idx in range(1, len(keys) + 1):
+            if idx == len(keys) or keys[idx] != keys[start]:
+                entity_id, subdiv_id = keys[start]
+                groups.setdefault(entities[entity_id], {})[subdivs[subdiv_id]] = (start, idx)
+                start = idx
+
+        return groups
+
+    def get_holidays(self, start: int, stop: int) -> Holidays:
+        """Returns the holidays of a rows range."""
+        return dict(
+            zip(
+                self.columns["ordinals"][start:stop],
+                map(self.header["names"].__getitem__, self.columns["name_ids"][start:stop]),
+            )
+        )
+
+
+def generate_holidays(entities: Optional[list[str]], years: range, jobs: Optional[int]):
+    """Generates live holidays for the snapshot bundle."""
+    return generate(
+        entities=entities,
+        subdivs="all",
+        years=years,
+        categories="all",
+        language=LANGUAGE,
+        packed=True,
+        max_workers=jobs,
+    )
+
+
+def get_diff(expected: Holidays, actual: Holidays) -> list[str]:
+    """Returns the differences between the expected and actual holidays."""
+    diff = []
+    for ordinal in sorted(expected.keys() | actual.keys()):
+        expected_name = expected.get(ordinal)
+        actual_name = actual.get(ordinal)
+        if expected_name != actual_name:
+            diff.append(f"{date.fromordinal(ordinal)}: {expected_name!r} -> {actual_name!r}")
+
+    return diff
+
+
+def create(args: argparse.Namespace) -> int:
+    """Creates a snapshot bundle of the current holidays."""
+    packed_holidays = list(generate_holidays(None, YEARS, args.jobs))
+    bundle = SnapshotBundle.create(packed_holidays, YEARS)
+    bundle.save(args.path)
+    print(
+        f"Saved {len(bundle.columns['ordinals'])} holidays of "
+        f"{len(bundle.header['entities'])} entities to {args.path}."
+    )
+
+    return 0
+
+
+def verify(args: argparse.Namespace) -> int:
+    """Compares the current holidays to a snapshot bundle in one streaming
+    pass and reports the per entity differences."""
+    bundle = SnapshotBundle.load(args.path)
+    groups = bundle.get_groups()
+    years = range(*bundle.header["years"])
+
+    supported_entities = set(
+        chain(
+            EntityLoader.get_country_codes(include_aliases=False),
+            EntityLoader.get_financial_codes(include_aliases=False),
+        )
+    )
+    entities = args.entity or sorted(supported_entities | groups.keys())
+    diffs: dict[str, list[str]] = {}
+    for entity in entities:
+        if entity not in supported_entities:
+            diffs[entity] = ["entity is not supported"]
+        elif entity not in groups:
+            diffs[entity] = ["entity is not in the bundle"]
+
+    # The entity results are streamed consecutively.
+    actual_holidays: dict[str, Holidays] = {}
+
+    def compare(entity: str) -> None:
+        entity_groups = groups[entity]
+        for subdiv in sorted(entity_groups.keys() | actual_holidays.keys()):
+            expected = bundle.get_holidays(*entity_groups.get(subdiv, (0, 0)))
+            if diff := get_diff(expected, actual_holidays.get(subdiv, {})):
+                diffs.setdefault(entity, []).extend(
+                    f"{subdiv or 'COMMON'}: {line}" for line in diff
+                )
+        actual_holidays.clear()
+
+    current_entity = None
+    for chunk in generate_holidays(
+        [entity for entity in entities if entity in supported_entities and entity not in diffs],
+        years,
+        args.jobs,
+    ):
+        if chunk.entity != current_entity:
+            if current_entity is not None:
+                compare(current_entity)
+            current_entity = chunk.entity
+        actual_holidays.setdefault(chunk.subdiv or "", {}).update(
+            (ordinal, chunk.names[name_id])
+            for ordinal, name_id in zip(chunk.ordinals, chunk.name_ids)
+        )
+    if current_entity is not None:
+        compare(current_entity)
+
+    for entity, diff in sorted(diffs.items()):
+        print(f"{entity}: {len(diff)} difference(s)")
+        for line in diff[: args.limit]:
+            print(f"    {line}")
+        if len(diff) > args.limit:
+            print(f"    ... {len(diff) - args.limit} more")
+    print(
+        f"Verified {len(entities)} entities against {args.path}: "
+        f"{len(diffs)} with differences."
+    )
+
+    return 1 if diffs else 0
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(
+        description="Create or verify a consolidated binary holidays snapshot bundle."
+    )
+    arg_parser.add_argument(
+        "-j",
+        "--jobs",
+        default=None,
+        help="The number of worker processes (the number of processors by default)",
+        type=int,
+    )
+    arg_parser.add_argument(
+        "-p",
+        "--path",
+        default=BUNDLE_PATH,
+        help=f"The snapshot bundle path ({BUNDLE_PATH} by default)",
+        type=Path,
+    )
+    subparsers = arg_parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("create", help="Create a snapshot bundle").set_defaults(func=create)
+    verify_parser = subparsers.add_parser("verify", help="Verify holidays against the bundle")
+    verify_parser.add_argument(
+        "-e",
+        "--entity",
+        action="extend",
+        nargs="+",
+        default=[],
+        help="Country/market codes to verify (all by default)",
+        type=str,
+    )
+    verify_parser.add_argument(
+        "-l",
+        "--limit",
+        default=10,
+        help="The maximum number of differences to report per entity",
+        type=int,
+    )
+    verify_parser.set_defaults(func=verify)
+
+    args = arg_parser.parse_args()
+    started_at = time.perf_counter()
+    result = args.func(args)
+    print(f"Done in {time.perf_counter() - started_at:.2f}s.")
+
+    return result
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    sys.exit(main())
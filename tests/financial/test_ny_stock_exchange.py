@@ -487,3 +487,10 @@ class TestNewYorkStockExchange(CommonFinancialTests, TestCase):
             ("2023-11-23", "Thanksgiving Day"),
             ("2023-12-25", "Christmas Day"),
         )
+
+    def test_early_closes(self):
+        self.assertEqual(
+            self.holidays.get_early_closes(2024),
+            {date(2024, JUL, 3), date(2024, NOV, 29), date(2024, DEC, 24)},
+        )
+        self.assertEqual(self.holidays.get_early_closes(1992), set())
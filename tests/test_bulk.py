@@ -0,0 +1,97 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import unittest
+from datetime import date
+
+from holidays.bulk import YEARS_CHUNK_SIZE, HolidayRecord, PackedHolidays, generate
+from holidays.countries import UnitedStates
+from holidays.utils import country_holidays, financial_holidays
+
+
+class TestGenerate(unittest.TestCase):
+    @staticmethod
+    def _get_records(holidays, entity, subdiv=None):
+        return [
+            HolidayRecord(entity, subdiv, dt, tuple(holidays.get_list(dt)))
+            for dt in sorted(holidays)
+        ]
+
+    def test_records(self):
+        self.assertEqual(
+            list(generate("US", subdivs=(None, "CA"), years=2024, max_workers=1)),
+            self._get_records(country_holidays("US", years=2024), "US")
+            + self._get_records(country_holidays("US", subdiv="CA", years=2024), "US", "CA"),
+        )
+
+    def test_subdivs(self):
+        records = list(generate("US", years=2024, max_workers=1))
+        self.assertEqual(
+            list(dict.fromkeys(record.subdiv for record in records)),
+            [None, *UnitedStates.subdivisions],
+        )
+
+        records = list(generate(("US", "NYSE"), subdivs=None, years=2024, max_workers=1))
+        self.assertEqual(
+            records,
+            self._get_records(country_holidays("US", years=2024), "US")
+            + self._get_records(financial_holidays("NYSE", years=2024), "NYSE"),
+        )
+
+    def test_packed(self):
+        packed = list(
+            generate("FR", subdivs=None, years=range(2000, 2030), packed=True, max_workers=1)
+        )
+        self.assertEqual(len(packed), 2)
+        for packed_holidays, years in zip(
+            packed, (range(2000, 2000 + YEARS_CHUNK_SIZE), range(2000 + YEARS_CHUNK_SIZE, 2030))
+        ):
+            self.assertIsInstance(packed_holidays, PackedHolidays)
+            self.assertEqual(
+                list(packed_holidays.records()),
+                self._get_records(country_holidays("FR", years=years), "FR"),
+            )
+
+    def test_kwargs(self):
+        records = list(
+            generate(
+                "TH",
+                subdivs=None,
+                years=2024,
+                categories="all",
+                language="en_US",
+                observed=False,
+                max_workers=1,
+            )
+        )
+        holidays = country_holidays(
+            "TH",
+            years=2024,
+            categories=country_holidays("TH").supported_categories,
+            language="en_US",
+            observed=False,
+        )
+        self.assertEqual(records, self._get_records(holidays, "TH"))
+        self.assertIn(
+            HolidayRecord("TH", None, date(2024, 1, 1), ("New Year's Day",)),
+            records,
+        )
+
+    def test_process_pool(self):
+        kwargs = {"entities": ("DE", "ECB"), "years": range(2020, 2050)}
+        self.assertEqual(
+            list(generate(**kwargs, max_workers=2)), list(generate(**kwargs, max_workers=1))
+        )
+
+    def test_errors(self):
+        self.assertRaises(NotImplementedError, lambda: generate("XX", years=2024))
+        self.assertRaises(ValueError, lambda: generate("US"))
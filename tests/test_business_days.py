@@ -0,0 +1,130 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import unittest
+from datetime import date, timedelta
+
+from holidays.business_days import (
+    END_OF_MONTH,
+    FOLLOWING,
+    MODIFIED_FOLLOWING,
+    MODIFIED_PRECEDING,
+    PRECEDING,
+    BusinessCalendar,
+)
+from holidays.countries import UnitedArabEmirates, UnitedKingdom, UnitedStates
+from holidays.financial import EuropeanCentralBank, NewYorkStockExchange
+
+
+class TestBusinessCalendar(unittest.TestCase):
+    def setUp(self):
+        self.calendars = (NewYorkStockExchange(), EuropeanCentralBank(), UnitedKingdom())
+        self.calendar = BusinessCalendar(*self.calendars)
+
+    def _get_nth_working_day(self, dt, n):
+        step = timedelta(days=1 if n > 0 else -1)
+        for _ in range(abs(n)):
+            dt += step
+            while not all(calendar.is_working_day(dt) for calendar in self.calendars):
+                dt += step
+
+        return dt
+
+    def test_no_calendars(self):
+        self.assertRaises(ValueError, BusinessCalendar)
+
+    def test_is_working_day(self):
+        for dt in ("2024-12-24", "2024-12-31", "2025-01-02"):
+            self.assertTrue(self.calendar.is_working_day(dt), dt)
+        # NYSE, ECB, UK holidays and weekends.
+        for dt in ("2024-07-04", "2024-05-01", "2024-05-27", "2024-12-26", "2024-12-28"):
+            self.assertFalse(self.calendar.is_working_day(dt), dt)
+
+    def test_get_nth_working_day(self):
+        self.assertEqual(self.calendar.get_nth_working_day("2024-12-23", 2), date(2024, 12, 27))
+        self.assertEqual(self.calendar.get_nth_working_day("2024-12-27", -2), date(2024, 12, 23))
+        self.assertEqual(self.calendar.get_nth_working_day("2024-12-25", 1), date(2024, 12, 27))
+        self.assertEqual(self.calendar.get_nth_working_day("2024-12-25", -1), date(2024, 12, 24))
+        self.assertEqual(self.calendar.get_nth_working_day("2024-12-25", 0), date(2024, 12, 25))
+
+        for dt, n in (
+            (date(1999, 12, 31), 1),
+            (date(2001, 1, 1), -1),
+            (date(2010, 4, 1), 3),
+            (date(2015, 6, 15), 750),
+            (date(2020, 3, 4), -1000),
+        ):
+            self.assertEqual(
+                self.calendar.get_nth_working_day(dt, n), self._get_nth_working_day(dt, n)
+            )
+
+    def test_get_nth_working_days(self):
+        dates = [date(2024, 12, 20), date(2024, 12, 23), date(2024, 12, 24)]
+        self.assertEqual(
+            self.calendar.get_nth_working_days(dates, 2),
+            [date(2024, 12, 24), date(2024, 12, 27), date(2024, 12, 30)],
+        )
+        self.assertEqual(self.calendar.get_nth_working_days((), 2), [])
+
+    def test_get_working_days_count(self):
+        self.assertEqual(self.calendar.get_working_days_count("2024-12-23", "2024-12-31"), 5)
+        self.assertEqual(self.calendar.get_working_days_count("2024-12-31", "2024-12-23"), 5)
+        self.assertEqual(self.calendar.get_working_days_count("2024-12-25", "2024-12-25"), 0)
+        self.assertEqual(
+            BusinessCalendar(UnitedStates()).get_working_days_count("2024-01-01", "2024-12-31"),
+            UnitedStates().get_working_days_count("2024-01-01", "2024-12-31"),
+        )
+
+    def test_get_working_days_counts(self):
+        self.assertEqual(
+            self.calendar.get_working_days_counts(
+                ["2024-12-23", date(2024, 12, 25), "2025-01-10"],
+                [date(2024, 12, 31), "2024-12-25", "2024-12-23"],
+            ),
+            [5, 0, 12],
+        )
+        self.assertEqual(self.calendar.get_working_days_counts([], []), [])
+
+    def test_roll(self):
+        for dt, convention, expected in (
+            ("2024-12-24", FOLLOWING, date(2024, 12, 24)),
+            ("2024-12-25", FOLLOWING, date(2024, 12, 27)),
+            ("2024-12-25", PRECEDING, date(2024, 12, 24)),
+            ("2024-03-30", FOLLOWING, date(2024, 4, 2)),
+            ("2024-03-30", MODIFIED_FOLLOWING, date(2024, 3, 28)),
+            ("2024-03-31", MODIFIED_FOLLOWING, date(2024, 3, 28)),
+            ("2024-04-15", MODIFIED_FOLLOWING, date(2024, 4, 15)),
+            ("2024-06-01", PRECEDING, date(2024, 5, 31)),
+            ("2024-06-01", MODIFIED_PRECEDING, date(2024, 6, 3)),
+            ("2025-01-01", MODIFIED_PRECEDING, date(2025, 1, 2)),
+            ("2024-03-05", END_OF_MONTH, date(2024, 3, 28)),
+            ("2024-02-10", END_OF_MONTH, date(2024, 2, 29)),
+            ("2024-12-01", END_OF_MONTH, date(2024, 12, 31)),
+        ):
+            self.assertEqual(self.calendar.roll(dt, convention), expected, (dt, convention))
+        self.assertEqual(self.calendar.roll("2024-12-25"), date(2024, 12, 27))
+        self.assertRaises(ValueError, lambda: self.calendar.roll("2024-12-25", "nearest"))
+
+    def test_roll_dates(self):
+        self.assertEqual(
+            self.calendar.roll_dates(
+                ["2024-03-29", "2024-03-30", date(2024, 4, 1)], MODIFIED_FOLLOWING
+            ),
+            [date(2024, 3, 28), date(2024, 3, 28), date(2024, 4, 2)],
+        )
+        self.assertEqual(self.calendar.roll_dates([], PRECEDING), [])
+
+    def test_weekend_workdays(self):
+        # UAE switched to the Saturday-Sunday weekend in 2022.
+        calendar = BusinessCalendar(UnitedArabEmirates(), UnitedStates())
+        self.assertEqual(calendar.get_nth_working_day("2021-12-30", 1), date(2022, 1, 3))
+        self.assertEqual(calendar.get_nth_working_day("2021-07-08", 1), date(2021, 7, 12))
@@ -0,0 +1,120 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import unittest
+from datetime import date, datetime, time, timedelta, timezone
+
+from holidays.business_days import BusinessCalendar
+from holidays.business_hours import BusinessHours
+from holidays.calendars.gregorian import MON, FRI, SAT
+from holidays.countries import China, UnitedStates
+
+
+class TestBusinessHours(unittest.TestCase):
+    def setUp(self):
+        self.business_hours = BusinessHours(UnitedStates(), ("09:00", "17:00"))
+
+    def test_init(self):
+        self.assertRaises(ValueError, lambda: BusinessHours(UnitedStates(), ("17:00", "09:00")))
+        self.assertRaises(ValueError, lambda: BusinessHours(UnitedStates(), ("09:00", "25:00")))
+        self.assertRaises(ValueError, lambda: BusinessHours(UnitedStates(), ("9", "17")))
+        self.assertRaises(
+            ValueError,
+            lambda: BusinessHours(UnitedStates(), [("09:00", "13:00"), ("12:00", "17:00")]),
+        )
+        self.assertRaises(ValueError, lambda: BusinessHours(UnitedStates(), {SAT: []}))
+
+        calendar = BusinessCalendar(UnitedStates())
+        self.assertIs(BusinessHours(calendar).calendar, calendar)
+        self.assertEqual(
+            BusinessHours(UnitedStates(), (time(9), "24:00")).intervals[MON],
+            ((32400, 86400),),
+        )
+
+    def test_get_duration(self):
+        get_duration = self.business_hours.get_duration
+        self.assertEqual(get_duration("2024-12-23 09:00", "2024-12-23 17:00"), timedelta(hours=8))
+        self.assertEqual(
+            get_duration("2024-12-23 07:00", "2024-12-23 12:30"), timedelta(hours=3.5)
+        )
+        self.assertEqual(get_duration("2024-12-23 18:00", "2024-12-24 08:00"), timedelta(0))
+        # Christmas Day.
+        self.assertEqual(get_duration("2024-12-24 15:00", "2024-12-26 10:00"), timedelta(hours=3))
+        self.assertEqual(get_duration("2024-12-26 10:00", "2024-12-24 15:00"), timedelta(hours=-3))
+        # Weekend.
+        self.assertEqual(get_duration("2024-12-27 16:00", "2024-12-30 10:00"), timedelta(hours=2))
+        self.assertEqual(get_duration(date(2024, 12, 23), date(2024, 12, 30)), timedelta(hours=32))
+        self.assertEqual(
+            get_duration(datetime(2000, 1, 1), datetime(2030, 1, 1)),
+            timedelta(hours=8 * UnitedStates().get_working_days_count("2000-01-01", "2029-12-31")),
+        )
+
+    def test_get_deadline(self):
+        get_deadline = self.business_hours.get_deadline
+        self.assertEqual(get_deadline("2024-12-23 10:00", 2), datetime(2024, 12, 23, 12))
+        self.assertEqual(get_deadline("2024-12-23 10:00", 7), datetime(2024, 12, 23, 17))
+        self.assertEqual(get_deadline("2024-12-23 10:00", 8), datetime(2024, 12, 24, 10))
+        self.assertEqual(get_deadline("2024-12-23 20:00", 0.5), datetime(2024, 12, 24, 9, 30))
+        self.assertEqual(get_deadline("2024-12-24 15:00", 16), datetime(2024, 12, 27, 15))
+        self.assertEqual(
+            get_deadline("2024-12-27 16:00", timedelta(hours=1, minutes=30)),
+            datetime(2024, 12, 30, 9, 30),
+        )
+        self.assertEqual(get_deadline("2024-12-23 10:00", 0), datetime(2024, 12, 23, 10))
+
+        self.assertEqual(get_deadline("2024-12-26 10:00", -1), datetime(2024, 12, 26, 9))
+        self.assertEqual(get_deadline("2024-12-26 10:00", -3), datetime(2024, 12, 24, 15))
+        self.assertEqual(get_deadline("2024-12-26 10:00", -9), datetime(2024, 12, 24, 9))
+        self.assertEqual(get_deadline("2024-12-26 10:00", -10), datetime(2024, 12, 23, 16))
+        self.assertEqual(get_deadline("2024-12-30 09:00", -8), datetime(2024, 12, 27, 9))
+
+        self.assertEqual(get_deadline("2024-01-02 09:00", 8 * 2500), datetime(2033, 12, 15, 17))
+        self.assertEqual(get_deadline("2033-12-16 09:00", -8 * 2500), datetime(2024, 1, 2, 9))
+
+        tzinfo = timezone(timedelta(hours=-5))
+        self.assertEqual(
+            get_deadline(datetime(2024, 12, 23, 16, tzinfo=tzinfo), 2),
+            datetime(2024, 12, 24, 10, tzinfo=tzinfo),
+        )
+
+    def test_weekday_hours(self):
+        business_hours = UnitedStates().to_business_hours(
+            {MON: [("09:00", "12:00"), ("13:00", "17:00")], FRI: [("09:00", "13:00")]}
+        )
+        self.assertIsInstance(business_hours, BusinessHours)
+        self.assertEqual(
+            business_hours.get_duration("2024-12-23 00:00", "2024-12-31 00:00"),
+            timedelta(hours=18),
+        )
+        self.assertEqual(
+            business_hours.get_deadline("2024-12-23 11:00", 1), datetime(2024, 12, 23, 12)
+        )
+        self.assertEqual(
+            business_hours.get_deadline("2024-12-23 11:00", 2), datetime(2024, 12, 23, 14)
+        )
+        self.assertEqual(
+            business_hours.get_deadline("2024-12-23 14:00", -1), datetime(2024, 12, 23, 13)
+        )
+        self.assertEqual(
+            business_hours.get_deadline("2024-12-23 17:00", 1), datetime(2024, 12, 27, 10)
+        )
+
+    def test_weekend_workdays(self):
+        # 2024-02-18 (Sunday) is a make-up working day.
+        business_hours = China().to_business_hours()
+        self.assertEqual(
+            business_hours.get_duration("2024-02-17 00:00", "2024-02-19 00:00"),
+            timedelta(hours=8),
+        )
+        self.assertEqual(
+            business_hours.get_deadline("2024-02-09 12:00", 8), datetime(2024, 2, 18, 12)
+        )
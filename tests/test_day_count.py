@@ -0,0 +1,73 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import unittest
+from datetime import date
+
+from holidays.business_days import BusinessCalendar
+from holidays.countries import Brazil
+from holidays.day_count import ACT_360, ACT_365F, BUS_252, DayCounter
+
+
+class TestDayCounter(unittest.TestCase):
+    def setUp(self):
+        self.holidays = Brazil()
+        self.day_counter = DayCounter(BUS_252, self.holidays)
+
+    def test_init(self):
+        self.assertRaises(ValueError, lambda: DayCounter("30/360"))
+        self.assertRaises(ValueError, lambda: DayCounter(BUS_252))
+        self.assertIsInstance(self.day_counter.calendar, BusinessCalendar)
+        calendar = BusinessCalendar(self.holidays)
+        self.assertIs(DayCounter(BUS_252, calendar).calendar, calendar)
+        self.assertEqual(DayCounter().convention, ACT_365F)
+
+    def test_bus_252(self):
+        # Labor Day.
+        self.assertEqual(self.day_counter.day_count("2024-04-30", "2024-05-02"), 1)
+        self.assertEqual(self.day_counter.day_count("2024-04-30", "2024-05-03"), 2)
+        self.assertEqual(self.day_counter.day_count("2024-05-01", "2024-05-02"), 0)
+        self.assertEqual(self.day_counter.day_count("2024-04-26", "2024-05-06"), 5)
+        self.assertEqual(self.day_counter.day_count("2024-05-06", "2024-04-26"), -5)
+        self.assertEqual(self.day_counter.day_count("2024-05-06", "2024-05-06"), 0)
+        self.assertEqual(self.day_counter.day_count("2024-01-01", "2025-01-01"), 256)
+        self.assertEqual(self.day_counter.year_fraction("2024-04-26", "2024-05-06"), 5 / 252)
+
+        for start, end in (
+            (date(2000, 1, 1), date(2030, 1, 1)),
+            (date(2015, 12, 31), date(2016, 1, 1)),
+            (date(2023, 3, 3), date(2023, 11, 16)),
+        ):
+            self.assertEqual(
+                self.day_counter.day_count(start, end),
+                self.holidays.get_working_days_count(start, end)
+                - self.holidays.is_working_day(end),
+            )
+
+    def test_act(self):
+        for convention, days_in_year in ((ACT_360, 360), (ACT_365F, 365)):
+            day_counter = DayCounter(convention, self.holidays)
+            self.assertEqual(day_counter.day_count("2024-01-01", "2025-01-01"), 366)
+            self.assertEqual(day_counter.day_count("2024-05-06", "2024-04-26"), -10)
+            self.assertEqual(
+                day_counter.year_fraction("2024-01-01", "2025-01-01"), 366 / days_in_year
+            )
+
+    def test_day_counts(self):
+        starts = [date(2024, 4, 30), "2024-04-26", date(2024, 5, 6)]
+        ends = ["2024-05-03", date(2024, 5, 6), date(2024, 4, 26)]
+        self.assertEqual(self.day_counter.day_counts(starts, ends), [2, 5, -5])
+        self.assertEqual(
+            self.day_counter.year_fractions(starts, ends), [2 / 252, 5 / 252, -5 / 252]
+        )
+        self.assertEqual(DayCounter(ACT_360).day_counts(starts, ends), [3, 10, -10])
+        self.assertEqual(self.day_counter.day_counts([], []), [])
@@ -0,0 +1,155 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import pickle
+import unittest
+from datetime import date, datetime, timedelta
+from operator import setitem
+
+from holidays.countries import Malaysia, UnitedArabEmirates, UnitedStates
+from holidays.frozen_holidays import FrozenHolidays
+from holidays.utils import country_holidays
+
+
+class TestFrozenHolidays(unittest.TestCase):
+    def setUp(self):
+        self.holidays = UnitedStates(years=(2023, 2024), expand=False)
+        self.frozen = self.holidays.freeze()
+
+    def test_freeze(self):
+        self.assertIsInstance(self.frozen, FrozenHolidays)
+        self.assertEqual(dict(self.frozen), dict(self.holidays))
+        self.assertEqual(self.frozen.years, {2023, 2024})
+        self.assertEqual(self.frozen.country, "US")
+        self.assertIsNone(self.frozen.market)
+        self.assertTrue(self.frozen.observed)
+
+        frozen = self.holidays.freeze(years=(2024, 2025))
+        self.assertEqual(frozen.years, {2024, 2025})
+        self.assertEqual(self.holidays.years, {2023, 2024, 2025})
+        self.assertNotIn("2023-01-02", frozen)
+        self.assertIn("2025-01-01", frozen)
+
+    def test_immutable(self):
+        self.assertRaises(AttributeError, lambda: setattr(self.frozen, "observed", False))
+        self.assertRaises(AttributeError, lambda: delattr(self.frozen, "subdiv"))
+        self.assertRaises(TypeError, lambda: setitem(self.frozen, "2024-01-02", "Holiday"))
+
+    def test_no_expansion(self):
+        self.assertNotIn("2025-01-01", self.frozen)
+        self.assertIsNone(self.frozen.get("2025-01-01"))
+        self.assertEqual(self.frozen.years, {2023, 2024})
+
+    def test_hash_and_eq(self):
+        frozen = UnitedStates(years=(2023, 2024)).freeze()
+        self.assertEqual(frozen, self.frozen)
+        self.assertEqual(hash(frozen), hash(self.frozen))
+        self.assertEqual(len({frozen, self.frozen}), 1)
+
+        self.assertNotEqual(UnitedStates(years=2024).freeze(), self.frozen)
+        self.assertNotEqual(UnitedStates(subdiv="CA", years=(2023, 2024)).freeze(), self.frozen)
+        self.assertNotEqual(self.frozen, dict(self.frozen))
+
+    def test_keys(self):
+        for key in (
+            date(2024, 7, 4),
+            datetime(2024, 7, 4, 10, 30),
+            "2024-07-04",
+            "July 4, 2024",
+            1720094400,
+            1720094400.0,
+        ):
+            self.assertIn(key, self.frozen)
+            self.assertEqual(self.frozen[key], "Independence Day")
+            self.assertEqual(self.frozen.get(key), "Independence Day")
+
+        self.assertRaises(KeyError, lambda: self.frozen["2024-07-05"])
+        self.assertRaises(TypeError, lambda: [] in self.frozen)
+        self.assertRaises(ValueError, lambda: self.frozen["abc"])
+
+    def test_get_list(self):
+        frozen = UnitedStates(years=2021).freeze()
+        self.assertEqual(frozen.get_list("2021-12-31"), ["New Year's Day (observed)"])
+        self.assertEqual(frozen.get_list("2021-12-30"), [])
+
+    def test_pickle(self):
+        frozen = pickle.loads(pickle.dumps(self.frozen))
+        self.assertEqual(frozen, self.frozen)
+        self.assertEqual(hash(frozen), hash(self.frozen))
+        self.assertEqual(frozen.get("2024-12-25"), "Christmas Day")
+
+    def test_range(self):
+        for key in (
+            slice("2024-01-01", "2024-06-01"),
+            slice("2024-06-01", "2024-01-01"),
+            slice("2024-01-01", "2024-12-31", 7),
+            slice("2024-12-31", "2023-01-01", timedelta(days=-3)),
+            slice(date(2022, 1, 1), date(2026, 1, 1)),
+        ):
+            self.assertEqual(self.frozen[key], self.holidays[key], key)
+
+        self.assertRaises(ValueError, lambda: self.frozen["2024-01-01":])
+        self.assertRaises(ValueError, lambda: self.frozen["2024-01-01":"2024-02-01":0])
+        self.assertRaises(TypeError, lambda: self.frozen["2024-01-01":"2024-02-01":"1"])
+
+    def test_working_days(self):
+        # Malaysia has weekend working days (and non Sat-Sun weekend for some states).
+        for hb in (self.holidays, Malaysia(subdiv="KDH", years=(2023, 2024))):
+            frozen = hb.freeze()
+            for start, end in (
+                ("2024-01-01", "2024-12-31"),
+                ("2024-12-31", "2023-01-01"),
+                ("2023-04-20", "2023-04-26"),
+                ("2024-05-01", "2024-05-01"),
+            ):
+                self.assertEqual(
+                    frozen.get_working_days_count(start, end),
+                    hb.get_working_days_count(start, end),
+                )
+
+            for dt in ("2023-03-01", "2023-12-22", "2024-05-30"):
+                self.assertEqual(frozen.is_working_day(dt), hb.is_working_day(dt))
+                for n in (-10, -1, 1, 5, 20):
+                    self.assertEqual(
+                        frozen.get_nth_working_day(dt, n), hb.get_nth_working_day(dt, n)
+                    )
+
+    def test_working_days_weekend_change(self):
+        # The UAE weekend changed from Fri-Sat to Sat-Sun in 2022.
+        frozen = country_holidays("AE", years=(2021, 2022, 2023), frozen=True)
+        self.assertFalse(frozen.is_working_day("2021-01-08"))
+        self.assertTrue(frozen.is_working_day("2021-01-10"))
+        self.assertTrue(frozen.is_working_day("2023-01-06"))
+        self.assertFalse(frozen.is_working_day("2023-01-08"))
+
+        hb = UnitedArabEmirates(years=(2021, 2022, 2023))
+        for start, end in (
+            ("2021-01-01", "2021-12-31"),
+            ("2021-06-01", "2023-06-01"),
+            ("2023-12-31", "2022-12-25"),
+        ):
+            self.assertEqual(
+                frozen.get_working_days_count(start, end), hb.get_working_days_count(start, end)
+            )
+        for dt in ("2021-12-30", "2022-01-03"):
+            for n in (-5, 5):
+                self.assertEqual(frozen.get_nth_working_day(dt, n), hb.get_nth_working_day(dt, n))
+
+    def test_repr(self):
+        self.assertEqual(
+            repr(UnitedStates(subdiv="CA", years=2024).freeze()),
+            "holidays.FrozenHolidays(country='US', subdiv='CA', years=[2024])",
+        )
+        self.assertEqual(
+            repr(country_holidays("US").freeze()),
+            "holidays.FrozenHolidays(country='US', years=[])",
+        )
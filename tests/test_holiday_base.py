@@ -14,12 +14,19 @@ import pickle
 import unittest
 from datetime import date, datetime
 from datetime import timedelta as td
+from threading import Barrier, Thread
+from unittest import mock
 
+from holidays import countries
 from holidays.calendars.gregorian import JAN, FEB, OCT, DEC, MON, TUE, SAT, SUN
 from holidays.constants import HOLIDAY_NAME_DELIMITER, OPTIONAL, PUBLIC, SCHOOL
+from holidays.countries.china import CN
+from holidays.countries.united_arab_emirates import AE
+from holidays.countries.united_states import US
 from holidays.groups.christian import ChristianHolidays
 from holidays.groups.custom import StaticHolidays
-from holidays.holiday_base import HolidayBase
+from holidays.holiday_base import HolidayBase, _population_cache
+from holidays.registry import COUNTRIES
 
 
 class EntityStubStaticHolidays:
@@ -178,6 +185,24 @@ class TestArgs(unittest.TestCase):
         self.assertIn("2012-01-01", hb)
         self.assertNotIn("2012-01-02", hb)
 
+    def test_observed_views(self):
+        hb = CountryStub1(years=range(2010, 2016))
+        observed_holidays = dict(hb)
+
+        hb.observed = False
+        non_observed_holidays = dict(hb)
+        self.assertNotIn(date(2012, 1, 2), non_observed_holidays)
+        self.assertEqual(non_observed_holidays, dict(CountryStub1(observed=False, years=hb.years)))
+
+        with mock.patch.object(
+            CountryStub1, "_populate", autospec=True, side_effect=CountryStub1._populate
+        ) as populate_mock:
+            hb.observed = True
+            self.assertEqual(dict(hb), observed_holidays)
+            hb.observed = False
+            self.assertEqual(dict(hb), non_observed_holidays)
+            populate_mock.assert_not_called()
+
     def test_subdivision(self):
         self.assertEqual(CountryStub1(subdiv="Subdiv 1").subdiv, "Subdiv 1")
         self.assertEqual(CountryStub1(subdiv=3).subdiv, "3")
@@ -287,6 +312,224 @@ class TestCategories(unittest.TestCase):
                     self.assertIn(dt, ccc)
 
 
+class TestPopulationCache(unittest.TestCase):
+    def setUp(self):
+        _population_cache.clear()
+
+    def test_categories(self):
+        with mock.patch.object(
+            CountryStub1, "_populate", autospec=True, side_effect=CountryStub1._populate
+        ) as populate_mock:
+            hb = CountryStub1(categories=PUBLIC, years=2024)
+            hb.categories = {PUBLIC, SCHOOL}
+            hb.categories = {PUBLIC}
+            self.assertEqual(populate_mock.call_count, 2)
+
+            hb = CountryStub1(categories=(SCHOOL, PUBLIC), years=2024)
+            self.assertEqual(populate_mock.call_count, 2)
+
+    def test_instance_state(self):
+        hb = CountryStub6(years=2024)
+        hb.special_public_holidays = {2025: (JAN, 2, "Custom holiday")}
+        self.assertIn("2025-01-02", hb)
+        self.assertNotIn("2025-01-02", CountryStub6(years=2025))
+
+        hb.observed = False
+        self.assertIn("2025-01-02", hb)
+
+    def test_shared_entries(self):
+        with mock.patch.object(
+            CountryStub1, "_populate", autospec=True, side_effect=CountryStub1._populate
+        ) as populate_mock:
+            hb_1 = CountryStub1(years=range(2020, 2025))
+            self.assertEqual(populate_mock.call_count, 5)
+
+            hb_2 = CountryStub1(years=range(2020, 2025))
+            self.assertIn("2026-01-01", hb_2)
+            self.assertEqual(populate_mock.call_count, 6)
+            self.assertEqual(hb_1, CountryStub1(years=range(2020, 2025)))
+
+            # Different parameters are not shared.
+            CountryStub1(subdiv="Subdiv 1", years=2020)
+            CountryStub1(observed=False, years=2020)
+            self.assertEqual(populate_mock.call_count, 8)
+
+        self.assertEqual(
+            CountryStub1(subdiv="Subdiv 1", years=2020)["2020-08-10"], "Subdiv 1 Custom Holiday"
+        )
+        self.assertNotIn("2020-08-10", CountryStub1(years=2020))
+
+    def test_unhashable_state(self):
+        hb = CountryStub1(years=2020) + CountryStub3(years=2020)
+        self.assertIsNone(hb._population_key)
+        self.assertIn("2020-05-01", hb)
+
+    def test_weekend_workdays(self):
+        hb_1 = CountryStub1(years=1991)
+        hb_2 = CountryStub1(years=1991)
+        self.assertEqual(hb_1.weekend_workdays, {date(1991, 1, 12), date(1991, 1, 13)})
+        self.assertEqual(hb_2.weekend_workdays, hb_1.weekend_workdays)
+
+
+class TestPopulationPlan(unittest.TestCase):
+    def test_plan(self):
+        hb = TestCategories.CustomCategoryClass(categories=("CC", "CC_1"), subdiv="SD_1")
+        plan = hb._get_population_plan()
+        self.assertIs(hb._get_population_plan(), plan)
+        self.assertEqual(plan.method_names, ("_populate_cc_holidays", "_populate_cc_1_holidays"))
+        self.assertEqual(
+            hb._get_population_plan("sd_1").method_names,
+            ("_populate_subdiv_sd_1_cc_holidays", "_populate_subdiv_sd_1_cc_1_holidays"),
+        )
+
+        hb.categories = {"CC_2"}
+        self.assertEqual(hb._get_population_plan().method_names, ("_populate_cc_2_holidays",))
+        self.assertEqual(hb._get_population_plan("sd_1").method_names, ())
+
+    def test_special_holidays(self):
+        hb = CountryStub6()
+        self.assertEqual(
+            hb._get_population_plan().special_holidays[1991],
+            (((JAN, 7, JAN, 12), False), ((JAN, 8, JAN, 13, 1991), False)),
+        )
+        self.assertIs(
+            CountryStub6()._get_population_plan().special_holidays,
+            hb._get_population_plan().special_holidays,
+        )
+
+        hb.special_public_holidays = {2025: (JAN, 2, "Custom holiday")}
+        self.assertEqual(
+            hb._get_population_plan().special_holidays,
+            {2025: (((JAN, 2, "Custom holiday"), False),)},
+        )
+
+
+class TestSubdivisionsHolidays(unittest.TestCase):
+    class SharedCommonClass(HolidayBase):
+        country = "SCC"
+        subdivisions = ("SD_1", "SD_2", "SD_3")
+        supported_categories = (PUBLIC, SCHOOL)
+        subdivision_independent_categories = (PUBLIC,)
+
+        def _populate_public_holidays(self):
+            self._add_holiday_may_1("Labor Day")
+
+        def _populate_school_holidays(self):
+            if self.subdiv != "SD_3":
+                self._add_holiday_jun_1("School Holiday")
+
+        def _populate_subdiv_sd_1_public_holidays(self):
+            self._add_holiday_may_2("SD_1 Holiday")
+
+        def _populate_subdiv_sd_2_public_holidays(self):
+            self._is_common_holiday_moved = True
+            self._add_holiday_may_3("SD_2 Holiday")
+
+    class StatefulCommonClass(SharedCommonClass):
+        country = "SCC2"
+
+        def _populate_public_holidays(self):
+            if getattr(self, "_is_common_holiday_moved", False):
+                self._add_holiday_may_4("Labor Day")
+            else:
+                super()._populate_public_holidays()
+
+    def setUp(self):
+        _population_cache.clear()
+
+    def assertSubdivisionsHolidays(self, cls, years, **kwargs):  # noqa: N802
+        bundle = cls.get_subdivisions_holidays(years=years, **kwargs)
+        self.assertEqual(tuple(bundle), cls.subdivisions)
+        _population_cache.clear()
+        for subdiv, hb in bundle.items():
+            self.assertEqual(hb.years, set(years))
+            self.assertEqual(dict(hb), dict(cls(subdiv=subdiv, years=years, **kwargs)))
+
+        return bundle
+
+    def test_shared_common_layer(self):
+        cls = TestSubdivisionsHolidays.SharedCommonClass
+        with mock.patch.object(
+            cls,
+            "_populate_public_holidays",
+            autospec=True,
+            side_effect=cls._populate_public_holidays,
+        ) as populate_mock:
+            bundle = self.assertSubdivisionsHolidays(cls, range(2020, 2025))
+            # Once per year for the bundle, the SD_2 next years (its population
+            # changes the instance state) plus the reference instances calls.
+            self.assertEqual(populate_mock.call_count, 5 + 4 + 3 * 5)
+
+        self.assertEqual(bundle["SD_1"]["2024-05-02"], "SD_1 Holiday")
+        self.assertNotIn("2024-05-02", bundle["SD_2"])
+        self.assertIn("2024-05-01", bundle["SD_3"])
+
+        # Expansion populates the whole year.
+        self.assertIn("2025-05-01", bundle["SD_2"])
+        self.assertIn("2025-05-03", bundle["SD_2"])
+
+    def test_subdivision_dependent_common_layer(self):
+        cls = TestSubdivisionsHolidays.SharedCommonClass
+        with mock.patch.object(
+            cls,
+            "_populate_public_holidays",
+            autospec=True,
+            side_effect=cls._populate_public_holidays,
+        ) as populate_mock:
+            bundle = self.assertSubdivisionsHolidays(cls, range(2020, 2025), categories=SCHOOL)
+            self.assertEqual(populate_mock.call_count, 0)
+        self.assertNotIn("2024-06-01", bundle["SD_3"])
+
+        with mock.patch.object(
+            cls,
+            "_populate_public_holidays",
+            autospec=True,
+            side_effect=cls._populate_public_holidays,
+        ) as populate_mock:
+            self.assertSubdivisionsHolidays(cls, range(2020, 2025), categories=(PUBLIC, SCHOOL))
+            # The school holidays depend on subdivision: no shared common layer.
+            self.assertEqual(populate_mock.call_count, 2 * 3 * 5)
+
+    def test_undeclared_common_layer(self):
+        class UndeclaredCommonClass(TestSubdivisionsHolidays.SharedCommonClass):
+            country = "SCC3"
+            subdivision_independent_categories = ()
+
+        with mock.patch.object(
+            UndeclaredCommonClass,
+            "_populate_public_holidays",
+            autospec=True,
+            side_effect=UndeclaredCommonClass._populate_public_holidays,
+        ) as populate_mock:
+            self.assertSubdivisionsHolidays(UndeclaredCommonClass, range(2020, 2025))
+            self.assertEqual(populate_mock.call_count, 2 * 3 * 5)
+
+    def test_stateful_subdivision_layer(self):
+        bundle = self.assertSubdivisionsHolidays(
+            TestSubdivisionsHolidays.StatefulCommonClass, range(2020, 2025)
+        )
+        self.assertEqual(
+            bundle["SD_1"].get_named("Labor Day"), [date(y, 5, 1) for y in range(2020, 2025)]
+        )
+
+    def test_subdivision_independent_categories(self):
+        years = (1980, 2000, 2024)
+        for entities in COUNTRIES.values():
+            cls = getattr(countries, entities[0])
+            for category in cls.subdivision_independent_categories:
+                self.assertIn(category, cls.supported_categories)
+                with self.subTest(country=cls.country, category=category):
+                    self.assertSubdivisionsHolidays(cls, years, categories=category)
+
+    def test_subdivisions(self):
+        bundle = CountryStub1.get_subdivisions_holidays(subdivs=("S1", "3"), years=2020)
+        self.assertEqual(tuple(bundle), ("S1", "3"))
+        self.assertEqual(bundle["S1"]["2020-08-10"], "Subdiv 1 Custom Holiday")
+        self.assertNotIn("2020-08-10", bundle["3"])
+
+        self.assertEqual(CountryStub3.get_subdivisions_holidays(years=2020), {})
+
+
 class TestDeprecationWarnings(unittest.TestCase):
     def test_prov_deprecation(self):
         with self.assertWarns(Warning):
@@ -864,6 +1107,54 @@ class TestSerialization(unittest.TestCase):
         self.assertEqual(loaded_holidays, self.hb)
         self.assertIn(dt, self.hb)
 
+    def test_pickle_compact(self):
+        hb = CountryStub1(years=range(2000, 2030))
+        _, (cls, state, years, packed) = hb.__reduce__()
+        self.assertIs(cls, CountryStub1)
+        self.assertEqual(years, list(range(2000, 2030)))
+        self.assertIsNone(packed)
+        self.assertNotIn("tr", state)
+        self.assertNotIn("years", state)
+
+        loaded_holidays = pickle.loads(pickle.dumps(hb))
+        self.assertEqual(loaded_holidays, hb)
+        self.assertEqual(loaded_holidays.years, hb.years)
+        self.assertIsNot(loaded_holidays.years, hb.years)
+        self.assertIn("2030-01-01", loaded_holidays)
+
+    def test_pickle_packed(self):
+        hb = CountryStub1(years=(2020, 2021))
+        hb.update({"2020-01-02": "Custom holiday", "2021-07-04": "Custom holiday"})
+        hb.pop("2021-12-25")
+
+        _, (_, _, _, packed) = hb.__reduce__()
+        ordinals, name_ids, names, weekend_workdays = packed
+        self.assertEqual(len(ordinals), len(hb))
+        self.assertEqual(len(name_ids), len(hb))
+        self.assertEqual(len(names), len(set(hb.values())))
+
+        loaded_holidays = pickle.loads(pickle.dumps(hb))
+        self.assertEqual(loaded_holidays, hb)
+        self.assertEqual(loaded_holidays["2021-07-04"], "Custom holiday; Independence Day")
+        self.assertNotIn("2021-12-25", loaded_holidays)
+
+    def test_pickle_population_cache_miss(self):
+        hb = CountryStub1(years=2020)
+        _population_cache.clear()
+        self.assertIsNotNone(hb.__reduce__()[1][3])
+        self.assertEqual(pickle.loads(pickle.dumps(hb)), hb)
+
+    def test_pickle_state(self):
+        hb = CountryStub1(years=(2020, 2021), observed=False, max_years=2, thread_safe=True)
+        hb.weekend_workdays.add(date(2020, 1, 4))
+        loaded_holidays = pickle.loads(pickle.dumps(hb))
+        self.assertEqual(loaded_holidays, hb)
+        self.assertFalse(loaded_holidays.observed)
+        self.assertEqual(loaded_holidays.weekend_workdays, {date(2020, 1, 4)})
+        self.assertIsNotNone(loaded_holidays._expansion_lock)
+        self.assertIn("2022-01-01", loaded_holidays)
+        self.assertEqual(loaded_holidays.years, {2021, 2022})
+
 
 class TestSpecialHolidays(unittest.TestCase):
     def setUp(self):
@@ -1136,6 +1427,126 @@ class TestSubstitutedHolidays(unittest.TestCase):
         self.assertRaises(ValueError, lambda: self.CountryStub(SubstitutedHolidays))
 
 
+class TestMaxYears(unittest.TestCase):
+    def setUp(self):
+        self.hb = CountryStub1(max_years=2)
+
+    def test_args(self):
+        self.assertRaises(ValueError, lambda: CountryStub1(max_years=0))
+        self.assertEqual(
+            CountryStub1(years=range(2020, 2025), max_years=3).years, {2022, 2023, 2024}
+        )
+
+    def test_eviction(self):
+        self.assertIn("2020-01-01", self.hb)
+        self.assertIn("2021-01-01", self.hb)
+        self.assertIn("2020-07-04", self.hb)
+        self.assertIn("2022-01-01", self.hb)
+
+        self.assertEqual(self.hb.years, {2020, 2022})
+        self.assertEqual(dict(self.hb), dict(CountryStub1(years=(2020, 2022))))
+        self.assertEqual(self.hb.years_cache_info(), (1, 3, 1, 2, 2))
+
+        self.assertEqual(self.hb.get("2021-12-25"), "Christmas Day")
+        self.assertEqual(self.hb.years, {2021, 2022})
+        self.assertEqual(dict(self.hb), dict(CountryStub1(years=(2021, 2022))))
+        self.assertEqual(self.hb.years_cache_info(), (1, 4, 2, 2, 2))
+
+    def test_bounded(self):
+        for year in range(1, 10000, 7):
+            self.hb.get(date(year, 7, 4))
+            self.assertLessEqual(len(self.hb.years), 2)
+            self.assertEqual(dict(self.hb), dict(CountryStub1(years=self.hb.years)))
+
+    def test_expand_disabled(self):
+        hb = CountryStub1(years=range(2020, 2023), expand=False, max_years=2)
+        self.assertNotIn("2020-01-01", hb)
+        self.assertNotIn(2020, hb.years)
+        self.assertIn("2021-01-01", hb)
+        self.assertEqual(hb.years_cache_info(), (1, 0, 1, 2, 2))
+
+    def test_freeze(self):
+        self.hb.get("2020-01-01")
+        self.hb.get("2021-01-01")
+        self.assertEqual(self.hb.freeze(years=(2020, 2022)).years, {2020, 2022})
+        self.assertEqual(self.hb.years, {2020, 2022})
+        self.assertRaises(ValueError, lambda: self.hb.freeze(years=(2020, 2021, 2022)))
+
+    def test_observed_toggle(self):
+        hb = CountryStub1(years=(2021, 2022), max_years=2)
+        hb.observed = False
+        self.assertNotIn("2022-12-26", hb)
+        hb.get("2023-01-01")
+        self.assertEqual(hb.years, {2022, 2023})
+        self.assertEqual(dict(hb), dict(CountryStub1(years=(2022, 2023), observed=False)))
+
+    def test_unbounded(self):
+        hb = CountryStub1()
+        hb.get("2020-01-01")
+        self.assertEqual(hb.years_cache_info(), (0, 0, 0, None, 1))
+
+
+class TestThreadSafe(unittest.TestCase):
+    def setUp(self):
+        _population_cache.clear()
+
+    def test_concurrent_expansion(self):
+        hb = CountryStub1(thread_safe=True)
+        expected = CountryStub1(years=range(1950, 2050))
+        years = list(range(1950, 2050))
+        barrier = Barrier(8)
+        errors = []
+
+        def lookup(offset):
+            barrier.wait()
+            try:
+                for year in years[offset:] + years[:offset]:
+                    # A populated year must be visible in full.
+                    self.assertEqual(hb.get(f"{year}-07-04"), "Independence Day")
+                    self.assertIn(date(year, 12, 25), hb)
+            except AssertionError as e:
+                errors.append(e)
+
+        with mock.patch.object(
+            CountryStub1, "_populate_year", autospec=True, side_effect=HolidayBase._populate_year
+        ) as populate_year:
+            threads = [Thread(target=lookup, args=(offset * 12,)) for offset in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(hb.years, set(years))
+        self.assertEqual(dict(hb), dict(expected))
+        # Each year is populated exactly once.
+        populated_years = [call.args[1] for call in populate_year.call_args_list]
+        self.assertEqual(sorted(populated_years), years)
+
+    def test_copy_and_pickle(self):
+        for copy_func in (HolidayBase.copy, lambda hb: pickle.loads(pickle.dumps(hb))):
+            hb = CountryStub1(years=2024, thread_safe=True)
+            hb_copy = copy_func(hb)
+            self.assertEqual(hb_copy, hb)
+            self.assertIsNotNone(hb_copy._expansion_lock)
+            self.assertIsNot(hb_copy._expansion_lock, hb._expansion_lock)
+            self.assertIn("2025-01-01", hb_copy)
+
+        self.assertIsNone(pickle.loads(pickle.dumps(CountryStub1()))._expansion_lock)
+
+    def test_population_sharing(self):
+        CountryStub1(years=2024)
+        hb = CountryStub1(years=2024, thread_safe=True)
+        self.assertEqual(hb._population_key, CountryStub1()._population_key)
+
+    def test_repopulation(self):
+        hb = CountryStub1(years=2022, thread_safe=True)
+        self.assertIn("2022-12-26", hb)
+        hb.observed = False
+        self.assertNotIn("2022-12-26", hb)
+        self.assertIn("2022-12-25", hb)
+
+
 class TestWorkdays(unittest.TestCase):
     def setUp(self):
         self.hb = CountryStub6(years=2024)
@@ -1188,3 +1599,111 @@ class TestWorkdays(unittest.TestCase):
         self.assertEqual(self.hb.get_working_days_count("2024-04-29", "2024-05-04"), 3)
         self.assertEqual(self.hb.get_working_days_count("2024-04-29", "2024-05-05"), 3)
         self.assertEqual(self.hb.get_working_days_count("2024-04-29", "2024-05-06"), 4)
+
+    def test_get_working_days(self):
+        self.assertListEqual(
+            self.hb.get_working_days("2024-02-15", "2024-02-26"),
+            [
+                date(2024, 2, 15),
+                date(2024, 2, 16),
+                date(2024, 2, 20),
+                date(2024, 2, 21),
+                date(2024, 2, 22),
+                date(2024, 2, 23),
+                date(2024, 2, 24),
+                date(2024, 2, 26),
+            ],
+        )
+        self.assertListEqual(
+            self.hb.get_working_days("2024-05-05", "2024-04-29"),
+            [date(2024, 4, 29), date(2024, 4, 30), date(2024, 5, 3)],
+        )
+        self.assertListEqual(self.hb.get_working_days("2024-05-01", "2024-05-02"), [])
+        self.assertEqual(len(self.hb.get_working_days("2023-12-30", "2025-01-01")), 255)
+
+    def test_working_days_changes(self):
+        self.assertEqual(self.hb.get_working_days_count("2024-05-01", "2024-05-03"), 1)
+
+        self.hb["2024-05-03"] = "Bridge Day"
+        self.assertEqual(self.hb.get_working_days_count("2024-05-01", "2024-05-03"), 0)
+        del self.hb["2024-05-03"]
+        self.assertEqual(self.hb.get_nth_working_day("2024-04-30", +1), date(2024, 5, 3))
+        self.hb.pop("2024-05-01")
+        self.assertEqual(self.hb.get_nth_working_day("2024-04-30", +1), date(2024, 5, 1))
+
+        self.hb.weekend_workdays.add(date(2024, 5, 4))
+        self.assertEqual(self.hb.get_working_days_count("2024-05-04", "2024-05-05"), 1)
+
+        self.hb.clear()
+        self.assertEqual(self.hb.get_working_days_count("2024-02-17", "2024-02-19"), 1)
+
+        # Other instances keep using the population results.
+        self.assertEqual(
+            CountryStub6(years=2024).get_working_days_count("2024-05-01", "2024-05-04"), 1
+        )
+
+    def test_shared_working_days(self):
+        _population_cache.clear()
+        hb1 = CountryStub6(years=2024)
+        hb2 = CountryStub6(years=2024)
+        self.assertIs(hb1._get_working_days_bitmap(2024), hb2._get_working_days_bitmap(2024))
+        self.assertIsNot(
+            hb1._get_working_days_bitmap(2024),
+            CountryStub6(years=2024, observed=False)._get_working_days_bitmap(2024),
+        )
+
+        hb2["2024-01-02"] = "Custom Holiday"
+        self.assertFalse(hb2._get_working_days_bitmap(2024)[1])
+        self.assertTrue(hb1._get_working_days_bitmap(2024)[1])
+
+    def test_next_year_weekend_workdays(self):
+        # The 2011-12-31 make-up workday is populated with 2012 holidays.
+        cn = CN(years=(2011, 2012))
+        self.assertTrue(cn.is_working_day("2011-12-31"))
+        self.assertEqual(cn.get_working_days_count("2011-12-31", "2012-01-01"), 1)
+        self.assertEqual(cn.get_nth_working_day("2011-12-30", +1), date(2011, 12, 31))
+        self.assertEqual(cn.get_nth_working_day("2011-12-30", +2), date(2012, 1, 4))
+        self.assertListEqual(
+            cn.get_working_days("2011-12-24", "2011-12-31"),
+            [
+                date(2011, 12, 26),
+                date(2011, 12, 27),
+                date(2011, 12, 28),
+                date(2011, 12, 29),
+                date(2011, 12, 30),
+                date(2011, 12, 31),
+            ],
+        )
+
+        # The next year is not populated as a side effect.
+        cn = CN(years=2011)
+        self.assertFalse(cn.is_working_day("2011-12-31"))
+        self.assertEqual(cn.get_working_days_count("2011-12-24", "2011-12-31"), 5)
+        self.assertEqual(cn.years, {2011})
+
+    def test_no_extra_years(self):
+        us = US()
+        self.assertFalse(us.is_working_day(date(2024, 7, 4)))
+        self.assertEqual(us.years, {2024})
+        self.assertEqual(us.get_working_days_count("2024-01-01", "2024-12-31"), 252)
+        self.assertEqual(len(us.get_working_days("2024-06-01", "2024-06-30")), 19)
+        self.assertEqual(us.years, {2024})
+
+    def test_weekend_change(self):
+        # The UAE weekend changed from Friday-Saturday to Saturday-Sunday in 2022.
+        for years in ((2021, 2023), (2023, 2021), (2021, 2022, 2023)):
+            ae_holidays = AE(years=years)
+            self.assertFalse(ae_holidays.is_working_day("2021-01-08"))
+            self.assertTrue(ae_holidays.is_working_day("2021-01-10"))
+            self.assertTrue(ae_holidays.is_working_day("2023-01-06"))
+            self.assertFalse(ae_holidays.is_working_day("2023-01-08"))
+            for year in (2021, 2023):
+                dates = [date(year, 1, 1) + td(days=delta) for delta in range(365)]
+                working_days = [dt for dt in dates if ae_holidays.is_working_day(dt)]
+                self.assertEqual(
+                    ae_holidays.get_working_days(f"{year}-01-01", f"{year}-12-31"), working_days
+                )
+                self.assertEqual(
+                    ae_holidays.get_working_days_count(f"{year}-01-01", f"{year}-12-31"),
+                    len(working_days),
+                )
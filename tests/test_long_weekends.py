@@ -0,0 +1,109 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import unittest
+from datetime import date
+
+from holidays.countries import China, Israel, UnitedStates
+from holidays.long_weekends import (
+    BridgeDay,
+    LongWeekend,
+    detect,
+    find_bridge_days,
+    find_long_weekends,
+)
+
+
+class TestLongWeekends(unittest.TestCase):
+    def test_find_long_weekends(self):
+        long_weekends = list(find_long_weekends(UnitedStates(), 2024))
+        self.assertEqual(
+            [(lw.start, lw.end) for lw in long_weekends],
+            [
+                (date(2024, 1, 13), date(2024, 1, 15)),
+                (date(2024, 2, 17), date(2024, 2, 19)),
+                (date(2024, 5, 25), date(2024, 5, 27)),
+                (date(2024, 8, 31), date(2024, 9, 2)),
+                (date(2024, 11, 9), date(2024, 11, 11)),
+            ],
+        )
+        self.assertEqual(
+            long_weekends[2],
+            LongWeekend("US", None, date(2024, 5, 25), date(2024, 5, 27), 3, ("Memorial Day",)),
+        )
+
+        # The long weekends starting in the previous year are skipped.
+        self.assertEqual(next(find_long_weekends(UnitedStates(), 2023)).start, date(2023, 1, 14))
+        self.assertNotIn(
+            date(2023, 12, 30), [lw.start for lw in find_long_weekends(UnitedStates(), 2024)]
+        )
+        self.assertIn(
+            date(2023, 12, 30), [lw.start for lw in find_long_weekends(UnitedStates(), 2023)]
+        )
+
+    def test_find_long_weekends_weekend(self):
+        # Friday and Saturday weekend.
+        self.assertEqual(
+            [(lw.start, lw.days) for lw in find_long_weekends(Israel(), 2024)],
+            [(date(2024, 10, 3), 3), (date(2024, 10, 17), 3), (date(2024, 10, 24), 3)],
+        )
+
+        # Spring Festival with the 2024-02-04 and 2024-02-18 make-up working days.
+        long_weekend = next(find_long_weekends(China(), 2024))
+        self.assertEqual(
+            (long_weekend.start, long_weekend.end), (date(2024, 2, 10), date(2024, 2, 17))
+        )
+        self.assertEqual(long_weekend.days, 8)
+
+    def test_find_bridge_days(self):
+        self.assertListEqual(
+            list(find_bridge_days(UnitedStates(), 2024)),
+            [
+                BridgeDay("US", None, date(2024, 7, 5), 4, ("Independence Day",)),
+                BridgeDay("US", None, date(2024, 11, 29), 4, ("Thanksgiving",)),
+            ],
+        )
+        self.assertListEqual(
+            [bd.date for bd in find_bridge_days(UnitedStates(), range(2019, 2021))],
+            [date(2019, 7, 5), date(2019, 11, 29), date(2020, 11, 27)],
+        )
+
+    def test_detect(self):
+        records = list(detect("US", years=2024))
+        self.assertEqual(len(records), 7)
+        self.assertEqual(records, list(detect(UnitedStates(), years=2024)))
+        self.assertIsInstance(records[3], BridgeDay)
+        self.assertEqual(records[3].date, date(2024, 7, 5))
+
+        records = list(detect(("US", "IL"), years=2024))
+        self.assertEqual(
+            {(record.entity, record.subdiv) for record in records}, {("US", None), ("IL", None)}
+        )
+        self.assertIn(
+            LongWeekend(
+                "US",
+                "CA",
+                date(2024, 3, 30),
+                date(2024, 4, 1),
+                3,
+                ("Cesar Chavez Day", "Cesar Chavez Day (observed)"),
+            ),
+            list(detect("US", subdivs=("CA",), years=2024)),
+        )
+        self.assertEqual(
+            {record.subdiv for record in detect("US", subdivs="all", years=2024)},
+            {None, *UnitedStates.subdivisions},
+        )
+
+        self.assertRaises(ValueError, lambda: list(detect("US")))
+        self.assertRaises(ValueError, lambda: list(find_bridge_days(UnitedStates(), ())))
+        self.assertRaises(NotImplementedError, lambda: list(detect("XX", years=2024)))
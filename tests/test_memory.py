@@ -0,0 +1,97 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any
+
+from holidays import HolidayBase, country_holidays, financial_holidays
+from holidays.countries import UnitedStates
+
+KIB = 1024
+
+# Per entity (single year, 1950-2049 years) instance size budgets in KiB.
+BUDGETS = {
+    "CN": (80, 300),
+    "DE": (20, 100),
+    "IR": (20, 500),
+    "MY": (40, 300),
+    "NYSE": (50, 200),
+    "SE": (20, 900),
+    "US": (15, 170),
+}
+
+# The `holidays` package import budget in KiB.
+IMPORT_BUDGET = 8000
+
+IMPORT_SIZE_CODE = """
+import tracemalloc
+tracemalloc.start()
+import holidays
+print(tracemalloc.get_traced_memory()[0])
+"""
+
+
+def get_size(obj: Any) -> int:
+    """Return an object size including the objects it references (except for
+    classes, modules and functions)."""
+    seen: set[int] = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(
+            obj, (type, ModuleType, FunctionType, BuiltinFunctionType)
+        ):
+            continue
+        seen.add(id(obj))
+        size += dict.__sizeof__(obj) if isinstance(obj, HolidayBase) else sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        if isinstance(obj, MethodType):
+            stack.append(obj.__self__)
+        elif hasattr(obj, "__dict__"):
+            stack.append(obj.__dict__)
+
+    return size
+
+
+class TestMemoryBudgets(unittest.TestCase):
+    def test_get_size(self):
+        us = UnitedStates(years=2024)
+        self.assertLess(get_size(us), get_size(UnitedStates(years=range(2000, 2050))))
+
+    def test_budgets(self):
+        for entity, (year_budget, years_budget) in BUDGETS.items():
+            get_holidays = financial_holidays if entity == "NYSE" else country_holidays
+            with self.subTest(entity=entity):
+                self.assertLess(get_size(get_holidays(entity, years=2024)), year_budget * KIB)
+                self.assertLess(
+                    get_size(get_holidays(entity, years=range(1950, 2050))), years_budget * KIB
+                )
+
+    def test_import_budget(self):
+        result = subprocess.run(
+            (sys.executable, "-c", IMPORT_SIZE_CODE),
+            capture_output=True,
+            check=True,
+            cwd=Path(__file__).parents[1],
+            text=True,
+        )
+        self.assertLess(int(result.stdout), IMPORT_BUDGET * KIB)
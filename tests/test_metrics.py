@@ -0,0 +1,133 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import unittest
+from datetime import date, datetime
+from unittest import mock
+
+from holidays import metrics
+from holidays.countries import Germany, UnitedStates
+from holidays.holiday_base import _population_cache
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        _population_cache.clear()
+        metrics.reset()
+        metrics.enable()
+
+    def tearDown(self):
+        metrics.disable()
+        metrics.reset()
+
+    def test_disabled(self):
+        metrics.disable()
+        self.assertFalse(metrics.is_enabled())
+
+        us_holidays = UnitedStates()
+        self.assertIn("2024-07-04", us_holidays)
+        self.assertEqual(metrics.snapshot()["entities"], {})
+        self.assertFalse(metrics.snapshot()["enabled"])
+
+        metrics.enable()
+        self.assertTrue(metrics.is_enabled())
+        self.assertIn("2024-07-04", us_holidays)
+        self.assertEqual(metrics.snapshot()["entities"]["US"]["lookups"], {"str": 1})
+
+    def test_lookups(self):
+        us_holidays = UnitedStates(years=2024)
+        metrics.reset()
+
+        self.assertIn("2024-07-04", us_holidays)
+        self.assertIn("July 4, 2024", us_holidays)
+        self.assertIn(date(2024, 7, 4), us_holidays)
+        self.assertIn(datetime(2024, 7, 4, 12), us_holidays)
+        self.assertIn(1720051200.0, us_holidays)
+        self.assertIsNone(us_holidays.get("2024-07-05"))
+
+        us_metrics = metrics.snapshot()["entities"]["US"]
+        self.assertEqual(us_metrics["lookups"], {"date": 1, "datetime": 1, "float": 1, "str": 3})
+        self.assertEqual(us_metrics["string_parses"], 3)
+        self.assertEqual(us_metrics["expansions"], {})
+
+    def test_expansions(self):
+        us_holidays = UnitedStates()
+        self.assertIn("2024-07-04", us_holidays)
+        self.assertIn("2024-12-25", us_holidays)
+        self.assertIn("2030-12-25", us_holidays)
+
+        us_metrics = metrics.snapshot()["entities"]["US"]
+        self.assertEqual(us_metrics["expansions"], {2024: 1, 2030: 1})
+        self.assertEqual(us_metrics["populations"], 2)
+
+    def test_population_cache(self):
+        UnitedStates(years=range(2020, 2025))
+        UnitedStates(years=2024)
+
+        us_metrics = metrics.snapshot()["entities"]["US"]
+        self.assertEqual(us_metrics["populations"], 5)
+        self.assertGreater(us_metrics["populate_time"], 0)
+        self.assertEqual(us_metrics["population_cache"], {"hits": 1, "misses": 5})
+
+        with mock.patch.object(_population_cache, "maxsize", 2):
+            Germany(years=range(2020, 2025))
+        self.assertEqual(
+            metrics.snapshot()["global"]["population_cache"],
+            {"evictions": 5, "hits": 1, "misses": 10},
+        )
+
+    def test_translation_calls(self):
+        UnitedStates(years=2024)
+        self.assertGreater(metrics.snapshot()["entities"]["US"]["translation_calls"], 0)
+
+        metrics.reset()
+        UnitedStates(years=2024, categories="unofficial")
+        translation_calls = metrics.snapshot()["entities"]["US"]["translation_calls"]
+
+        metrics.disable()
+        UnitedStates(years=2025, categories="unofficial")
+        self.assertEqual(
+            metrics.snapshot()["entities"]["US"]["translation_calls"], translation_calls
+        )
+
+    def test_years_cache(self):
+        us_holidays = UnitedStates(max_years=1)
+        for dt in ("2024-01-01", "2024-07-04", "2025-01-01", "2024-01-01"):
+            self.assertIn(dt, us_holidays)
+
+        cache_info = us_holidays.years_cache_info()
+        self.assertEqual(
+            metrics.snapshot()["entities"]["US"]["years_cache"],
+            {
+                "evictions": cache_info.evictions,
+                "hits": cache_info.hits,
+                "misses": cache_info.misses,
+            },
+        )
+
+    def test_snapshot(self):
+        self.assertIn("2024-07-04", UnitedStates())
+        self.assertIn("2024-10-03", Germany())
+        self.assertIn("2024-10-03", Germany(language="de") + UnitedStates(years=2024))
+
+        snapshot = metrics.snapshot()
+        self.assertTrue(snapshot["enabled"])
+        self.assertEqual(list(snapshot["entities"]), ["DE", "DE+US", "US"])
+        self.assertEqual(snapshot["global"]["lookups"]["str"], 3)
+        self.assertEqual(
+            snapshot["global"]["populations"],
+            sum(entity["populations"] for entity in snapshot["entities"].values()),
+        )
+
+        metrics.reset()
+        self.assertEqual(metrics.snapshot()["entities"], {})
+        self.assertTrue(metrics.is_enabled())
@@ -13,8 +13,14 @@
 from datetime import date
 from unittest import TestCase
 
-from holidays.calendars.gregorian import MON, SUN
-from holidays.observed_holiday_base import ObservedHolidayBase, ObservedRule
+from holidays.calendars.gregorian import MON, TUE, SAT, SUN
+from holidays.observed_holiday_base import (
+    ObservedHolidayBase,
+    ObservedRule,
+    SAT_TO_PREV_FRI,
+    SUN_TO_NEXT_MON,
+    SUN_TO_NEXT_WORKDAY,
+)
 
 
 class TestObservedHolidayBase(TestCase):
@@ -54,3 +60,41 @@ class TestObservedHolidayBase(TestCase):
             },
             self.ohb,
         )
+
+    def test_observed_rule_shifts(self):
+        self.assertEqual((SAT_TO_PREV_FRI + SUN_TO_NEXT_MON).shifts, (0, 0, 0, 0, 0, -1, +1))
+        self.assertEqual(ObservedRule({TUE: None, SAT: +7}).shifts, (0, None, 0, 0, 0, +7, 0))
+
+    def test_get_next_workday(self):
+        self.ohb._observed_rule = SUN_TO_NEXT_WORKDAY
+        self.ohb._add_holiday("Test Holiday", self.SUNDAY)
+        self.ohb._add_holiday("Test Holiday", self.MONDAY)
+        self.assertEqual(self.ohb._get_next_workday(self.SUNDAY), date(2024, 5, 14))
+        self.assertEqual(self.ohb._get_next_workday(self.MONDAY, -1), date(2024, 5, 10))
+
+        # Year boundary.
+        self.assertEqual(self.ohb._get_next_workday(date(2024, 12, 31)), date(2024, 12, 31))
+
+    def test_observed_labels(self):
+        self.ohb._add_holiday("Test Holiday", self.SUNDAY)
+        self.ohb._add_observed(self.SUNDAY, rule=SUN_TO_NEXT_WORKDAY)
+        self.assertEqual(self.ohb[self.MONDAY], "Test Holiday (Observed Label)")
+        self.assertEqual(
+            self.ohb._observed_labels,
+            ("%s (Observed Label)", "%s (Observed Label)", "%s (Observed Label)", ""),
+        )
+
+    def test_special_holidays_mapping_names(self):
+        self.assertEqual(
+            list(self.ohb._get_special_holidays_mapping_names("sd")),
+            [
+                ("special_sd_public_holidays", False),
+                ("special_sd_public_holidays_observed", True),
+            ],
+        )
+
+        self.ohb.observed = False
+        self.assertEqual(
+            list(self.ohb._get_special_holidays_mapping_names()),
+            [("special_public_holidays", False)],
+        )
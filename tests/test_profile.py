@@ -0,0 +1,130 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from holidays.calendars import _IslamicLunar
+from holidays.countries import Malaysia, UnitedStates
+from holidays.holiday_base import HolidayBase, _population_cache
+from holidays.observed_holiday_base import ObservedHolidayBase
+from holidays.profile import MethodStats, PopulateProfiler, main
+from holidays.utils import country_holidays_bundle
+
+
+class TestPopulateProfiler(unittest.TestCase):
+    def setUp(self):
+        _population_cache.clear()
+
+    def test_stats(self):
+        with PopulateProfiler((UnitedStates,)) as profiler:
+            us_holidays = UnitedStates(years=range(2020, 2025))
+
+        _population_cache.clear()
+        self.assertEqual(us_holidays, UnitedStates(years=range(2020, 2025)))
+
+        stats = profiler.stats
+        self.assertEqual(stats[("US", None, "HolidayBase._populate")].calls, 5)
+        self.assertEqual(
+            stats[("US", "public", "UnitedStates._populate_public_holidays")].calls, 5
+        )
+        self.assertGreater(stats[("US", "public", "HolidayBase._add_holiday")].calls, 40)
+        self.assertGreater(stats[("US", "public", "ObservedHolidayBase._add_observed")].calls, 0)
+        for method_stats in stats.values():
+            self.assertIsInstance(method_stats, MethodStats)
+            self.assertLessEqual(method_stats.own_time, method_stats.total_time)
+        self.assertAlmostEqual(
+            sum(method_stats.own_time for method_stats in stats.values()),
+            profiler.totals["US"],
+        )
+
+        profiler.reset()
+        self.assertEqual(profiler.stats, {})
+        self.assertEqual(profiler.totals, {})
+
+    def test_calendar_lookups(self):
+        with PopulateProfiler((Malaysia,)) as profiler:
+            Malaysia(years=2024)
+
+        stats = profiler.stats
+        self.assertEqual(stats[("MY", "public", "_IslamicLunar.eid_al_fitr_dates")].calls, 2)
+        self.assertGreater(stats[("MY", "public", "_IslamicLunar._get_holiday")].calls, 0)
+
+    def test_restore(self):
+        methods = (
+            HolidayBase.__dict__["_add_holiday"],
+            ObservedHolidayBase.__dict__["_add_observed"],
+            UnitedStates.__dict__["_populate_public_holidays"],
+            _IslamicLunar.__dict__["eid_al_fitr_dates"],
+        )
+        with PopulateProfiler() as profiler:
+            self.assertIsNot(HolidayBase.__dict__["_add_holiday"], methods[0])
+            self.assertRaises(RuntimeError, profiler.__enter__)
+            # The population plan resolved while profiling.
+            us_holidays = UnitedStates(years=2020)
+
+        self.assertEqual(
+            (
+                HolidayBase.__dict__["_add_holiday"],
+                ObservedHolidayBase.__dict__["_add_observed"],
+                UnitedStates.__dict__["_populate_public_holidays"],
+                _IslamicLunar.__dict__["eid_al_fitr_dates"],
+            ),
+            methods,
+        )
+        # The existing population plans use the restored methods.
+        self.assertIs(
+            getattr(us_holidays, us_holidays._get_population_plan().method_names[0]).__func__,
+            methods[2],
+        )
+        stats = profiler.stats
+        us_holidays._add_year(2021)
+        self.assertEqual(profiler.stats, stats)
+
+    def test_subdivisions(self):
+        with PopulateProfiler((UnitedStates,)) as profiler:
+            profiled_holidays = country_holidays_bundle("US", years=2024)
+
+        _population_cache.clear()
+        self.assertEqual(profiled_holidays, country_holidays_bundle("US", years=2024))
+        key = ("US", "public", "UnitedStates._populate_subdiv_ca_public_holidays")
+        self.assertEqual(profiler.stats[key].calls, 1)
+
+    def test_callback(self):
+        calls = []
+        with PopulateProfiler(
+            (UnitedStates,), callback=lambda *args: calls.append(args[:3])
+        ) as profiler:
+            UnitedStates(years=2024)
+
+        self.assertEqual(len(calls), sum(stats.calls for stats in profiler.stats.values()))
+        self.assertEqual(calls[-1], ("US", None, "HolidayBase._populate"))
+
+    def test_report(self):
+        with PopulateProfiler((UnitedStates,)) as profiler:
+            UnitedStates(years=2024)
+
+        report = profiler.report(limit=3, sort_by="calls").splitlines()
+        self.assertEqual(len(report), 7)
+        self.assertTrue(report[1].startswith("US"))
+        self.assertIn("HolidayBase._add_holiday", report[4])
+        self.assertRaises(ValueError, lambda: profiler.report(sort_by="name"))
+
+    def test_main(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(main(["US", "NYSE", "--years", "2020-2024", "--limit", "5"]), 0)
+
+        lines = output.getvalue().splitlines()
+        self.assertEqual({lines[1].split()[0], lines[2].split()[0]}, {"US", "NYSE"})
+        self.assertTrue(lines[-1].startswith("Populated 2 entities for 5 years"))
@@ -0,0 +1,110 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import unittest
+from datetime import date
+
+from holidays.business_days import FOLLOWING, BusinessCalendar
+from holidays.calendars.gregorian import FRI, WED
+from holidays.financial import NewYorkStockExchange
+from holidays.schedules import (
+    QUARTERLY_MONTHS,
+    ScheduleRule,
+    generate_schedule,
+    generate_schedules,
+)
+
+
+class TestSchedules(unittest.TestCase):
+    def setUp(self):
+        self.calendar = BusinessCalendar(NewYorkStockExchange())
+
+    def test_third_friday(self):
+        self.assertEqual(
+            generate_schedule(self.calendar, ScheduleRule(3, FRI), "2022-01-01", "2022-06-30"),
+            [
+                date(2022, 1, 21),
+                date(2022, 2, 18),
+                date(2022, 3, 18),
+                # Good Friday.
+                date(2022, 4, 14),
+                date(2022, 5, 20),
+                date(2022, 6, 17),
+            ],
+        )
+
+    def test_last_business_day_of_quarter(self):
+        self.assertEqual(
+            generate_schedule(
+                NewYorkStockExchange(),
+                ScheduleRule(-1, months=QUARTERLY_MONTHS),
+                "2023-01-01",
+                "2024-12-31",
+            ),
+            [
+                date(2023, 3, 31),
+                date(2023, 6, 30),
+                date(2023, 9, 29),
+                date(2023, 12, 29),
+                date(2024, 3, 28),
+                date(2024, 6, 28),
+                date(2024, 9, 30),
+                date(2024, 12, 31),
+            ],
+        )
+
+    def test_business_days_offset(self):
+        # The offset is counted from the anchor date even if it's a holiday
+        # (Juneteenth 2024).
+        self.assertEqual(
+            generate_schedule(
+                self.calendar, ScheduleRule(3, WED, offset=-2), "2024-05-01", "2024-07-31"
+            ),
+            [date(2024, 5, 13), date(2024, 6, 17), date(2024, 7, 15)],
+        )
+
+    def test_month_day(self):
+        rule = ScheduleRule(15, roll=FOLLOWING)
+        self.assertEqual(
+            generate_schedule(self.calendar, rule, "2024-06-01", "2024-09-30"),
+            [date(2024, 6, 17), date(2024, 7, 15), date(2024, 8, 15), date(2024, 9, 16)],
+        )
+        self.assertRaises(
+            ValueError,
+            lambda: generate_schedule(self.calendar, ScheduleRule(31), "2024-01-01", "2024-12-31"),
+        )
+        self.assertRaises(
+            ValueError,
+            lambda: generate_schedule(
+                self.calendar, ScheduleRule(5, FRI), "2024-01-01", "2024-12-31"
+            ),
+        )
+
+    def test_range(self):
+        # The adjusted dates are filtered by the range, not the anchor dates.
+        rule = ScheduleRule(1, roll=FOLLOWING)
+        self.assertEqual(
+            generate_schedule(self.calendar, rule, "2024-06-02", "2024-07-01"),
+            [date(2024, 6, 3), date(2024, 7, 1)],
+        )
+        self.assertEqual(generate_schedule(self.calendar, rule, "2024-06-04", "2024-06-30"), [])
+
+    def test_generate_schedules(self):
+        rules = {
+            "monthly": ScheduleRule(3, FRI),
+            "quarterly": ScheduleRule(3, FRI, months=QUARTERLY_MONTHS),
+        }
+        schedules = generate_schedules(self.calendar, rules, "2020-01-01", "2029-12-31")
+        self.assertEqual(list(schedules), ["monthly", "quarterly"])
+        self.assertEqual(len(schedules["monthly"]), 120)
+        self.assertEqual(len(schedules["quarterly"]), 40)
+        self.assertTrue(set(schedules["quarterly"]).issubset(schedules["monthly"]))
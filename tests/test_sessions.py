@@ -0,0 +1,150 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import unittest
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo
+
+from holidays.financial import NewYorkStockExchange
+from holidays.sessions import (
+    EuropeanCentralBankSessions,
+    ICEFuturesEuropeSessions,
+    NewYorkStockExchangeSessions,
+    Session,
+    market_sessions,
+)
+
+NEW_YORK = ZoneInfo("America/New_York")
+
+
+class TestMarketSessions(unittest.TestCase):
+    def setUp(self):
+        self.sessions = market_sessions("NYSE")
+
+    def test_market_sessions(self):
+        self.assertIsInstance(market_sessions("XNYS"), NewYorkStockExchangeSessions)
+        self.assertIsInstance(market_sessions("TAR"), EuropeanCentralBankSessions)
+        self.assertIsInstance(market_sessions("IFEU"), ICEFuturesEuropeSessions)
+        self.assertRaises(NotImplementedError, lambda: market_sessions("XXXX"))
+
+        holidays = NewYorkStockExchange(years=2024)
+        self.assertIs(market_sessions("NYSE", holidays).holidays, holidays)
+
+        class UnknownTimeZoneSessions(NewYorkStockExchangeSessions):
+            timezone = "Unknown/Zone"
+
+        self.assertRaises(ValueError, UnknownTimeZoneSessions)
+
+    def test_get_session(self):
+        self.assertEqual(
+            self.sessions.get_session("2024-07-02"),
+            Session(
+                date(2024, 7, 2),
+                datetime(2024, 7, 2, 9, 30, tzinfo=NEW_YORK),
+                datetime(2024, 7, 2, 16, tzinfo=NEW_YORK),
+                False,
+            ),
+        )
+        for dt in ("2024-07-04", "2024-07-06", "2024-12-25"):
+            self.assertIsNone(self.sessions.get_session(dt))
+
+    def test_early_closes(self):
+        for dt in ("2019-07-03", "2023-07-03", "2023-11-24", "2024-12-24"):
+            session = self.sessions.get_session(dt)
+            self.assertTrue(session.early_close, dt)
+            self.assertEqual(session.close.hour, 13)
+
+        # Not trading days or before 1993.
+        for dt in ("2020-07-03", "2021-12-24", "1992-12-24"):
+            session = self.sessions.get_session(dt)
+            self.assertFalse(session and session.early_close, dt)
+
+        self.assertEqual(
+            [
+                session.date
+                for session in self.sessions.sessions_between("2024-01-01", "2024-12-31")
+                if session.early_close
+            ],
+            [date(2024, 7, 3), date(2024, 11, 29), date(2024, 12, 24)],
+        )
+
+    def test_is_open(self):
+        self.assertTrue(self.sessions.is_open(datetime(2024, 7, 2, 9, 30)))
+        self.assertTrue(self.sessions.is_open(datetime(2024, 7, 2, 15, 59)))
+        self.assertFalse(self.sessions.is_open(datetime(2024, 7, 2, 16)))
+        self.assertFalse(self.sessions.is_open(datetime(2024, 7, 2, 9, 29)))
+        self.assertFalse(self.sessions.is_open(datetime(2024, 7, 3, 13, 30)))
+        self.assertFalse(self.sessions.is_open(datetime(2024, 7, 4, 12)))
+        # Time zone aware datetimes.
+        self.assertTrue(self.sessions.is_open(datetime(2024, 7, 2, 14, tzinfo=timezone.utc)))
+        self.assertFalse(self.sessions.is_open(datetime(2024, 7, 2, 13, tzinfo=timezone.utc)))
+
+    def test_next_open_close(self):
+        self.assertEqual(
+            self.sessions.next_open(datetime(2024, 7, 2, 9)),
+            datetime(2024, 7, 2, 9, 30, tzinfo=NEW_YORK),
+        )
+        self.assertEqual(
+            self.sessions.next_open(datetime(2024, 7, 2, 9, 30)),
+            datetime(2024, 7, 3, 9, 30, tzinfo=NEW_YORK),
+        )
+        self.assertEqual(
+            self.sessions.next_open(datetime(2024, 12, 31, 16)),
+            datetime(2025, 1, 2, 9, 30, tzinfo=NEW_YORK),
+        )
+        self.assertEqual(
+            self.sessions.next_close(datetime(2024, 7, 3, 10)),
+            datetime(2024, 7, 3, 13, tzinfo=NEW_YORK),
+        )
+        self.assertEqual(
+            self.sessions.next_close(datetime(2024, 7, 3, 13)),
+            datetime(2024, 7, 5, 16, tzinfo=NEW_YORK),
+        )
+
+    def test_sessions_between(self):
+        sessions = self.sessions.sessions_between("2024-12-20", "2025-01-03")
+        self.assertEqual(
+            [session.date.day for session in sessions], [20, 23, 24, 26, 27, 30, 31, 2, 3]
+        )
+        self.assertEqual(len(self.sessions.sessions_between("2024-01-01", "2024-12-31")), 252)
+        self.assertEqual(self.sessions.sessions_between("2024-07-04", "2024-07-04"), [])
+
+    def test_trading_minutes(self):
+        self.assertEqual(
+            self.sessions.trading_minutes(datetime(2024, 7, 2, 10), datetime(2024, 7, 2, 11)), 60
+        )
+        self.assertEqual(
+            self.sessions.trading_minutes(datetime(2024, 7, 2, 15), datetime(2024, 7, 5, 10)),
+            60 + 210 + 30,
+        )
+        self.assertEqual(
+            self.sessions.trading_minutes(datetime(2024, 7, 5, 10), datetime(2024, 7, 2, 15)),
+            -300,
+        )
+        self.assertEqual(
+            self.sessions.trading_minutes(datetime(2023, 1, 1), datetime(2025, 1, 1)),
+            (250 + 252) * 390 - (2 + 3) * 180,
+        )
+
+    def test_other_markets(self):
+        ecb_sessions = market_sessions("ECB")
+        self.assertIsNone(ecb_sessions.early_close_time)
+        self.assertIsNone(ecb_sessions.get_session("2024-05-01"))
+        self.assertTrue(ecb_sessions.is_open(datetime(2024, 5, 2, 7)))
+        self.assertFalse(ecb_sessions.is_open(datetime(2024, 5, 2, 18)))
+
+        ifeu_sessions = market_sessions("IFEU")
+        self.assertIsNone(ifeu_sessions.get_session("2024-12-25"))
+        self.assertEqual(
+            ifeu_sessions.next_open(datetime(2024, 12, 24, 23)),
+            datetime(2024, 12, 26, 1, tzinfo=ZoneInfo("Europe/London")),
+        )
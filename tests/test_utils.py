@@ -22,6 +22,7 @@ import holidays
 from holidays.utils import (
     CountryHoliday,
     country_holidays,
+    country_holidays_bundle,
     financial_holidays,
     list_localized_countries,
     list_localized_financial,
@@ -59,6 +60,24 @@ class TestCountryHolidays(unittest.TestCase):
         self.assertRaises(NotImplementedError, lambda: country_holidays("US", subdiv="XXXX"))
         self.assertRaises(NotImplementedError, lambda: country_holidays("US", subdiv="XXXX"))
 
+    def test_frozen(self):
+        h = country_holidays("US", subdiv="CA", years=2024, frozen=True)
+        self.assertIsInstance(h, holidays.FrozenHolidays)
+        self.assertEqual(h.years, {2024})
+        self.assertEqual(h.get("2024-03-31"), "Cesar Chavez Day")
+
+        # Flyweight: the same parameters share the same object.
+        self.assertIs(h, country_holidays("US", subdiv="CA", years=[2024], frozen=True))
+        self.assertIsNot(h, country_holidays("US", subdiv="CA", years=2025, frozen=True))
+        self.assertIsNot(
+            h, country_holidays("US", subdiv="CA", years=2024, observed=False, frozen=True)
+        )
+        self.assertIsNot(
+            h, country_holidays("US", subdiv="CA", years=2024, language="en_US", frozen=True)
+        )
+
+        self.assertRaises(ValueError, lambda: country_holidays("US", frozen=True))
+
     def test_country_holiday_class_deprecation(self):
         with warnings.catch_warnings(record=True) as ctx:
             warnings.simplefilter("always")
@@ -68,6 +87,42 @@ class TestCountryHolidays(unittest.TestCase):
             self.assertIn("CountryHoliday is deprecated", str(warning.message))
 
 
+class TestCountryHolidaysBundle(unittest.TestCase):
+    def test_all_subdivisions(self):
+        for code, categories in (("US", None), ("ES", None), ("CH", None), ("US", "unofficial")):
+            bundle = country_holidays_bundle(code, years=range(2015, 2026), categories=categories)
+            self.assertEqual(tuple(bundle), getattr(holidays, code).subdivisions)
+            for subdiv, h in bundle.items():
+                self.assertEqual(h.subdiv, subdiv)
+                self.assertEqual(h.years, set(range(2015, 2026)))
+                self.assertEqual(
+                    dict(h),
+                    dict(
+                        country_holidays(
+                            code, subdiv=subdiv, years=range(2015, 2026), categories=categories
+                        )
+                    ),
+                )
+
+    def test_subdivisions(self):
+        bundle = country_holidays_bundle("US", subdivs=("CA", "TX"), years=2024, observed=False)
+        self.assertEqual(tuple(bundle), ("CA", "TX"))
+        self.assertIn("2024-03-31", bundle["CA"])
+        self.assertNotIn("2024-03-02", bundle["CA"])
+        self.assertIn("2024-03-02", bundle["TX"])
+        self.assertFalse(bundle["TX"].observed)
+
+        # Expansion works as usual.
+        self.assertIn("2025-03-31", bundle["CA"])
+        self.assertEqual(bundle["CA"].years, {2024, 2025})
+
+    def test_exceptions(self):
+        self.assertRaises(NotImplementedError, lambda: country_holidays_bundle("XXXX"))
+        self.assertRaises(
+            NotImplementedError, lambda: country_holidays_bundle("US", subdivs=("XXXX",))
+        )
+
+
 class TestFinancialHolidays(unittest.TestCase):
     def setUp(self):
         self.holidays = financial_holidays("NYSE")
@@ -83,6 +138,12 @@ class TestFinancialHolidays(unittest.TestCase):
         h = financial_holidays("NYSE", years=(2015, 2016))
         self.assertEqual(h.years, {2015, 2016})
 
+    def test_frozen(self):
+        h = financial_holidays("NYSE", years=2024, frozen=True)
+        self.assertIsInstance(h, holidays.FrozenHolidays)
+        self.assertEqual(h.market, "NYSE")
+        self.assertIs(h, financial_holidays("NYSE", years=2024, frozen=True))
+
     def test_exceptions(self):
         self.assertRaises(NotImplementedError, lambda: financial_holidays("XXXX"))
         self.assertRaises(NotImplementedError, lambda: financial_holidays("NYSE", subdiv="XXXX"))
@@ -10,11 +10,38 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
+import warnings
+from datetime import date
+from datetime import timedelta as td
 from unittest import TestCase
 
+from holidays.business_days import (
+    END_OF_MONTH,
+    FOLLOWING,
+    MODIFIED_FOLLOWING,
+    MODIFIED_PRECEDING,
+    PRECEDING,
+    BusinessCalendar,
+)
+from holidays.calendars.gregorian import (
+    FRI,
+    WED,
+    _get_nth_weekday_of_month,
+    _get_nth_weekdays_of_months,
+)
+from holidays.countries.brazil import Brazil
 from holidays.countries.cambodia import Cambodia
+from holidays.countries.china import China
+from holidays.countries.israel import Israel
 from holidays.countries.thailand import Thailand
 from holidays.countries.ukraine import Ukraine
+from holidays.countries.united_arab_emirates import UnitedArabEmirates
+from holidays.countries.united_states import UnitedStates
+from holidays.day_count import ACT_360, BUS_252, DayCounter
+from holidays.features import FEATURES, get_holiday_features
+from holidays.financial.ny_stock_exchange import NewYorkStockExchange
+from holidays.long_weekends import find_bridge_days, find_long_weekends
+from holidays.schedules import QUARTERLY_MONTHS, ScheduleRule, generate_schedules
 
 
 class TestNumpy(TestCase):
@@ -31,3 +58,248 @@ class TestNumpy(TestCase):
 
             # Test iterable.
             self.assertEqual(cls(years=np.arange(*years)).years, years_range)
+
+    def test_business_days(self):
+        import numpy as np
+
+        calendar = BusinessCalendar(NewYorkStockExchange(), Ukraine())
+        dates = np.arange("2020-01-01", "2025-01-01", dtype="datetime64[D]")
+        for n in (-40, -1, 1, 2, 250):
+            result = calendar.get_nth_working_days(dates, n)
+            self.assertEqual(result.dtype, np.dtype("datetime64[D]"))
+            self.assertEqual(result.tolist(), calendar.get_nth_working_days(dates.tolist(), n))
+
+        dates = np.array(["2024-12-23T10:30", "2024-12-31T23:59"], dtype="datetime64[m]")
+        self.assertEqual(
+            calendar.get_nth_working_days(dates, 2).tolist(),
+            [date(2024, 12, 26), date(2025, 1, 3)],
+        )
+        self.assertEqual(
+            calendar.get_nth_working_days(dates, 0).tolist(),
+            [date(2024, 12, 23), date(2024, 12, 31)],
+        )
+        self.assertEqual(calendar.get_nth_working_days(dates[:0], 1).size, 0)
+
+    def test_business_days_roll(self):
+        import numpy as np
+
+        calendar = BusinessCalendar(NewYorkStockExchange(), Ukraine())
+        dates = np.arange("2015-01-01", "2025-01-01", dtype="datetime64[D]")
+        for convention in (
+            END_OF_MONTH,
+            FOLLOWING,
+            MODIFIED_FOLLOWING,
+            MODIFIED_PRECEDING,
+            PRECEDING,
+        ):
+            result = calendar.roll_dates(dates, convention)
+            self.assertEqual(result.dtype, np.dtype("datetime64[D]"))
+            self.assertEqual(result.tolist(), calendar.roll_dates(dates.tolist(), convention))
+
+        self.assertEqual(calendar.roll_dates(dates[:0], FOLLOWING).size, 0)
+        self.assertRaises(ValueError, lambda: calendar.roll_dates(dates, "nearest"))
+
+    def test_business_days_counts(self):
+        import numpy as np
+
+        calendar = BusinessCalendar(NewYorkStockExchange(), Ukraine())
+        rng = np.random.default_rng(2024)
+        starts = np.datetime64("2010-01-01") + rng.integers(0, 5000, 500).astype("timedelta64[D]")
+        ends = starts + rng.integers(-1000, 1000, 500).astype("timedelta64[D]")
+        result = calendar.get_working_days_counts(starts, ends)
+        self.assertEqual(
+            result.tolist(), calendar.get_working_days_counts(starts.tolist(), ends.tolist())
+        )
+        self.assertEqual(calendar.get_working_days_counts(starts[:0], ends[:0]).size, 0)
+
+    def test_day_count(self):
+        import numpy as np
+
+        rng = np.random.default_rng(2024)
+        starts = np.datetime64("2010-01-01") + rng.integers(0, 5000, 500).astype("timedelta64[D]")
+        ends = starts + rng.integers(-1000, 1000, 500).astype("timedelta64[D]")
+        for day_counter in (DayCounter(BUS_252, Brazil()), DayCounter(ACT_360)):
+            day_counts = day_counter.day_counts(starts, ends)
+            self.assertEqual(
+                day_counts.tolist(), day_counter.day_counts(starts.tolist(), ends.tolist())
+            )
+            self.assertEqual(
+                day_counter.year_fractions(starts, ends).tolist(),
+                day_counter.year_fractions(starts.tolist(), ends.tolist()),
+            )
+
+    def test_get_nth_weekdays_of_months(self):
+        import numpy as np
+
+        months = np.arange("2000-01", "2030-01", dtype="datetime64[M]")
+        for n in (1, 2, 4, -1, -3):
+            for weekday in range(7):
+                self.assertEqual(
+                    _get_nth_weekdays_of_months(n, weekday, months).tolist(),
+                    [
+                        _get_nth_weekday_of_month(n, weekday, dt.month, dt.year)
+                        for dt in months.astype("datetime64[D]").tolist()
+                    ],
+                )
+        self.assertRaises(ValueError, lambda: _get_nth_weekdays_of_months(5, FRI, months))
+
+    def test_schedules(self):
+        import numpy as np
+
+        rules = {
+            "3rd Fri": ScheduleRule(3, FRI),
+            "last bd of quarter": ScheduleRule(-1, months=QUARTERLY_MONTHS),
+            "2 bd before 3rd Wed": ScheduleRule(3, WED, offset=-2),
+            "1st": ScheduleRule(1),
+            "15th": ScheduleRule(15, offset=1),
+        }
+        calendar = BusinessCalendar(NewYorkStockExchange())
+        schedules = generate_schedules(calendar, rules, "2000-01-15", "2029-12-15")
+        arrays = generate_schedules(calendar, rules, "2000-01-15", "2029-12-15", as_array=True)
+        for name in rules:
+            self.assertEqual(arrays[name].dtype, np.dtype("datetime64[D]"))
+            self.assertEqual(arrays[name].tolist(), schedules[name])
+
+    def test_to_busdaycalendar(self):
+        import numpy as np
+
+        us_holidays = UnitedStates()
+        calendar = us_holidays.to_busdaycalendar("2024-12-31", "2020-01-01")
+        self.assertEqual(calendar.weekmask.tolist(), [True] * 5 + [False] * 2)
+        self.assertEqual(
+            calendar.holidays.tolist(),
+            # NumPy drops the weekend holidays.
+            sorted(dt for dt in us_holidays if 2020 <= dt.year <= 2024 and dt.weekday() < 5),
+        )
+        self.assertEqual(
+            np.busday_count("2020-01-01", "2025-01-01", busdaycal=calendar),
+            us_holidays.get_working_days_count("2020-01-01", "2024-12-31"),
+        )
+        self.assertEqual(
+            np.busday_offset("2024-07-03", 1, roll="forward", busdaycal=calendar),
+            np.datetime64(us_holidays.get_nth_working_day("2024-07-03", 1)),
+        )
+
+        self.assertEqual(
+            Israel().to_busdaycalendar("2024-01-01", "2024-12-31").weekmask.tolist(),
+            [True, True, True, True, False, False, True],
+        )
+        ae_holidays = UnitedArabEmirates()
+        self.assertEqual(
+            ae_holidays.to_busdaycalendar("2021-01-01", "2021-12-31").weekmask.tolist(),
+            [True, True, True, True, False, False, True],
+        )
+        self.assertEqual(
+            ae_holidays.to_busdaycalendar("2022-01-01", "2022-12-31").weekmask.tolist(),
+            [True] * 5 + [False] * 2,
+        )
+
+    def test_to_busdaycalendar_unrepresentable(self):
+        # The weekend change.
+        self.assertRaises(
+            ValueError,
+            lambda: UnitedArabEmirates().to_busdaycalendar("2021-12-01", "2022-01-31"),
+        )
+
+        # The weekend working days.
+        cn_holidays = China()
+        self.assertRaises(
+            ValueError, lambda: cn_holidays.to_busdaycalendar("2024-01-01", "2024-12-31")
+        )
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter("always")
+            calendar = cn_holidays.to_busdaycalendar("2024-01-01", "2024-12-31", strict=False)
+        self.assertEqual(len(caught_warnings), 1)
+        self.assertIn("2024-02-04", str(caught_warnings[0].message))
+        self.assertEqual(
+            calendar.holidays.tolist(),
+            sorted(dt for dt in cn_holidays if dt.year == 2024 and dt.weekday() < 5),
+        )
+
+        # No weekend working days within the range.
+        self.assertEqual(
+            cn_holidays.to_busdaycalendar("2024-03-01", "2024-03-31").holidays.size, 0
+        )
+
+    def test_holiday_features(self):
+        import numpy as np
+
+        dates = np.array(
+            ["2024-05-24", "2024-05-25", "2024-05-27", "2024-06-01", "2024-07-03", "2024-07-05"],
+            dtype="datetime64[D]",
+        )
+        features = get_holiday_features(UnitedStates(), dates)
+        self.assertEqual(tuple(features), FEATURES)
+        self.assertEqual(
+            features["is_holiday"].tolist(), [False, False, True, False, False, False]
+        )
+        self.assertEqual(features["days_to_next_holiday"].tolist(), [3, 2, 0, 18, 1, 59])
+        self.assertEqual(features["days_since_last_holiday"].tolist(), [95, 96, 0, 5, 14, 1])
+        self.assertEqual(
+            features["next_holiday"].tolist(),
+            [
+                "Memorial Day",
+                "Memorial Day",
+                "Memorial Day",
+                "Juneteenth National Independence Day",
+                "Independence Day",
+                "Labor Day",
+            ],
+        )
+        # Independence Day (Thursday) bridge day.
+        self.assertEqual(
+            features["is_bridge_day"].tolist(), [False, False, False, False, False, True]
+        )
+        # Memorial Day (Monday) long weekend.
+        self.assertEqual(
+            features["is_long_weekend"].tolist(), [False, True, True, False, False, False]
+        )
+
+        # The iterables, the structured array and no dates.
+        records = get_holiday_features(UnitedStates(), ["2024-07-05"], structured=True)
+        self.assertEqual(records.dtype.names, FEATURES)
+        self.assertEqual(records["next_holiday"][0], "Labor Day")
+        self.assertTrue(records["is_bridge_day"][0])
+        features = get_holiday_features(UnitedStates(), np.array([], dtype="datetime64[D]"))
+        self.assertEqual(features["days_to_next_holiday"].dtype, np.int64)
+        self.assertEqual(features["is_holiday"].size, 0)
+
+    def test_holiday_features_long_weekends(self):
+        import numpy as np
+
+        # The features agree with the long weekends and bridge days detection.
+        for holidays in (UnitedStates(), Israel(), China()):
+            dates = np.arange("2024-01-01", "2025-01-01", dtype="datetime64[D]")
+            features = get_holiday_features(holidays, dates)
+            self.assertEqual(
+                dates[features["is_long_weekend"]].astype(date).tolist(),
+                [
+                    lw.start + td(days=delta)
+                    for lw in find_long_weekends(holidays, (2023, 2024))
+                    for delta in range(lw.days)
+                    if (lw.start + td(days=delta)).year == 2024
+                ],
+            )
+            self.assertEqual(
+                dates[features["is_bridge_day"]].astype(date).tolist(),
+                [bd.date for bd in find_bridge_days(holidays, 2024)],
+            )
+
+    def test_holiday_features_multiple_calendars(self):
+        import numpy as np
+
+        calendars = {"CN": China(), "US": UnitedStates()}
+        dates = np.array(["2024-02-17", "2024-02-18", "2024-02-17"], dtype="datetime64[D]")
+        keys = np.array(["CN", "CN", "US"])
+        features = get_holiday_features(calendars, dates, keys)
+        # The Spring Festival day off and 2024-02-18 (Sunday) make-up working day.
+        self.assertEqual(features["is_holiday"].tolist(), [False, False, False])
+        self.assertEqual(features["is_long_weekend"].tolist(), [True, False, True])
+        self.assertEqual(features["days_to_next_holiday"].tolist(), [47, 46, 2])
+        self.assertEqual(features["next_holiday"][2], "Washington's Birthday")
+
+        self.assertRaises(ValueError, lambda: get_holiday_features(calendars, dates))
+        self.assertRaises(ValueError, lambda: get_holiday_features(calendars, dates, keys[:2]))
+        self.assertRaises(
+            KeyError, lambda: get_holiday_features(calendars, dates, ["CN", "CN", "GB"])
+        )